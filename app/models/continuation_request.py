@@ -0,0 +1,5 @@
+from pydantic import BaseModel
+
+
+class ContinuationRequest(BaseModel):
+    continuation_token: str
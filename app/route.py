@@ -1,12 +1,41 @@
-from fastapi import FastAPI
-from starlette.responses import JSONResponse
+import json
+from contextlib import asynccontextmanager
 
+from fastapi import FastAPI, Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+
+from app import settings
+from app.models.continuation_request import ContinuationRequest
 from app.models.request_code import RequestCode
-from app.visualize.code_visualizer import CodeVisualizer
+from app.visualize.executor.executor_provider import get_visualize_executor, shutdown_visualize_executor
 from app.web import exception_handler
+from app.web.admission_controller import AdmissionController
 from app.web.logger import log_request
+from app.web.result_cache import ResultCache
+from app.web.single_flight import SingleFlight
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 첫 요청 전에 worker 프로세스를 미리 띄움
+    get_visualize_executor()
+    app.state.admission_controller = AdmissionController(
+        max_concurrency=settings.MAX_CONCURRENT_VISUALIZE,
+        max_queue_size=settings.MAX_QUEUED_VISUALIZE,
+        queue_timeout_seconds=settings.QUEUE_TIMEOUT_SECONDS,
+        retry_after_seconds=settings.RETRY_AFTER_SECONDS,
+    )
+    app.state.result_cache = ResultCache(
+        max_bytes=settings.RESULT_CACHE_MAX_MB * 1024 * 1024, ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS
+    )
+    app.state.single_flight = SingleFlight()
+    yield
+    # 서버 종료 시 worker 프로세스 정리
+    app.state.admission_controller.shutdown()
+    shutdown_visualize_executor()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 # 미들웨어 등록
 app.middleware("http")(log_request)
@@ -21,9 +50,76 @@ def root():
     return JSONResponse(status_code=200, content="ok")
 
 
+@app.get("/edupi-visualize/status")
+async def status(request: Request):
+    # 실행 중인 요청 수, 대기열 길이와 결과 캐시 사용량
+    return {
+        "result": {
+            "admission": request.app.state.admission_controller.get_stats(),
+            "cache": request.app.state.result_cache.get_stats(),
+            "single_flight": request.app.state.single_flight.get_stats(),
+        }
+    }
+
+
 @app.post("/edupi-visualize/v1/python")
-def read_root(request_code: RequestCode):
-    # 코드 분석 인스턴스 생성
-    code_analyzer = CodeVisualizer(request_code)
+async def read_root(request_code: RequestCode, request: Request):
+    # 같은 코드와 입력의 시각화 결과가 캐시에 있으면 다시 분석하지 않음
+    result_cache = request.app.state.result_cache
+    cache_key = ResultCache.make_key(request_code)
+    body = result_cache.get(cache_key)
+
+    if body is None:
+        # 같은 코드와 입력으로 동시에 들어온 요청은 한 번만 분석하고 결과를 함께 받음
+        body = await request.app.state.single_flight.run(
+            cache_key, _visualize_to_body, request, request_code, cache_key
+        )
+
+    return Response(content=body, media_type="application/json")
+
+
+async def _visualize_to_body(request: Request, request_code: RequestCode, cache_key: str) -> bytes:
+    # 코드 시각화는 격리된 실행기에서 수행하고, 동시 실행 수를 넘는 요청은 대기열에서 기다림
+    result = await request.app.state.admission_controller.run(get_visualize_executor().run, request_code)
+    body = JSONResponse(content={"result": result}).body
+    # continuation token은 session이 만료되면 사용할 수 없으므로 캐시하지 않음
+    if "continuation_token" not in result:
+        request.app.state.result_cache.put(cache_key, body)
+
+    return body
+
+
+@app.post("/edupi-visualize/v1/python/continue")
+async def continue_visualize(continuation_request: ContinuationRequest, request: Request):
+    # 결과를 자른 응답의 continuation token으로 멈춘 곳부터 이어서 분석한 다음 시각화 단계를 반환
+    result = await request.app.state.admission_controller.run(
+        get_visualize_executor().resume, continuation_request.continuation_token
+    )
+
+    return JSONResponse(content={"result": result})
+
+
+@app.post("/edupi-visualize/v1/python/stream")
+async def stream_visualize(request_code: RequestCode, request: Request):
+    # 시각화 단계를 만들어지는 대로 한 줄에 하나씩(NDJSON) 전송
+    admission_controller = request.app.state.admission_controller
+    admission_controller.check_capacity()
+
+    return StreamingResponse(_stream_ndjson(admission_controller, request_code), media_type="application/x-ndjson")
+
+
+async def _stream_ndjson(admission_controller: AdmissionController, request_code: RequestCode):
+    try:
+        async for viz in admission_controller.stream(get_visualize_executor().stream, request_code):
+            yield _to_ndjson_line({"step": viz})
+
+    except Exception as e:
+        # 상태 코드는 이미 전송되었으므로 오류는 마지막 줄로 전달
+        yield _to_ndjson_line({"error": exception_handler.to_error_response(e).to_dict()})
+        return
+
+    yield _to_ndjson_line({"done": True})
+
 
-    return {"result": {"code": code_analyzer.visualize_code()}}
+def _to_ndjson_line(record: dict) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
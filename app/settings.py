@@ -0,0 +1,57 @@
+import os
+
+# 환경 변수로 변경할 수 있는 서버 설정 값
+
+# 코드 분석 제한
+MAX_VIZ_STEPS = int(os.getenv("EDUPI_MAX_VIZ_STEPS", "1000"))  # 한 요청에서 만들 수 있는 시각화 단계의 최대 개수
+ANALYSIS_TIMEOUT_SECONDS = float(os.getenv("EDUPI_ANALYSIS_TIMEOUT_SECONDS", "3"))  # 한 요청의 코드 분석 제한 시간
+MAX_WHILE_CYCLES = int(os.getenv("EDUPI_MAX_WHILE_CYCLES", "1000"))  # 한 요청에서 while문이 반복할 수 있는 최대 횟수
+# interpreter: 매번 AST를 분기하며 분석, compiled: expr node를 closure로 한 번 바꿔두고 실행
+# (compiled는 표현식만 closure로 바꾸고 문장은 interpreter와 같이 분석, benchmarks/engine_benchmark.py 기준 1.01~1.15배)
+# native: 코드를 실제 실행하며 줄마다 변수 값을 기록하고 표현식 단계만 AST로 분석 (실행할 수 없는 코드는 interpreter)
+ANALYSIS_ENGINE = os.getenv("EDUPI_ANALYSIS_ENGINE", "interpreter")
+# 시각화 단계 제한, 분석 제한 시간을 넘으면 오류 대신 제한까지의 단계와 멈춘 이유, 위치를 함께 반환 (truncated)
+TRUNCATE_AT_MAX_STEPS = os.getenv("EDUPI_TRUNCATE_AT_MAX_STEPS", "false").lower() == "true"
+
+# 이어 받기 : 시각화 단계 제한에서 자른 응답에 continuation token을 담고, token으로 다음 단계를 요청
+# 분석 상태는 실행기(worker)의 session에 보관하여 다음 요청에서 멈춘 곳부터 이어서 분석
+CONTINUATION_ENABLED = os.getenv("EDUPI_CONTINUATION_ENABLED", "false").lower() == "true"
+CONTINUATION_MAX_PAGES = int(os.getenv("EDUPI_CONTINUATION_MAX_PAGES", "10"))  # 한 코드에서 받을 수 있는 최대 page 수
+CONTINUATION_MAX_SESSIONS = int(os.getenv("EDUPI_CONTINUATION_MAX_SESSIONS", "32"))  # 실행기 하나의 최대 session 수
+CONTINUATION_SESSION_TTL_SECONDS = float(os.getenv("EDUPI_CONTINUATION_SESSION_TTL_SECONDS", "120"))  # 유효 시간
+
+# 분석 전 사전 실행 : 코드를 별도 프로세스에서 실제로 실행하여 시각화 단계 제한을 넘을 코드는 분석하지 않고 거절
+NATIVE_PREFLIGHT_ENABLED = os.getenv("EDUPI_NATIVE_PREFLIGHT_ENABLED", "false").lower() == "true"
+NATIVE_PREFLIGHT_TIMEOUT_SECONDS = float(os.getenv("EDUPI_NATIVE_PREFLIGHT_TIMEOUT_SECONDS", "1"))  # 프로세스 시작 포함
+NATIVE_PREFLIGHT_MEMORY_LIMIT_MB = int(os.getenv("EDUPI_NATIVE_PREFLIGHT_MEMORY_LIMIT_MB", "256"))
+
+# 코드 시각화 실행기
+# process: worker 프로세스 풀에서 실행, inline: 서버 프로세스에서 바로 실행
+VISUALIZE_BACKEND = os.getenv("EDUPI_VISUALIZE_BACKEND", "process")
+WORKER_COUNT = int(os.getenv("EDUPI_WORKER_COUNT", str(os.cpu_count() or 1)))  # worker 프로세스 개수
+WORKER_JOB_TIMEOUT_SECONDS = float(os.getenv("EDUPI_WORKER_JOB_TIMEOUT_SECONDS", "5"))  # 작업 하나의 제한 시간
+WORKER_MEMORY_LIMIT_MB = int(os.getenv("EDUPI_WORKER_MEMORY_LIMIT_MB", "512"))  # worker 프로세스의 메모리 제한
+WORKER_CPU_LIMIT_SECONDS = int(os.getenv("EDUPI_WORKER_CPU_LIMIT_SECONDS", "5"))  # 작업 하나의 CPU 시간 제한
+
+# 요청 수락 제어
+# 동시에 실행하는 요청 수와 실행을 기다릴 수 있는 요청 수
+MAX_CONCURRENT_VISUALIZE = int(os.getenv("EDUPI_MAX_CONCURRENT_VISUALIZE", str(WORKER_COUNT)))
+MAX_QUEUED_VISUALIZE = int(os.getenv("EDUPI_MAX_QUEUED_VISUALIZE", str(WORKER_COUNT * 4)))
+QUEUE_TIMEOUT_SECONDS = float(os.getenv("EDUPI_QUEUE_TIMEOUT_SECONDS", "3"))  # 대기열에서 기다릴 수 있는 최대 시간
+RETRY_AFTER_SECONDS = int(os.getenv("EDUPI_RETRY_AFTER_SECONDS", "2"))  # 요청 거절 시 Retry-After 헤더 값
+
+# 결과 캐시
+RESULT_CACHE_MAX_MB = int(os.getenv("EDUPI_RESULT_CACHE_MAX_MB", "64"))  # 캐시에 저장할 응답 body의 최대 크기 합
+RESULT_CACHE_TTL_SECONDS = float(os.getenv("EDUPI_RESULT_CACHE_TTL_SECONDS", "600"))  # 캐시된 응답의 유효 시간
+
+# 시각화 표현식에 표시하는 값의 크기 제한, 넘는 부분은 ...로 생략
+# list, tuple, dict 하나에서 표시할 최대 요소 수
+RENDER_MAX_ELEMENTS = int(os.getenv("EDUPI_RENDER_MAX_ELEMENTS", "100"))
+RENDER_MAX_LENGTH = int(os.getenv("EDUPI_RENDER_MAX_LENGTH", "2000"))  # 값 하나의 문자열 최대 길이
+RENDER_MAX_DEPTH = int(os.getenv("EDUPI_RENDER_MAX_DEPTH", "5"))  # 중첩된 list 등을 표시할 최대 깊이
+
+# 연산 한 번으로 만들 수 있는 값의 크기 제한, 넘는 연산은 계산하기 전에 거절
+# 정수 결과의 최대 bit 수, 10진수 문자열로 바꿀 수 있는 최대 자릿수(4300자리, 약 14284 bit)보다 작아야 함
+MAX_INT_RESULT_BITS = int(os.getenv("EDUPI_MAX_INT_RESULT_BITS", "14000"))
+# 문자열, list, tuple 결과의 최대 길이
+MAX_SEQUENCE_RESULT_LENGTH = int(os.getenv("EDUPI_MAX_SEQUENCE_RESULT_LENGTH", "1000000"))
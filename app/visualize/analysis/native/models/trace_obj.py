@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.web.exception.error_enum import ErrorEnum
+
+
+@dataclass(frozen=True, slots=True)
+class LineEvent:
+    lineno: int
+    local_variables: dict  # 줄을 실행하기 직전 frame의 지역 변수 (모듈이면 전역 변수)
+    global_variables: dict  # 함수 frame에서 사용하는 전역 변수 (모듈이면 빈 dict)
+
+    def get_variable(self, name) -> Any:
+        if name in self.local_variables:
+            return self.local_variables[name]
+
+        return self.global_variables.get(name)
+
+
+@dataclass(slots=True)
+class CallTrace:
+    func_name: str
+    events: list = field(default_factory=list)  # 실행 순서대로 LineEvent와 이 frame에서 호출한 함수의 CallTrace
+
+
+@dataclass(frozen=True, slots=True)
+class NativeTraceObj:
+    main_trace: CallTrace
+    error: Exception | None  # 학생 코드 실행 중 발생한 예외, 끝까지 실행했으면 None
+    stop_reason: ErrorEnum | None = None  # 결과를 자르는 경우 실행을 멈춘 제한, 끝까지 실행했으면 None
+    stop_lineno: int | None = None  # 제한에 걸려 실행하지 못한 줄
@@ -0,0 +1,76 @@
+import ast
+import json
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+from app.models.request_code import RequestCode
+from app.visualize.analysis.native import native_preflight_job
+from app.visualize.analysis.native.native_preflight_job import OVER_BUDGET, MEMORY_LIMIT
+from app.visualize.analysis.native.native_stmt_traveler import NativeStmtTraveler
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+# 사전 실행 프로세스에서 app 패키지를 import 할 수 있도록 실행할 위치
+_PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+
+# AST 분석 전에 코드를 별도 프로세스에서 실제로 실행하여, 시각화 단계 제한 안에 끝날 코드인지 미리 확인하는 클래스
+# 실행한 줄 수는 NativeTracer로 세고, 프로세스는 빈 환경 변수로 시작하여 메모리(RLIMIT_AS), CPU 시간(RLIMIT_CPU),
+# 파일 쓰기, 프로세스 생성을 제한하고 권한 없는 사용자로 바꾼 뒤 코드를 실행한다.
+# 학생 코드의 예외는 분석 단계에서 같은 예외가 발생하도록 통과시키고, 제한을 넘은 경우만 바로 거절한다.
+# 사전 실행 프로세스는 시작 비용을 줄이기 위해 tracer만 import하는 native_preflight_job 모듈을 실행한다.
+class NativePreflight:
+
+    def __init__(self, timeout_seconds: float, memory_limit_bytes: int):
+        self._timeout_seconds = timeout_seconds
+        self._memory_limit_bytes = memory_limit_bytes
+
+    def check(self, request_code: RequestCode, max_steps: int):
+        # 실행해도 안전한지 확인할 수 없는 코드는 사전 실행하지 않음
+        if not NativeStmtTraveler.can_travel(ast.parse(request_code.source_code).body):
+            return
+
+        job = {
+            "source_code": request_code.source_code,
+            "input": request_code.input,
+            "max_steps": max_steps,
+            "timeout_seconds": self._timeout_seconds,
+            "memory_limit_bytes": self._memory_limit_bytes,
+        }
+
+        try:
+            completed = subprocess.run(
+                [sys.executable, "-m", native_preflight_job.__name__],
+                input=json.dumps(job),
+                capture_output=True,
+                text=True,
+                timeout=self._timeout_seconds,
+                cwd=_PROJECT_ROOT,
+                # 서버의 환경 변수(설정, 인증 정보 등)를 전달하지 않음
+                env={},
+            )
+        except subprocess.TimeoutExpired as e:
+            raise CodeVisualizeError(ErrorEnum.VISUALIZE_TIMEOUT) from e
+
+        NativePreflight._raise_if_rejected(NativePreflight._get_status(completed))
+
+    @staticmethod
+    def _get_status(completed: subprocess.CompletedProcess):
+        if completed.returncode == 0:
+            return completed.stdout.strip()
+
+        # CPU 시간 제한(SIGXCPU)으로 종료된 경우
+        if completed.returncode == -signal.SIGXCPU:
+            return OVER_BUDGET
+
+        return MEMORY_LIMIT
+
+    @staticmethod
+    def _raise_if_rejected(status: str):
+        if status == OVER_BUDGET:
+            raise CodeVisualizeError(ErrorEnum.VISUALIZE_TIMEOUT)
+
+        elif status == MEMORY_LIMIT:
+            raise CodeVisualizeError(ErrorEnum.MEMORY_LIMIT_EXCEEDED)
@@ -0,0 +1,61 @@
+import ast
+import json
+import math
+import os
+import resource
+import sys
+
+from app.visualize.analysis.native.native_tracer import NativeTracer
+from app.visualize.container.step_budget import StepBudget
+from app.web.exception.code_visualize_error import CodeVisualizeError
+
+# 사전 실행 결과
+OK = "ok"
+OVER_BUDGET = "over_budget"  # 실행한 줄 수가 최대 개수를 넘었거나 제한 시간 안에 끝나지 않음
+MEMORY_LIMIT = "memory_limit"
+
+# 서버가 root로 실행된 경우 학생 코드를 실행하기 전에 바꿀 권한 없는 사용자와 group (nobody)
+_UNPRIVILEGED_ID = 65534
+
+
+# NativePreflight가 띄운 프로세스에서 코드를 실행하여 실행한 줄 수를 세고 결과를 반환
+def run_job(job: dict):
+    _limit_resources(job["memory_limit_bytes"], job["timeout_seconds"])
+    _drop_privileges()
+
+    step_budget = StepBudget(max_steps=job["max_steps"], timeout_seconds=job["timeout_seconds"])
+    tracer = NativeTracer(job["input"], step_budget, record_variables=False)
+
+    try:
+        trace_obj = tracer.run(ast.parse(job["source_code"]))
+    except CodeVisualizeError:
+        return OVER_BUDGET
+
+    # 학생 코드의 다른 예외는 분석 단계에서 처리
+    if isinstance(trace_obj.error, MemoryError):
+        return MEMORY_LIMIT
+
+    return OK
+
+
+def _limit_resources(memory_limit_bytes: int, timeout_seconds: float):
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+    cpu_limit_seconds = math.ceil(timeout_seconds)
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit_seconds, cpu_limit_seconds + 1))
+    # 파일에 쓰지 못하도록 함, 결과는 stdout(pipe)으로 반환
+    resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+
+
+# 필요한 모듈을 모두 import한 뒤 권한을 낮춰서, 학생 코드가 서버의 파일과 권한을 사용하지 못하게 함
+def _drop_privileges():
+    if os.geteuid() == 0:
+        os.setgroups([])
+        os.setgid(_UNPRIVILEGED_ID)
+        os.setuid(_UNPRIVILEGED_ID)
+
+    # 새 프로세스를 만들지 못하도록 함, root는 프로세스 수 제한을 받지 않으므로 사용자를 바꾼 뒤 설정
+    resource.setrlimit(resource.RLIMIT_NPROC, (0, 0))
+
+
+if __name__ == "__main__":
+    print(run_job(json.loads(sys.stdin.read())))
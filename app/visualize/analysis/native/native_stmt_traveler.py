@@ -0,0 +1,406 @@
+import ast
+from dataclasses import replace
+
+from app.visualize.analysis.native.models.trace_obj import CallTrace, LineEvent
+from app.visualize.analysis.native.native_tracer import NativeTracer
+from app.visualize.analysis.stmt.models.for_stmt_obj import BodyObj
+from app.visualize.analysis.stmt.models.if_stmt_obj import IfStmtObj
+from app.visualize.analysis.stmt.models.while_stmt_obj import WhileCycle, WhileStmtObj
+from app.visualize.analysis.stmt.parser.expr.arithmetic_guard import ArithmeticGuard
+from app.visualize.analysis.stmt.parser.expr.models.expr_obj import UserFunc
+from app.visualize.analysis.stmt.parser.for_stmt import ForStmt
+from app.visualize.analysis.stmt.parser.if_stmt import IfStmt
+from app.visualize.analysis.stmt.parser.while_stmt import WhileStmt
+from app.visualize.analysis.stmt.stmt_traveler import StmtTraveler
+from app.visualize.analysis.stmt.viz_step_counter import VizStepCounter
+from app.visualize.container.element_container import ElementContainer
+from app.web.exception.code_visualize_error import CodeVisualizeError
+
+# 실행해도 안전한 expr node, 이 외의 node(generator, comprehension, lambda 등)가 있는 코드는 실행하지 않음
+_NATIVE_EXPR_TYPES = (
+    ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call, ast.Name, ast.Constant, ast.List, ast.Tuple, ast.Dict,
+    ast.Subscript, ast.Slice, ast.Attribute, ast.JoinedStr, ast.FormattedValue,
+)  # fmt: skip
+
+# 문장과 expr node에 딸린 node (함수 인자, keyword 인자, 연산자, 읽기/쓰기)
+_NATIVE_PART_TYPES = (
+    ast.Module, ast.arguments, ast.arg, ast.keyword, ast.operator, ast.unaryop, ast.cmpop, ast.Load, ast.Store,
+)  # fmt: skip
+
+# 실행해도 안전한 속성, 시각화할 수 있는 list 함수만 허용
+_NATIVE_ATTR_NAMES = frozenset(("append", "remove", "extend", "pop", "insert"))
+
+# 한 번의 연산으로 결과가 아주 커질 수 있는 연산자, 실행 중에는 ArithmeticGuard로 검사할 수 없음
+_GROWING_OPERATORS = (ast.Mult, ast.Pow, ast.LShift)
+
+# 한 번의 호출로 결과가 아주 커질 수 있는 함수 (pow(a, b), list(range(n)))
+_GROWING_FUNC_NAMES = frozenset(("pow", "list"))
+
+# 상수가 아닌 피연산자를 나타내는 값
+_NOT_CONSTANT = object()
+
+# 복합 문장에서 header 줄에 있어야 하는 node
+_HEADER_FIELDS = {
+    ast.For: ("target", "iter"),
+    ast.While: ("test",),
+    ast.If: ("test",),
+    ast.FunctionDef: ("args", "returns"),
+}
+
+
+# 학생 코드를 NativeTracer로 실제 실행한 기록(줄마다 변수 값)을 따라가며 StmtTraveler와 같은 stmt 객체를 만드는 클래스
+# 어떤 문장이 실행되는지(if 분기, 반복 횟수, break, 함수 호출)는 실행 기록에서 가져오고,
+# 문장 안의 표현식 단계(조건식, 할당, return 값 등)만 실행 직전의 변수 값을 불러와 기존 parser로 분석한다.
+class NativeStmtTraveler:
+
+    # 줄 번호만으로 실행 기록과 문장을 연결할 수 있고, 실행해도 안전한 코드인지 확인
+    @staticmethod
+    def can_travel(nodes: list[ast.stmt]) -> bool:
+        start_linenos = set()
+
+        for node in ast.walk(ast.Module(body=nodes, type_ignores=[])):
+            # 허용한 node와 속성만 사용하는 코드를 실행하여, 객체 내부(frame, 모듈 등)를 통해 sandbox 밖에 접근하지 못하게 함
+            if not NativeStmtTraveler._is_allowed_node(node):
+                return False
+
+            # 결과가 너무 큰 연산은 interpreter로 분석해야 계산하기 전에 거절할 수 있음
+            if NativeStmtTraveler._may_compute_too_large(node):
+                return False
+
+            if not isinstance(node, ast.stmt):
+                continue
+
+            # 상수만 있는 문장(docstring 등)은 compile 시 제거되어 line event가 없음
+            if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+                return False
+
+            # 한 줄에 문장이 여러 개 있으면 line event가 어느 문장의 것인지 알 수 없음
+            if node.lineno in start_linenos:
+                return False
+            start_linenos.add(node.lineno)
+
+            if not NativeStmtTraveler._is_single_line_header(node):
+                return False
+
+        return True
+
+    @staticmethod
+    def _is_allowed_node(node: ast.AST):
+        if isinstance(node, ast.stmt):
+            return type(node) in _NATIVE_STMT_HANDLERS
+
+        # list 함수를 읽는 것만 허용, 속성에 값을 할당하지 않음
+        if isinstance(node, ast.Attribute):
+            return node.attr in _NATIVE_ATTR_NAMES and isinstance(node.ctx, ast.Load)
+
+        # __builtins__ 같은 숨겨진 이름
+        if isinstance(node, ast.Name):
+            return not node.id.startswith("__")
+
+        return isinstance(node, _NATIVE_EXPR_TYPES) or isinstance(node, _NATIVE_PART_TYPES)
+
+    # a * b, a ** b, pow(a, b), list(range(n))처럼 피연산자에 따라 한 번에 결과가 아주 커질 수 있는 연산
+    # 상수끼리의 연산은 ArithmeticGuard로 미리 검사하고, 덧셈처럼 조금씩 커지는 값은 NativeTracer가 줄마다 검사
+    @staticmethod
+    def _may_compute_too_large(node: ast.AST):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _GROWING_FUNC_NAMES:
+            return True
+
+        if isinstance(node, ast.BinOp):
+            left, op, right = node.left, node.op, node.right
+        elif isinstance(node, ast.AugAssign):
+            left, op, right = node.target, node.op, node.value
+        else:
+            return False
+
+        if not isinstance(op, _GROWING_OPERATORS):
+            return False
+
+        left_value = NativeStmtTraveler._get_constant_value(left)
+        right_value = NativeStmtTraveler._get_constant_value(right)
+        if left_value is _NOT_CONSTANT or right_value is _NOT_CONSTANT or isinstance(op, ast.LShift):
+            return True
+
+        try:
+            ArithmeticGuard.check_binop(type(op), left_value, right_value)
+        except CodeVisualizeError:
+            return True
+
+        return False
+
+    # 3, -3, 'abc' 같은 상수의 값
+    @staticmethod
+    def _get_constant_value(node: ast.AST):
+        if isinstance(node, ast.Constant):
+            return node.value
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+            if isinstance(node.operand.value, int | float):
+                return -node.operand.value
+
+        return _NOT_CONSTANT
+
+    @staticmethod
+    def travel(nodes: list[ast.stmt], elem_container: ElementContainer):
+        return list(NativeStmtTraveler.iter_travel(nodes, elem_container))
+
+    # 코드 전체를 먼저 실행하여 기록한 뒤, 기록을 따라 분석이 끝난 stmt 객체를 하나씩 반환
+    @staticmethod
+    def iter_travel(nodes: list[ast.stmt], elem_container: ElementContainer):
+        tracer = NativeTracer(elem_container.get_input_list(), elem_container.get_step_budget())
+        trace_obj = tracer.run(ast.Module(body=nodes, type_ignores=[]))
+
+        yield from NativeStmtTraveler._iter_replay(nodes, _TraceCursor(trace_obj.main_trace), elem_container)
+
+        # 결과를 자르는 경우 tracer가 제한에 걸려 실행을 멈춘 줄까지만 기록이 있음
+        if trace_obj.stop_reason is not None:
+            elem_container.stop_analysis(trace_obj.stop_reason, trace_obj.stop_lineno)
+
+        # 학생 코드의 예외는 예외가 발생한 줄까지 분석한 뒤 전달
+        if trace_obj.error is not None:
+            raise trace_obj.error
+
+    # 단순 문장은 한 줄, 복합 문장은 header가 한 줄이고 body가 다음 줄부터 시작해야 함
+    @staticmethod
+    def _is_single_line_header(node: ast.stmt):
+        header_fields = _HEADER_FIELDS.get(type(node))
+        if header_fields is None:
+            return node.lineno == node.end_lineno
+
+        if getattr(node, "decorator_list", None):
+            return False
+
+        header_nodes = [getattr(node, header_field) for header_field in header_fields]
+        return node.body[0].lineno > node.lineno and all(
+            getattr(header_node, "end_lineno", None) in (None, node.lineno)
+            for header in header_nodes
+            if header is not None
+            for header_node in ast.walk(header)
+        )
+
+    # nodes 안의 문장에서 시작하는 line event가 이어지는 동안 문장을 분석
+    @staticmethod
+    def _iter_replay(nodes: list[ast.stmt], cursor: "_TraceCursor", elem_container: ElementContainer):
+        while True:
+            event = cursor.peek()
+            node = None if event is None else NativeStmtTraveler._find_node(nodes, event.lineno)
+
+            # 반복문 header로 돌아가거나, 상위 block으로 나가거나, 실행 기록이 끝남
+            if node is None or StmtTraveler._is_stopped(node, elem_container):
+                return
+
+            cursor.next(elem_container)
+            stmt_obj = _NATIVE_STMT_HANDLERS[type(node)](node, cursor, elem_container)
+
+            if stmt_obj is None:
+                continue
+
+            yield StmtTraveler._count_stmt_obj(stmt_obj, elem_container)
+
+    @staticmethod
+    def _travel_block(nodes: list[ast.stmt], cursor: "_TraceCursor", elem_container: ElementContainer):
+        return list(NativeStmtTraveler._iter_replay(nodes, cursor, elem_container))
+
+    @staticmethod
+    def _find_node(nodes: list[ast.stmt], lineno: int):
+        for node in nodes:
+            if node.lineno == lineno:
+                return node
+
+        return None
+
+    # 사용자 함수 호출 : 호출한 줄에서 기록된 CallTrace를 따라 함수 body를 분석
+    @staticmethod
+    def _create_travel_func_body(cursor: "_TraceCursor"):
+        def travel_func_body(user_func: UserFunc, local_elem_container: ElementContainer):
+            # global 문은 실행되는 코드가 없어 line event가 없으므로 함수 시작 시 미리 선언
+            for body_node in user_func.user_func_ast:
+                if isinstance(body_node, ast.Global):
+                    local_elem_container.declare_global(body_node.names)
+
+            call_cursor = _TraceCursor(cursor.next_call_trace(user_func.name))
+            return NativeStmtTraveler._travel_block(user_func.user_func_ast, call_cursor, local_elem_container)
+
+        return travel_func_body
+
+    @staticmethod
+    def _assign_travel(node: ast.Assign, cursor: "_TraceCursor", elem_container: ElementContainer):
+        return StmtTraveler._assign_travel(node, elem_container, NativeStmtTraveler._create_travel_func_body(cursor))
+
+    @staticmethod
+    def _expr_travel(node: ast.Expr, cursor: "_TraceCursor", elem_container: ElementContainer):
+        return StmtTraveler._expr_travel(node, elem_container, NativeStmtTraveler._create_travel_func_body(cursor))
+
+    @staticmethod
+    def _for_travel(node: ast.For, cursor: "_TraceCursor", elem_container: ElementContainer):
+        for_stmt_obj = ForStmt.parse(node, elem_container)
+        body_objs = []
+
+        # header 다음에 body의 줄이 실행되면 한 번 반복
+        while cursor.is_in(node.body):
+            elem_container.check_deadline()
+            if StmtTraveler._is_stopped(node, elem_container):
+                break
+
+            elem_container.consume_steps(VizStepCounter.count_for_iteration())
+            cur_value = cursor.peek().get_variable(for_stmt_obj.target_name)
+
+            body_steps = NativeStmtTraveler._travel_block(node.body, cursor, elem_container)
+            body_objs.append(BodyObj(cur_value=cur_value, body_steps=body_steps))
+
+            # break로 끝나면 header로 돌아오지 않음
+            if not cursor.next_if(node.lineno, elem_container):
+                break
+
+        # for-else는 StmtTraveler와 같이 시각화하지 않음
+        cursor.skip(node.orelse)
+
+        for_stmt_obj.body_objs = body_objs
+        return for_stmt_obj
+
+    @staticmethod
+    def _while_travel(node: ast.While, cursor: "_TraceCursor", elem_container: ElementContainer):
+        while_cycles = []
+
+        while True:
+            elem_container.consume_while_cycle()
+            if StmtTraveler._is_stopped(node, elem_container):
+                break
+
+            condition_obj = WhileStmt.parse_condition(node.test, elem_container)
+            elem_container.consume_steps(VizStepCounter.count_while_cycle(condition_obj.expressions))
+
+            body_objs = []
+            if cursor.is_in(node.body):
+                body_objs = NativeStmtTraveler._travel_block(node.body, cursor, elem_container)
+
+            while_cycles.append(WhileCycle(condition_exprs=condition_obj.expressions, body_objs=body_objs))
+
+            # 조건이 False이거나 break로 끝나면 header로 돌아오지 않음
+            if not cursor.next_if(node.lineno, elem_container):
+                break
+
+        while_else_objs = []
+        if cursor.is_in(node.orelse):
+            while_else_objs = NativeStmtTraveler._travel_block(node.orelse, cursor, elem_container)
+        # else 로직은 시각화 단계로 변환되지 않으므로 budget에서 제외
+        elem_container.refund_steps(VizStepCounter.count_all(while_else_objs))
+
+        return WhileStmtObj(id=node.lineno, orelse=while_else_objs, while_cycles=while_cycles)
+
+    # StmtTraveler처럼 모든 분기의 조건식을 분석하되, 조건의 결과와 실행한 body는 실행 기록을 따름
+    @staticmethod
+    def _if_travel(node: ast.If, cursor: "_TraceCursor", elem_container: ElementContainer):
+        conditions = []
+        body_steps = []
+        is_taken = False
+        branch = node
+
+        while True:
+            if branch is node:
+                condition = IfStmt.parse_if_condition(branch.test, elem_container)
+            else:
+                # 앞의 분기가 실행되지 않았을 때만 elif 줄이 실행됨
+                if not is_taken:
+                    cursor.next_if(branch.lineno, elem_container)
+                condition = IfStmt.parse_elif_condition(branch.test, elem_container)
+
+            is_entered = not is_taken and cursor.is_in(branch.body)
+            conditions.append(replace(condition, result=is_entered))
+
+            if is_entered:
+                body_steps.extend(NativeStmtTraveler._travel_block(branch.body, cursor, elem_container))
+                is_taken = True
+
+            if not branch.orelse:
+                break
+
+            # elif
+            if len(branch.orelse) == 1 and isinstance(branch.orelse[0], ast.If):
+                branch = branch.orelse[0]
+                continue
+
+            # else
+            is_entered = not is_taken and cursor.is_in(branch.orelse)
+            conditions.append(IfStmt.parse_else_condition(branch.orelse[0], is_entered))
+
+            if is_entered:
+                body_steps.extend(NativeStmtTraveler._travel_block(branch.orelse, cursor, elem_container))
+            break
+
+        return IfStmtObj(conditions=tuple(conditions), body_steps=body_steps)
+
+
+# 한 frame의 실행 기록을 앞에서부터 읽는 클래스
+class _TraceCursor:
+
+    def __init__(self, call_trace: CallTrace):
+        self._events = call_trace.events
+        self._index = 0
+
+    # 다음에 실행된 줄, 중간에 있는 함수 호출 기록은 건너뜀 (호출한 문장이 next_call_trace로 가져가지 않은 경우)
+    def peek(self) -> LineEvent | None:
+        while self._index < len(self._events):
+            event = self._events[self._index]
+            if isinstance(event, LineEvent):
+                return event
+            self._index += 1
+
+        return None
+
+    # 다음 줄로 이동하고, 그 줄을 실행하기 직전의 변수 값을 elem_container에 불러옴
+    def next(self, elem_container: ElementContainer) -> LineEvent:
+        event = self.peek()
+        self._index += 1
+        elem_container.load_snapshot(event.local_variables, event.global_variables)
+        return event
+
+    def next_if(self, lineno: int, elem_container: ElementContainer) -> bool:
+        event = self.peek()
+        if event is None or event.lineno != lineno:
+            return False
+
+        self.next(elem_container)
+        return True
+
+    # 다음 줄이 nodes 중 하나에 속하는지
+    def is_in(self, nodes: list[ast.stmt]) -> bool:
+        event = self.peek()
+        if event is None:
+            return False
+
+        return any(node.lineno <= event.lineno <= node.end_lineno for node in nodes)
+
+    def skip(self, nodes: list[ast.stmt]):
+        while self.is_in(nodes):
+            self._index += 1
+
+    # 현재 줄에서 호출한 함수의 실행 기록, 기록이 없으면(호출 전에 예외 발생) 빈 기록
+    def next_call_trace(self, func_name: str) -> CallTrace:
+        while self._index < len(self._events):
+            event = self._events[self._index]
+            if isinstance(event, LineEvent):
+                break
+
+            self._index += 1
+            if event.func_name == func_name:
+                return event
+
+        return CallTrace(func_name=func_name)
+
+
+# node 타입별 분석 함수, 호출 시점에 NativeStmtTraveler의 함수를 찾도록 lambda로 감쌈
+# 실행 기록에서 흐름을 가져올 필요가 없는 문장은 StmtTraveler의 함수를 그대로 사용
+_NATIVE_STMT_HANDLERS = {
+    ast.Assign: lambda node, cursor, elem_container: NativeStmtTraveler._assign_travel(node, cursor, elem_container),
+    ast.For: lambda node, cursor, elem_container: NativeStmtTraveler._for_travel(node, cursor, elem_container),
+    ast.Expr: lambda node, cursor, elem_container: NativeStmtTraveler._expr_travel(node, cursor, elem_container),
+    ast.If: lambda node, cursor, elem_container: NativeStmtTraveler._if_travel(node, cursor, elem_container),
+    ast.Pass: lambda node, cursor, elem_container: StmtTraveler._flow_control_travel(node),
+    ast.Break: lambda node, cursor, elem_container: StmtTraveler._flow_control_travel(node),
+    ast.Continue: lambda node, cursor, elem_container: StmtTraveler._flow_control_travel(node),
+    ast.Return: lambda node, cursor, elem_container: StmtTraveler._return_travel(node, elem_container),
+    ast.While: lambda node, cursor, elem_container: NativeStmtTraveler._while_travel(node, cursor, elem_container),
+    ast.FunctionDef: lambda node, cursor, elem_container: StmtTraveler._func_def_travel(node, elem_container),
+    ast.Global: lambda node, cursor, elem_container: StmtTraveler._global_travel(node, elem_container),
+}
@@ -0,0 +1,168 @@
+import ast
+import builtins
+import copy
+import functools
+import itertools
+import os
+import sys
+import types
+
+from app.visualize.analysis.native.models.trace_obj import CallTrace, LineEvent, NativeTraceObj
+from app.visualize.analysis.stmt.parser.expr.arithmetic_guard import ArithmeticGuard
+from app.visualize.analysis.stmt.parser.expr.parser.built_in_func.builtin_expr import BuiltinExpr
+from app.visualize.container.step_budget import StepBudget
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+# 학생 코드를 compile할 때 사용하는 파일 이름, tracer는 이 파일의 frame만 기록
+_STUDENT_FILENAME = "<student>"
+
+# 시각화 단계 하나당 허용하는 line event 수, 시각화 단계가 없는 줄(반복문이 끝날 때의 header 등)을 고려한 여유분
+_LINE_EVENTS_PER_STEP = 2
+
+# 변수 snapshot에서 제외하는 값의 타입 (함수는 FuncDetails로 ElementContainer에 따로 저장됨)
+_HIDDEN_VALUE_TYPES = (types.FunctionType, types.BuiltinFunctionType, types.ModuleType, type)
+
+
+# 학생 코드를 실제 CPython으로 실행하면서 sys.settrace로 줄마다 변수 값을 기록하는 클래스
+# 함수 호출은 호출한 frame의 events 안에 CallTrace로 중첩해서 기록하고,
+# 실행한 줄 수와 분석 제한 시간은 tracer 안에서 검사하여 넘으면 학생 코드 실행을 바로 중단한다.
+class NativeTracer:
+
+    def __init__(self, input_list: list, step_budget: StepBudget, record_variables: bool = True):
+        self._input_list = input_list
+        self._step_budget = step_budget
+        self._max_line_events = step_budget.get_max_steps() * _LINE_EVENTS_PER_STEP
+        self._line_event_count = 0
+        self._stop_lineno = None
+        # False면 변수 값을 기록하지 않고 실행한 줄 수만 셈 (NativePreflight)
+        self._record_variables = record_variables
+        self._main_trace = CallTrace(func_name="main")
+        # 실행 중인 frame의 CallTrace, 마지막 값이 현재 frame
+        self._call_traces = []
+
+    def run(self, tree: ast.Module) -> NativeTraceObj:
+        code = compile(tree, _STUDENT_FILENAME, "exec")
+        # print 출력은 버리되 실행마다 따로 열어서 학생 코드가 닫아도 다른 실행에 영향이 없도록 함
+        devnull = open(os.devnull, "w")
+        namespace = {"__builtins__": self._create_builtins(devnull)}
+        error = None
+        stop_reason = None
+
+        previous_trace = sys.gettrace()
+        sys.settrace(self._trace_call)
+        try:
+            exec(code, namespace)
+        except CodeVisualizeError as e:
+            # 값이 너무 커져서 멈춘 경우 학생 코드의 예외처럼 멈춘 줄까지 분석한 뒤 전달
+            if e.error_enum is ErrorEnum.OPERATION_TOO_LARGE:
+                error = e
+            # 결과를 자르는 경우 제한에 걸리기 전까지의 실행 기록을 반환
+            elif not self._step_budget.is_truncating():
+                raise
+            else:
+                stop_reason = e.error_enum
+        except Exception as e:
+            error = e
+        finally:
+            sys.settrace(previous_trace)
+            devnull.close()
+
+        return NativeTraceObj(
+            main_trace=self._main_trace, error=error, stop_reason=stop_reason, stop_lineno=self._stop_lineno
+        )
+
+    def get_line_event_count(self):
+        return self._line_event_count
+
+    # 학생 코드에서는 분석할 수 있는 builtin 함수(BuiltinExpr)만 사용할 수 있음 (파일, import, 객체 내부에 접근하는 함수는 없음)
+    # print, input은 Python 함수로 만들면 __globals__로 서버 모듈에 접근할 수 있으므로 C로 구현된 builtin만 조합해서 만듦
+    def _create_builtins(self, devnull):
+        safe_builtins = {name: getattr(builtins, name) for name in BuiltinExpr.get_builtin_func_names()}
+        # 출력 결과는 분석 단계(PrintExpr)에서 다시 만들기 때문에 실행 중에는 버림
+        safe_builtins["print"] = functools.partial(builtins.print, file=devnull)
+        # 요청의 input을 차례로 반환, ElementContainer.get_input처럼 빈 input부터는 사용할 수 없음
+        # (input이 부족하면 실행은 여기서 멈추고, 같은 줄을 분석할 때 ElementContainer가 예외를 발생시킴)
+        safe_builtins["input"] = functools.partial(next, itertools.takewhile(bool, self._input_list))
+
+        return safe_builtins
+
+    def _trace_call(self, frame, event, arg):
+        code = frame.f_code
+        if code.co_filename != _STUDENT_FILENAME:
+            return None
+
+        if code.co_name == "<module>":
+            call_trace = self._main_trace
+
+        # comprehension, lambda의 frame은 기록하지 않고 실행한 줄 수만 셈
+        elif code.co_name.startswith("<"):
+            return self._trace_hidden_frame
+
+        else:
+            call_trace = CallTrace(func_name=code.co_name)
+            self._call_traces[-1].events.append(call_trace)
+
+        self._call_traces.append(call_trace)
+        return self._trace_frame
+
+    def _trace_frame(self, frame, event, arg):
+        if event == "line":
+            self._count_line_event(frame.f_lineno)
+            NativeTracer._check_value_sizes(frame)
+            if self._record_variables:
+                self._call_traces[-1].events.append(self._create_line_event(frame))
+
+        elif event == "return":
+            self._call_traces.pop()
+
+        return self._trace_frame
+
+    def _trace_hidden_frame(self, frame, event, arg):
+        if event == "line":
+            self._count_line_event(frame.f_lineno)
+
+        return self._trace_hidden_frame
+
+    def _count_line_event(self, lineno: int):
+        self._line_event_count += 1
+
+        if self._line_event_count > self._max_line_events:
+            self._stop_lineno = lineno
+            raise CodeVisualizeError(ErrorEnum.VISUALIZE_TIMEOUT)
+
+        # 결과를 자르는 경우에도 학생 코드 실행은 바로 중단해야 하므로 StepBudget.check_deadline 대신 직접 검사
+        if self._step_budget.is_past_deadline():
+            self._stop_lineno = lineno
+            raise CodeVisualizeError(ErrorEnum.EXECUTION_TIMEOUT)
+
+    # 실행 중에는 ArithmeticGuard가 연산을 미리 검사할 수 없으므로, 줄을 실행하기 전에 변수 값의 크기를 검사
+    # a = a + a처럼 반복할수록 커지는 값은 제한을 넘은 다음 줄에서 멈춤 (한 번에 크게 커지는 연산은 can_travel에서 거절)
+    @staticmethod
+    def _check_value_sizes(frame):
+        for value in frame.f_locals.values():
+            ArithmeticGuard.check_value(value)
+
+    @staticmethod
+    def _create_line_event(frame):
+        if frame.f_globals is frame.f_locals:
+            local_variables = NativeTracer._filter_variables(frame.f_globals)
+            global_variables = {}
+
+        else:
+            local_variables = NativeTracer._filter_variables(frame.f_locals)
+            global_variables = NativeTracer._filter_variables(
+                {name: frame.f_globals[name] for name in frame.f_code.co_names if name in frame.f_globals}
+            )
+
+        # 이후 실행에서 값이 바뀌지 않도록 복사, 한 번에 복사하여 같은 list를 가리키는 변수 관계를 유지
+        local_variables, global_variables = copy.deepcopy((local_variables, global_variables))
+        return LineEvent(lineno=frame.f_lineno, local_variables=local_variables, global_variables=global_variables)
+
+    @staticmethod
+    def _filter_variables(variables: dict):
+        return {
+            name: value
+            for name, value in variables.items()
+            if not name.startswith("__") and not isinstance(value, _HIDDEN_VALUE_TYPES)
+        }
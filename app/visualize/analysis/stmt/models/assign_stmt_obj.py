@@ -5,7 +5,7 @@ from app.visualize.analysis.stmt.models.stmt_type import StmtType
 from app.visualize.analysis.stmt.models.user_func_stmt_obj import UserFuncStmtObj
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssignStmtObj:
     targets: tuple[str, ...]
     expr_stmt_obj: ExprStmtObj | UserFuncStmtObj
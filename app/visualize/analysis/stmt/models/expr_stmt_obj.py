@@ -5,7 +5,7 @@ from app.visualize.analysis.stmt.models.stmt_type import StmtType
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExprStmtObj:
     id: int
     value: Any
@@ -13,3 +13,9 @@ class ExprStmtObj:
     expr_type: ExprType
     call_stack_name: str
     type: StmtType = field(default_factory=lambda: StmtType.EXPR, init=False)
+    # 마지막 표현식이 나타내는 값의 타입, 변환기는 문자열을 다시 평가하지 않고 이 값을 사용
+    value_type: ExprType = field(default=None, kw_only=True)
+
+    def __post_init__(self):
+        if self.value_type is None:
+            object.__setattr__(self, "value_type", ExprType.judge_collection_type(self.value))
@@ -5,13 +5,13 @@ from app.visualize.analysis.stmt.models.stmt_type import StmtType
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj
 
 
-@dataclass
+@dataclass(slots=True)
 class BodyObj:
     cur_value: Any
     body_steps: list[Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ForStmtObj:
     id: int
     target_name: str
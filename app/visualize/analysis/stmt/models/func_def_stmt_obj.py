@@ -5,14 +5,14 @@ from app.visualize.analysis.stmt.models.expr_stmt_obj import ExprStmtObj
 from app.visualize.analysis.stmt.models.stmt_type import StmtType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FuncDetails:
     id: int
     args: tuple[str, ...]
     body: ast
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FuncDefStmtObj:
     target: str
     expr_stmt_obj: ExprStmtObj
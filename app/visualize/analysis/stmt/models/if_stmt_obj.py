@@ -5,7 +5,7 @@ from app.visualize.analysis.stmt.models.for_stmt_obj import BodyObj
 from app.visualize.analysis.stmt.models.stmt_type import StmtType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionObj:
     id: int
     expressions: tuple[str, ...] | None  # else의 경우 None
@@ -13,22 +13,22 @@ class ConditionObj:
     type: StmtType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IfConditionObj(ConditionObj):
     type: StmtType = field(default_factory=lambda: StmtType.IF, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElifConditionObj(ConditionObj):
     type: StmtType = field(default_factory=lambda: StmtType.ELIF, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElseConditionObj(ConditionObj):
     type: StmtType = field(default_factory=lambda: StmtType.ELSE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IfStmtObj:
     conditions: tuple[ConditionObj, ...]  # 조건문들의 정보
     body_steps: list  # 조건문이 true인 If문에서 실행되는 body 로직 정보
@@ -4,7 +4,7 @@ from typing import Any
 from app.visualize.analysis.stmt.models.stmt_type import StmtType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReturnStmtObj:
     id: int
     value: Any
@@ -3,13 +3,13 @@ from dataclasses import dataclass, field
 from app.visualize.analysis.stmt.models.stmt_type import StmtType
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileCycle:
     condition_exprs: tuple[str, ...]
     body_objs: list
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WhileStmtObj:
     id: int
     orelse: list
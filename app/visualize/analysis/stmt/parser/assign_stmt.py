@@ -1,10 +1,18 @@
 import ast
+import copy
+from dataclasses import replace
 
 from app.visualize.analysis.stmt.models.assign_stmt_obj import AssignStmtObj
 from app.visualize.analysis.stmt.models.expr_stmt_obj import ExprStmtObj
 from app.visualize.analysis.stmt.parser.expr.expr_traveler import ExprTraveler
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
+from app.visualize.analysis.stmt.parser.expr.models.subscript_target import SubscriptTarget
+from app.visualize.container.collection_snapshot import CollectionSnapshot
 from app.visualize.container.element_container import ElementContainer
+from app.visualize.utils.value_renderer import ValueRenderer
+
+# 분석할 때마다 새로 만드는 값을 계산하는 node, 다른 변수와 값을 공유하지 않으므로 처음 할당하는 변수에는 복사하지 않고 저장
+_NEW_VALUE_NODE_TYPES = (ast.List, ast.Tuple, ast.Dict)
 
 
 class AssignStmt:
@@ -14,11 +22,15 @@ class AssignStmt:
         target_names = AssignStmt._get_target_names(node.targets, elem_container)
         expr_obj = AssignStmt._change_node_to_expr_obj(node.value, elem_container)
 
+        if expr_obj.type is not ExprType.USER_FUNC:
+            target_names = tuple(AssignStmt._add_element_expr(target_name, expr_obj) for target_name in target_names)
+
         expr_stmt_obj = ExprStmtObj(
             id=node.lineno,
             expressions=expr_obj.expressions,
-            value=expr_obj.value,
+            value=elem_container.take_snapshot(expr_obj.value),
             expr_type=expr_obj.type,
+            value_type=expr_obj.value_type,
             call_stack_name=elem_container.get_call_stack_name(),
         )
 
@@ -55,24 +67,44 @@ class AssignStmt:
 
         return tuple(target_names)
 
+    # a[i][j] = v 는 할당한 뒤의 a[i]를 시각화하므로, 이후에 값이 바뀌기 전에 복사본에 미리 할당해서 표현식을 만듦
+    @staticmethod
+    def _add_element_expr(target_name, expr_obj):
+        if not isinstance(target_name, SubscriptTarget) or not target_name.is_nested():
+            return target_name
+
+        element = copy.deepcopy(target_name.root[target_name.indices[0]])
+        element_target = SubscriptTarget(name=target_name.name, root=element, indices=target_name.indices[1:])
+        element_target.get_collection()[element_target.indices[-1]] = expr_obj.value
+
+        return replace(target_name, element_expr=ValueRenderer.render(element))
+
     @staticmethod
     def _change_node_to_expr_obj(node: ast, elem_container: ElementContainer):
         return ExprTraveler.travel(node, elem_container)
 
     @staticmethod
-    def set_value_to_target(target_names: tuple, expr_obj, elem_container: ElementContainer):
+    def is_new_value(node: ast) -> bool:
+        return isinstance(node, _NEW_VALUE_NODE_TYPES)
+
+    @staticmethod
+    def set_value_to_target(target_names: tuple, expr_obj, elem_container: ElementContainer, is_new_value=False):
+        value = expr_obj.value
+        if isinstance(value, CollectionSnapshot):
+            value = value.get_value()
+
         for target_name in target_names:
+            # 새로 만든 값은 첫 번째 변수가 그대로 가짐 (시각화 단계는 CollectionSnapshot으로 기록해서 이후 값이 바뀌어도 유지됨)
+            if is_new_value:
+                is_new_value = False
 
-            if expr_obj.type is ExprType.LIST:
-                value = list(expr_obj.value)
+            elif expr_obj.type is ExprType.LIST:
+                value = list(value)
 
             elif expr_obj.type is ExprType.TUPLE:
-                value = tuple(expr_obj.value)
+                value = tuple(value)
 
             elif expr_obj.type is ExprType.DICT:
-                value = dict(expr_obj.value)
-
-            else:
-                value = expr_obj.value
+                value = dict(value)
 
             elem_container.add_element(target_name, value)
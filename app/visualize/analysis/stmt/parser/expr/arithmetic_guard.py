@@ -0,0 +1,99 @@
+import ast
+import math
+
+from app import settings
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+# 길이로 크기를 계산하는 값의 타입, 이어 붙이기(+)와 반복(*)으로 길이가 늘어남
+_SEQUENCE_TYPES = (str, list, tuple)
+
+
+# 연산을 실제로 계산하기 전에 결과의 크기를 추정하여, 설정값을 넘는 연산은 계산하지 않고 거절하는 클래스
+# 9 ** 9 ** 9, 'x' * 10 ** 9 같은 연산은 계산 한 번에 수 분이 걸리거나 메모리를 모두 사용하므로
+# 정수는 결과의 bit 수, 문자열, list, tuple은 결과의 길이를 피연산자만 보고 계산한다.
+class ArithmeticGuard:
+
+    # 이항 연산 left op right, op_type은 ast.Add 등 연산자 노드의 타입
+    @staticmethod
+    def check_binop(op_type: type, left, right):
+        check = _BINOP_CHECKS.get(op_type)
+
+        if check is not None:
+            check(left, right)
+
+    # 단항 연산 op operand, -a와 ~a는 결과가 피연산자보다 최대 1 bit 커짐
+    @staticmethod
+    def check_unary_op(op_type: type, operand):
+        if op_type in (ast.Invert, ast.USub) and ArithmeticGuard._is_int(operand):
+            ArithmeticGuard._check_bits(operand.bit_length() + 1)
+
+    # 이미 계산된 값의 크기, 연산을 직접 검사할 수 없는 곳(NativeTracer)에서 사용
+    @staticmethod
+    def check_value(value):
+        if ArithmeticGuard._is_int(value):
+            ArithmeticGuard._check_bits(value.bit_length())
+
+        elif isinstance(value, _SEQUENCE_TYPES):
+            ArithmeticGuard.check_length(len(value))
+
+    # 만들 값의 길이, list(range(n))처럼 요소를 하나씩 만드는 곳에서 만들기 전에 사용
+    @staticmethod
+    def check_length(length: int):
+        if length > settings.MAX_SEQUENCE_RESULT_LENGTH:
+            raise CodeVisualizeError(ErrorEnum.OPERATION_TOO_LARGE)
+
+    # a + b, a - b
+    @staticmethod
+    def _check_add(left, right):
+        if ArithmeticGuard._is_int(left) and ArithmeticGuard._is_int(right):
+            ArithmeticGuard._check_bits(max(left.bit_length(), right.bit_length()) + 1)
+
+        elif isinstance(left, _SEQUENCE_TYPES) and isinstance(right, _SEQUENCE_TYPES):
+            ArithmeticGuard.check_length(len(left) + len(right))
+
+    # a * b, 'x' * 3, 3 * [0]
+    @staticmethod
+    def _check_mult(left, right):
+        if ArithmeticGuard._is_int(left) and ArithmeticGuard._is_int(right):
+            ArithmeticGuard._check_bits(left.bit_length() + right.bit_length())
+
+        elif isinstance(left, _SEQUENCE_TYPES) and ArithmeticGuard._is_int(right):
+            ArithmeticGuard.check_length(len(left) * max(right, 0))
+
+        elif ArithmeticGuard._is_int(left) and isinstance(right, _SEQUENCE_TYPES):
+            ArithmeticGuard.check_length(max(left, 0) * len(right))
+
+    # a ** b, 결과의 bit 수는 log2(|a|) * b
+    # 지수가 음수이면 실수로 계산되어 너무 크면 OverflowError가 바로 발생하므로 검사하지 않음
+    @staticmethod
+    def _check_pow(left, right):
+        if not (ArithmeticGuard._is_int(left) and ArithmeticGuard._is_int(right)):
+            return
+
+        # 0, 1, -1의 거듭제곱은 크기가 늘지 않음
+        if right <= 0 or abs(left) <= 1:
+            return
+
+        # |a| >= 2이면 결과가 b bit 이상이므로, 아주 큰 지수를 실수로 바꾸기 전에 먼저 거절
+        ArithmeticGuard._check_bits(right)
+        ArithmeticGuard._check_bits(math.ceil(math.log2(abs(left)) * right))
+
+    @staticmethod
+    def _check_bits(bits: int):
+        if bits > settings.MAX_INT_RESULT_BITS:
+            raise CodeVisualizeError(ErrorEnum.OPERATION_TOO_LARGE)
+
+    # bool도 int의 하위 타입이므로 정수로 취급
+    @staticmethod
+    def _is_int(value):
+        return isinstance(value, int)
+
+
+# 연산자 타입 : 결과 크기 검사 함수, 결과가 피연산자보다 커지지 않는 연산자(/, //, %)는 검사하지 않음
+_BINOP_CHECKS = {
+    ast.Add: ArithmeticGuard._check_add,
+    ast.Sub: ArithmeticGuard._check_add,
+    ast.Mult: ArithmeticGuard._check_mult,
+    ast.Pow: ArithmeticGuard._check_pow,
+}
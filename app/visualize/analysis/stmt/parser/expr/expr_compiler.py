@@ -0,0 +1,258 @@
+import ast
+
+from app.visualize.analysis.stmt.parser.expr.expr_traveler import ExprTraveler
+from app.visualize.analysis.stmt.parser.expr.parser.arguments_expr import ArgumentsExpr
+from app.visualize.analysis.stmt.parser.expr.parser.attribute_expr import AttributeExpr
+from app.visualize.analysis.stmt.parser.expr.parser.binop_expr import BinopExpr
+from app.visualize.analysis.stmt.parser.expr.parser.call_expr import CallExpr
+from app.visualize.analysis.stmt.parser.expr.parser.compare_expr import CompareExpr
+from app.visualize.analysis.stmt.parser.expr.parser.constant_expr import ConstantExpr
+from app.visualize.analysis.stmt.parser.expr.parser.dict_expr import DictExpr
+from app.visualize.analysis.stmt.parser.expr.parser.formatted_value_expr import FormattedValueExpr
+from app.visualize.analysis.stmt.parser.expr.parser.joined_str_expr import JoinedStrExpr
+from app.visualize.analysis.stmt.parser.expr.parser.list_expr import ListExpr
+from app.visualize.analysis.stmt.parser.expr.parser.name_expr import NameExpr
+from app.visualize.analysis.stmt.parser.expr.parser.slice_expr import SliceExpr
+from app.visualize.analysis.stmt.parser.expr.parser.subscript_expr import SubscriptExpr
+from app.visualize.analysis.stmt.parser.expr.parser.tuple_expr import TupleExpr
+from app.visualize.analysis.stmt.parser.expr.parser.unary_op_expr import UnaryOpExpr
+from app.visualize.analysis.stmt.parser.expr.static_expr import StaticExpr
+
+
+# expr node를 한 번만 읽어서 closure(elem_container -> ExprObj)로 바꿔두는 클래스
+# closure는 ExprTraveler와 같은 Expr 클래스의 parse를 같은 순서로 호출하므로 결과(ExprObj, 예외)가 같고,
+# 반복문에서 같은 node를 다시 분석할 때 node 타입 분기 없이 미리 연결된 closure만 호출한다.
+class ExprCompiler:
+
+    # tree 안의 모든 expr node에 closure를 붙임, 이후 ExprTraveler.travel은 붙여둔 closure를 실행
+    @staticmethod
+    def attach(tree: ast.AST):
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.expr, ast.arguments)):
+                ExprCompiler.compile(node)
+
+    @staticmethod
+    def compile(node: ast.AST):
+        compiled = ExprTraveler.get_compiled(node)
+        if compiled is not None:
+            return compiled
+
+        compiler = _EXPR_COMPILERS.get(type(node))
+
+        # 지원하지 않는 node는 ExprTraveler가 실행 시점에 처리(예외 포함)하도록 남겨둠
+        if compiler is None:
+            return lambda elem_container: ExprTraveler.travel(node, elem_container)
+
+        compiled = compiler(node)
+        ExprTraveler.set_compiled(node, compiled)
+        return compiled
+
+    @staticmethod
+    def _compile_binop(node: ast.BinOp):
+        left = ExprCompiler._compile_binop_operand(node.left)
+        right = ExprCompiler._compile_binop_operand(node.right)
+        op = node.op
+
+        return lambda elem_container: BinopExpr.parse(left(elem_container), right(elem_container), op)
+
+    @staticmethod
+    def _compile_binop_operand(node: ast.AST):
+        if ExprTraveler.is_binop_operand(node):
+            return ExprCompiler.compile(node)
+
+        # ExprTraveler.binop_travel이 실행 시점에 같은 TypeError를 발생시킴
+        return lambda elem_container: ExprTraveler.binop_travel(node, elem_container)
+
+    @staticmethod
+    def _compile_name(node: ast.Name):
+        static_obj = StaticExpr.get(node)
+        if static_obj is not None:
+            return lambda elem_container: static_obj
+
+        return lambda elem_container: NameExpr.parse(node, elem_container)
+
+    @staticmethod
+    def _compile_constant(node: ast.Constant):
+        static_obj = StaticExpr.get(node)
+        if static_obj is None:
+            return lambda elem_container: ConstantExpr.parse(node)
+
+        return lambda elem_container: static_obj
+
+    @staticmethod
+    def _compile_call(node: ast.Call):
+        func_name = ExprCompiler._compile_func_name(node.func)
+        args = tuple(ExprCompiler.compile(arg) for arg in node.args)
+        keywords = tuple((keyword.arg, ExprCompiler.compile(keyword.value)) for keyword in node.keywords)
+
+        def call(elem_container):
+            name = func_name(elem_container)
+            arg_objs = [arg(elem_container) for arg in args]
+            keyword_dict = {arg_name: value(elem_container).value for arg_name, value in keywords}
+
+            return CallExpr.parse(name, arg_objs, keyword_dict, elem_container)
+
+        return call
+
+    @staticmethod
+    def _compile_func_name(node: ast.AST):
+        if isinstance(node, ast.Name):
+            func_name = node.id
+            return lambda elem_container: func_name
+
+        elif isinstance(node, ast.Attribute):
+            return ExprCompiler.compile(node)
+
+        # ExprTraveler.get_func_name이 실행 시점에 같은 TypeError를 발생시킴
+        return lambda elem_container: ExprTraveler.get_func_name(node, elem_container)
+
+    @staticmethod
+    def _compile_list(node: ast.List):
+        elts = tuple(ExprCompiler.compile(elt) for elt in node.elts)
+
+        return lambda elem_container: ListExpr.parse([elt(elem_container) for elt in elts])
+
+    @staticmethod
+    def _compile_tuple(node: ast.Tuple):
+        elts = tuple(ExprCompiler.compile(elt) for elt in node.elts)
+
+        return lambda elem_container: TupleExpr.parse([elt(elem_container) for elt in elts])
+
+    @staticmethod
+    def _compile_dict(node: ast.Dict):
+        keys = tuple(ExprCompiler.compile(key) for key in node.keys)
+        values = tuple(ExprCompiler.compile(value) for value in node.values)
+
+        def dict_(elem_container):
+            key_objs = [key(elem_container) for key in keys]
+            value_objs = [value(elem_container) for value in values]
+
+            return DictExpr.parse(key_objs, value_objs)
+
+        return dict_
+
+    @staticmethod
+    def _compile_compare(node: ast.Compare):
+        left = ExprCompiler._compile_compare_operand(node.left)
+        comparators = tuple(ExprCompiler._compile_compare_operand(comparator) for comparator in node.comparators)
+        ops = tuple(node.ops)
+
+        def compare(elem_container):
+            left_obj = left(elem_container)
+            comparator_objs = tuple(comparator(elem_container) for comparator in comparators)
+
+            return CompareExpr.parse(left_obj, comparator_objs, ops)
+
+        return compare
+
+    @staticmethod
+    def _compile_compare_operand(node: ast.AST):
+        if ExprTraveler.is_compare_operand(node):
+            return ExprCompiler.compile(node)
+
+        # ExprTraveler.compare_travel이 실행 시점에 같은 TypeError를 발생시킴
+        return lambda elem_container: ExprTraveler.compare_travel(node, elem_container)
+
+    @staticmethod
+    def _compile_subscript(node: ast.Subscript):
+        if isinstance(node.ctx, ast.Store):
+            return ExprCompiler._compile_subscript_target(node)
+
+        target = ExprCompiler.compile(node.value)
+        slice_ = ExprCompiler.compile(node.slice)
+        ctx = node.ctx
+
+        def subscript(elem_container):
+            target_obj = target(elem_container)
+            slice_obj = slice_(elem_container)
+
+            return SubscriptExpr.parse(target_obj, slice_obj, ctx)
+
+        return subscript
+
+    @staticmethod
+    def _compile_subscript_target(node: ast.Subscript):
+        name_node, slice_nodes = SubscriptExpr.split_target(node)
+        name = ExprCompiler.compile(name_node)
+        slices = [ExprCompiler.compile(slice_node) for slice_node in slice_nodes]
+
+        def subscript_target(elem_container):
+            name_obj = name(elem_container)
+            slice_objs = [slice_(elem_container) for slice_ in slices]
+
+            return SubscriptExpr.parse_target(name_obj, slice_objs)
+
+        return subscript_target
+
+    @staticmethod
+    def _compile_slice(node: ast.Slice):
+        lower = ExprCompiler.compile(node.lower) if node.lower else None
+        upper = ExprCompiler.compile(node.upper) if node.upper else None
+        step = ExprCompiler.compile(node.step) if node.step else None
+
+        def slice_(elem_container):
+            lower_obj = lower(elem_container) if lower else None
+            upper_obj = upper(elem_container) if upper else None
+            step_obj = step(elem_container) if step else None
+
+            return SliceExpr.parse(lower_obj, upper_obj, step_obj)
+
+        return slice_
+
+    @staticmethod
+    def _compile_attribute(node: ast.Attribute):
+        target = ExprCompiler.compile(node.value)
+        attr_name = node.attr
+
+        return lambda elem_container: AttributeExpr.parse(target(elem_container), attr_name)
+
+    @staticmethod
+    def _compile_unary_op(node: ast.UnaryOp):
+        operand = ExprCompiler.compile(node.operand)
+        op = node.op
+
+        return lambda elem_container: UnaryOpExpr.parse(op, operand(elem_container))
+
+    @staticmethod
+    def _compile_formatted_value(node: ast.FormattedValue):
+        value = ExprCompiler.compile(node.value)
+        format_spec = ExprCompiler.compile(node.format_spec) if node.format_spec else None
+        conversion = node.conversion
+
+        def formatted_value(elem_container):
+            value_obj = value(elem_container)
+            joined_str_obj = format_spec(elem_container) if format_spec else None
+
+            return FormattedValueExpr.parse(value_obj, conversion, joined_str_obj)
+
+        return formatted_value
+
+    @staticmethod
+    def _compile_joined_str(node: ast.JoinedStr):
+        values = tuple(ExprCompiler.compile(value) for value in node.values)
+
+        return lambda elem_container: JoinedStrExpr.parse([value(elem_container) for value in values])
+
+    @staticmethod
+    def _compile_arguments(node: ast.arguments):
+        return lambda elem_container: ArgumentsExpr.parse(node)
+
+
+# node 타입별 closure 생성 함수, ExprTraveler의 _EXPR_HANDLERS와 같은 node 타입을 처리
+_EXPR_COMPILERS = {
+    ast.BinOp: ExprCompiler._compile_binop,
+    ast.Name: ExprCompiler._compile_name,
+    ast.Constant: ExprCompiler._compile_constant,
+    ast.Call: ExprCompiler._compile_call,
+    ast.List: ExprCompiler._compile_list,
+    ast.Tuple: ExprCompiler._compile_tuple,
+    ast.Dict: ExprCompiler._compile_dict,
+    ast.Compare: ExprCompiler._compile_compare,
+    ast.Subscript: ExprCompiler._compile_subscript,
+    ast.Slice: ExprCompiler._compile_slice,
+    ast.Attribute: ExprCompiler._compile_attribute,
+    ast.UnaryOp: ExprCompiler._compile_unary_op,
+    ast.FormattedValue: ExprCompiler._compile_formatted_value,
+    ast.JoinedStr: ExprCompiler._compile_joined_str,
+    ast.arguments: ExprCompiler._compile_arguments,
+}
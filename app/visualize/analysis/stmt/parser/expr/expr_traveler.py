@@ -16,6 +16,7 @@ from app.visualize.analysis.stmt.parser.expr.parser.slice_expr import SliceExpr
 from app.visualize.analysis.stmt.parser.expr.parser.subscript_expr import SubscriptExpr
 from app.visualize.analysis.stmt.parser.expr.parser.tuple_expr import TupleExpr
 from app.visualize.analysis.stmt.parser.expr.parser.unary_op_expr import UnaryOpExpr
+from app.visualize.analysis.stmt.parser.expr.static_expr import StaticExpr
 from app.visualize.container.element_container import ElementContainer
 
 
@@ -23,95 +24,77 @@ class ExprTraveler:
 
     @staticmethod
     def travel(node: ast, elem_container: ElementContainer) -> ExprObj:
-        if isinstance(node, ast.BinOp):
-            return ExprTraveler._binop_travel(node, elem_container)
+        # ExprCompiler로 미리 만들어 둔 closure가 있으면 node 타입 분기 없이 실행
+        compiled = ExprTraveler.get_compiled(node)
+        if compiled is not None:
+            return compiled(elem_container)
 
-        elif isinstance(node, ast.Name):
-            return ExprTraveler._name_travel(node, elem_container)
+        handler = _EXPR_HANDLERS.get(type(node))
 
-        elif isinstance(node, ast.Constant):
-            return ExprTraveler._constant_travel(node)
-
-        elif isinstance(node, ast.Call):
-            return ExprTraveler._call_travel(node, elem_container)
-
-        elif isinstance(node, ast.List):
-            return ExprTraveler._list_travel(node, elem_container)
-
-        elif isinstance(node, ast.Tuple):
-            return ExprTraveler._tuple_travel(node, elem_container)
-
-        elif isinstance(node, ast.Dict):
-            return ExprTraveler._dict_travel(node, elem_container)
-
-        elif isinstance(node, ast.Compare):
-            compare_obj = ExprTraveler._compare_travel(node, elem_container)
-            return compare_obj
-
-        elif isinstance(node, ast.Subscript):
-            subscript_obj = ExprTraveler._subscript_travel(node, elem_container)
-            return subscript_obj
-
-        elif isinstance(node, ast.Slice):
-            slice_obj = ExprTraveler._slice_travel(node, elem_container)
-            return slice_obj
+        if handler is None:
+            raise TypeError(f"[ExprTraveler] {type(node)}는 잘못된 타입입니다.")
 
-        elif isinstance(node, ast.Attribute):
-            attribute_obj = ExprTraveler._attribute_travel(node, elem_container)
-            return attribute_obj
+        return handler(node, elem_container)
 
-        elif isinstance(node, ast.UnaryOp):
-            unary_op_obj = ExprTraveler._unary_op_travel(node, elem_container)
-            return unary_op_obj
+    # 새로운 expr node를 분석할 handler(node, elem_container) 등록
+    @staticmethod
+    def register(node_type: type, handler):
+        _EXPR_HANDLERS[node_type] = handler
 
-        elif isinstance(node, ast.FormattedValue):
-            formatted_value_obj = ExprTraveler._formatted_value_travel(node, elem_container)
-            return formatted_value_obj
+    # ExprCompiler가 node에 붙여 둔 closure, 없으면 None
+    @staticmethod
+    def get_compiled(node: ast.AST):
+        return getattr(node, _COMPILED_EXPR_ATTR, None)
 
-        elif isinstance(node, ast.JoinedStr):
-            joined_str_obj = ExprTraveler._joined_str_travel(node, elem_container)
-            return joined_str_obj
+    @staticmethod
+    def set_compiled(node: ast.AST, compiled):
+        setattr(node, _COMPILED_EXPR_ATTR, compiled)
 
-        elif isinstance(node, ast.arguments):
-            arguments_obj = ExprTraveler._arguments_travel(node)
-            return arguments_obj
+    # 연산식(BinOp)의 피연산자로 분석할 수 있는 node인지
+    @staticmethod
+    def is_binop_operand(node: ast.AST) -> bool:
+        return type(node) is ast.BinOp or type(node) in _BINOP_OPERAND_TYPES
 
-        else:
-            raise TypeError(f"[ExprTraveler] {type(node)}는 잘못된 타입입니다.")
+    # 비교식(Compare)의 피연산자로 분석할 수 있는 node인지
+    @staticmethod
+    def is_compare_operand(node: ast.AST) -> bool:
+        return type(node) is ast.Compare or type(node) in _COMPARE_OPERAND_TYPES
 
+    # 연산식과 피연산자 분석, 피연산자가 될 수 없는 node는 TypeError
     @staticmethod
-    def _binop_travel(node: ast, elem_container: ElementContainer):
-        if isinstance(node, ast.BinOp):
-            left = ExprTraveler._binop_travel(node.left, elem_container)
-            right = ExprTraveler._binop_travel(node.right, elem_container)
+    def binop_travel(node: ast, elem_container: ElementContainer):
+        if type(node) is ast.BinOp:
+            left = ExprTraveler.binop_travel(node.left, elem_container)
+            right = ExprTraveler.binop_travel(node.right, elem_container)
             op = node.op
             return BinopExpr.parse(left, right, op)
 
-        elif isinstance(node, ast.Name):
-            return ExprTraveler._name_travel(node, elem_container)
-
-        elif isinstance(node, ast.Constant):
-            return ExprTraveler._constant_travel(node)
-
-        elif isinstance(node, ast.Subscript):
-            return ExprTraveler._subscript_travel(node, elem_container)
+        elif type(node) in _BINOP_OPERAND_TYPES:
+            return ExprTraveler.travel(node, elem_container)
 
-        elif isinstance(node, ast.Call):
-            return ExprTraveler._call_travel(node, elem_container)
         else:
             raise TypeError(f"[ExprTraveler - binop parsing 중  {type(node)}는 잘못된 타입입니다.")
 
     @staticmethod
     def _name_travel(node: ast.Name, elem_container: ElementContainer):
+        # 할당 대상 이름은 미리 만든 분석 객체를 사용
+        static_obj = StaticExpr.get(node)
+        if static_obj is not None:
+            return static_obj
+
         return NameExpr.parse(node, elem_container)
 
     @staticmethod
     def _constant_travel(node: ast.Constant):
+        static_obj = StaticExpr.get(node)
+        if static_obj is not None:
+            return static_obj
+
         return ConstantExpr.parse(node)
 
     @staticmethod
     def _call_travel(node: ast.Call, elem_container: ElementContainer):
-        func_name = ExprTraveler._get_func_name(node.func, elem_container)
+        func_name = ExprTraveler.get_func_name(node.func, elem_container)
         args = [ExprTraveler.travel(arg, elem_container) for arg in node.args]
         keyword_dict = {
             keyword.arg: ExprTraveler.travel(keyword.value, elem_container).value for keyword in node.keywords
@@ -136,31 +119,24 @@ class ExprTraveler:
 
         return DictExpr.parse(keys, values)
 
+    # 비교식과 피연산자 분석, 피연산자가 될 수 없는 node는 TypeError
     @staticmethod
-    def _compare_travel(node: ast, elem_container: ElementContainer):
-        if isinstance(node, ast.Compare):
-            left = ExprTraveler._compare_travel(node.left, elem_container)
-            comparators = tuple(ExprTraveler._compare_travel(comparor, elem_container) for comparor in node.comparators)
+    def compare_travel(node: ast, elem_container: ElementContainer):
+        if type(node) is ast.Compare:
+            left = ExprTraveler.compare_travel(node.left, elem_container)
+            comparators = tuple(ExprTraveler.compare_travel(comparor, elem_container) for comparor in node.comparators)
 
             return CompareExpr.parse(left, tuple(comparators), tuple(node.ops))
 
-        elif isinstance(node, ast.BinOp):
-            return ExprTraveler.travel(node, elem_container)
-
-        elif isinstance(node, ast.Name):
-            return ExprTraveler.travel(node, elem_container)
-
-        elif isinstance(node, ast.Constant):
-            return ExprTraveler.travel(node, elem_container)
-
-        elif isinstance(node, ast.Subscript):
+        elif type(node) in _COMPARE_OPERAND_TYPES:
             return ExprTraveler.travel(node, elem_container)
 
         else:
             raise TypeError(f"[ExprTraveler - compare parsing 중  {type(node)}는 잘못된 타입입니다.")
 
+    # 호출하는 함수의 이름, 메서드 호출은 AttributeExpr 분석 결과
     @staticmethod
-    def _get_func_name(node: ast, elem_container: ElementContainer):
+    def get_func_name(node: ast, elem_container: ElementContainer):
         if isinstance(node, ast.Name):
             return node.id
 
@@ -172,6 +148,13 @@ class ExprTraveler:
 
     @staticmethod
     def _subscript_travel(node: ast.Subscript, elem_container: ElementContainer):
+        if isinstance(node.ctx, ast.Store):
+            name_node, slice_nodes = SubscriptExpr.split_target(node)
+            name_obj = ExprTraveler.travel(name_node, elem_container)
+            slice_objs = [ExprTraveler.travel(slice_node, elem_container) for slice_node in slice_nodes]
+
+            return SubscriptExpr.parse_target(name_obj, slice_objs)
+
         target_obj = ExprTraveler.travel(node.value, elem_container)
         slice_obj = ExprTraveler.travel(node.slice, elem_container)
 
@@ -217,3 +200,30 @@ class ExprTraveler:
         arguments_obj = ArgumentsExpr.parse(node)
 
         return arguments_obj
+
+
+# ExprCompiler가 만든 closure를 저장하는 node 속성 이름
+_COMPILED_EXPR_ATTR = "_viz_compiled_expr"
+
+# node 타입별 분석 함수, 호출 시점에 ExprTraveler의 함수를 찾도록 lambda로 감쌈
+_EXPR_HANDLERS = {
+    ast.BinOp: lambda node, elem_container: ExprTraveler.binop_travel(node, elem_container),
+    ast.Name: lambda node, elem_container: ExprTraveler._name_travel(node, elem_container),
+    ast.Constant: lambda node, elem_container: ExprTraveler._constant_travel(node),
+    ast.Call: lambda node, elem_container: ExprTraveler._call_travel(node, elem_container),
+    ast.List: lambda node, elem_container: ExprTraveler._list_travel(node, elem_container),
+    ast.Tuple: lambda node, elem_container: ExprTraveler._tuple_travel(node, elem_container),
+    ast.Dict: lambda node, elem_container: ExprTraveler._dict_travel(node, elem_container),
+    ast.Compare: lambda node, elem_container: ExprTraveler.compare_travel(node, elem_container),
+    ast.Subscript: lambda node, elem_container: ExprTraveler._subscript_travel(node, elem_container),
+    ast.Slice: lambda node, elem_container: ExprTraveler._slice_travel(node, elem_container),
+    ast.Attribute: lambda node, elem_container: ExprTraveler._attribute_travel(node, elem_container),
+    ast.UnaryOp: lambda node, elem_container: ExprTraveler._unary_op_travel(node, elem_container),
+    ast.FormattedValue: lambda node, elem_container: ExprTraveler._formatted_value_travel(node, elem_container),
+    ast.JoinedStr: lambda node, elem_container: ExprTraveler._joined_str_travel(node, elem_container),
+    ast.arguments: lambda node, elem_container: ExprTraveler._arguments_travel(node),
+}
+
+# 연산식의 피연산자로 올 수 있는 node 타입
+_BINOP_OPERAND_TYPES = frozenset({ast.Name, ast.Constant, ast.Subscript, ast.Call})
+_COMPARE_OPERAND_TYPES = frozenset({ast.BinOp, ast.Name, ast.Constant, ast.Subscript})
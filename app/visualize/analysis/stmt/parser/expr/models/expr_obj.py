@@ -7,173 +7,179 @@ from app.visualize.analysis.stmt.parser.expr.models.range_expression import Rang
 from app.visualize.analysis.stmt.parser.expr.models.slice_expression import SliceExpression
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExprObj:
     value: Any
     expressions: tuple
     type: ExprType
+    # 마지막 표현식이 나타내는 값의 타입(list, tuple, dict, variable), 지정하지 않으면 value로 판단
+    value_type: ExprType = field(default=None, kw_only=True)
 
+    def __post_init__(self):
+        if self.value_type is None:
+            object.__setattr__(self, "value_type", ExprType.judge_collection_type(self.value))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BinopObj(ExprObj):
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.VARIABLE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompareObj(ExprObj):
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.COMPARE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConstantObj(ExprObj):
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.VARIABLE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NameObj(ExprObj):
     expressions: tuple[str, ...]
     type: ExprType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListObj(ExprObj):
     value: list
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.LIST, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TupleObj(ExprObj):
     value: tuple
-    expressions = tuple[str, ...]
+    expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.TUPLE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DictObj(ExprObj):
     value: dict
-    expressions = tuple[str, ...]
+    expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.DICT, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CallObj(ExprObj):
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.CALL, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RangeObj(CallObj):
     value: tuple
     expressions: tuple[RangeExpression, ...]
     type: ExprType = field(default=ExprType.RANGE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrintObj(CallObj):
     value: str
     type: ExprType = field(default=ExprType.PRINT, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InputObj(CallObj):
     value: str
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.INPUT, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuiltinObj(ExprObj):
-    value = str
+    value: Any
     expressions: tuple[str, ...]
     type: ExprType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LenObj(CallObj):
     value: int
     type: ExprType = field(default=ExprType.LEN, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubscriptObj(ExprObj):
-    expressions = tuple[str, ...]
+    expressions: tuple[str, ...]
     type: ExprType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SliceObj(ExprObj):
     value: slice
-    expressions = tuple[SliceExpression, ...]
+    expressions: tuple[SliceExpression, ...]
     type: ExprType = field(default=ExprType.SLICE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttributeObj(ExprObj):
     expressions: tuple[str, ...]
     type: ExprType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppendObj(AttributeObj):
     value: str
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.APPEND, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RemoveObj(AttributeObj):
     value: str
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.REMOVE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtendObj(AttributeObj):
     value: str
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.EXTEND, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PopObj(AttributeObj):
     value: str
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.POP, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InsertObj(AttributeObj):
     value: str
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.INSERT, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FormattedValueObj(ExprObj):
     value: str
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.VARIABLE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArgumentsObj(ExprObj):
     value: tuple[str, ...]
     expressions: tuple[str, ...]
     type: ExprType = field(default=ExprType.VARIABLE, init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserFunc:
     name: str
     user_func_ast: ast
     arguments: dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserFuncObj(ExprObj):
     value: UserFunc
     expressions: tuple[str, ...]
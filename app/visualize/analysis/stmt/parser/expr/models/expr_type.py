@@ -34,15 +34,9 @@ class ExprType(Enum):
     FUNC = "function"
     USER_FUNC = "user_function"
 
+    # 분석 중에 얻은 실제 값으로 타입을 판단 (문자열을 eval 하지 않음)
     @staticmethod
     def judge_collection_type(value):
-        if isinstance(value, str):
-            try:
-                value = eval(value)
-                ExprType.judge_collection_type(value)
-            except (SyntaxError, NameError):
-                value = value  # 그냥 문자열이 들어오는 경우
-
         if isinstance(value, list):
             return ExprType.LIST
 
@@ -1,8 +1,15 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RangeExpression:
     start: str
     end: str
     step: str
+
+    # range(3)을 값으로 출력하는 경우 range(0, 3)로 표시
+    def __str__(self):
+        if self.step == "1":
+            return f"range({self.start}, {self.end})"
+
+        return f"range({self.start}, {self.end}, {self.step})"
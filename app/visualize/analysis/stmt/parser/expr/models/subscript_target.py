@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+# a[i][j] = v 처럼 subscript에 할당하는 target
+# 분석할 때 찾은 변수 값(root)과 index 값을 그대로 가지고 있어서, 저장할 때 문자열을 다시 해석하지 않는다.
+@dataclass(frozen=True, slots=True)
+class SubscriptTarget:
+    name: str  # 변수 이름 (a)
+    root: Any  # 변수 값 (list, dict)
+    indices: tuple  # root부터 차례로 접근하는 index, int, dict key 또는 slice (i, j)
+    # 중첩된 target에서 할당한 뒤의 첫 번째 요소 (a[i]), 시각화에 사용
+    element_expr: str | None = None
+
+    def get_collection(self):
+        collection = self.root
+        for index in self.indices[:-1]:
+            collection = collection[index]
+
+        return collection
+
+    def is_nested(self):
+        return len(self.indices) > 1
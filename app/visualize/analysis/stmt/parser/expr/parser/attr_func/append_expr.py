@@ -14,7 +14,7 @@ class AppendExpr:
         value = AppendExpr._get_value(attr_obj)
         expressions = AppendExpr._create_expressions(args[0])
 
-        return AppendObj(value=value, expressions=expressions)
+        return AppendObj(value=value, expressions=expressions, value_type=args[0].value_type)
 
     @staticmethod
     def _append_value(attr_obj: AttributeObj, arg: ExprObj):
@@ -14,7 +14,7 @@ class ExtendExpr:
         value = ExtendExpr._get_value(attr_obj)
         expressions = ExtendExpr._create_expressions(args[0])
 
-        return ExtendObj(value=value, expressions=expressions)
+        return ExtendObj(value=value, expressions=expressions, value_type=args[0].value_type)
 
     @staticmethod
     def _extend_value(attr_obj: AttributeObj, arg: ExprObj):
@@ -1,4 +1,5 @@
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, AttributeObj, PopObj
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class PopExpr:
@@ -29,5 +30,5 @@ class PopExpr:
     def _create_expressions(target, return_value):
         return (
             target,
-            str(return_value),
+            ValueRenderer.render(return_value),
         )
@@ -15,7 +15,7 @@ class RemoveExpr:
         value = RemoveExpr._get_value(attr_obj)
         expressions = RemoveExpr._create_expressions(args[0])
 
-        return RemoveObj(value=value, expressions=expressions)
+        return RemoveObj(value=value, expressions=expressions, value_type=args[0].value_type)
 
     @staticmethod
     def _remove_value(attr_obj: AttributeObj, arg: ExprObj):
@@ -1,7 +1,10 @@
 import ast
+import operator
 
+from app.visualize.analysis.stmt.parser.expr.arithmetic_guard import ArithmeticGuard
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, BinopObj
 from app.visualize.utils import utils
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class BinopExpr:
@@ -13,32 +16,12 @@ class BinopExpr:
 
         return BinopObj(value=value, expressions=expressions)
 
-    # 왼쪽 오른쪽 값으로 연산식 계산
+    # 왼쪽 오른쪽 값으로 연산식 계산, 결과가 너무 큰 연산은 계산하기 전에 거절
     @staticmethod
     def _calculate_value(left_value, right_value, op: ast):
-        if isinstance(op, ast.Add):
-            return left_value + right_value
-
-        elif isinstance(op, ast.Sub):
-            return left_value - right_value
-
-        elif isinstance(op, ast.Mult):
-            return left_value * right_value
-
-        elif isinstance(op, ast.Div):  # '/'
-            return left_value / right_value  # 실수로 계산
-
-        elif isinstance(op, ast.FloorDiv):  # '//'
-            return left_value // right_value  # 정수로 계산
-
-        elif isinstance(op, ast.Mod):
-            return left_value % right_value
-
-        elif isinstance(op, ast.Pow):
-            return pow(left_value, right_value)
-
-        else:
-            raise TypeError(f"[BinopExpr] {type(op)}는 잘못된 타입입니다.")
+        calculate, _ = BinopExpr._get_operator(op)
+        ArithmeticGuard.check_binop(type(op), left_value, right_value)
+        return calculate(left_value, right_value)
 
     # 1 + 2
     # a + 2
@@ -53,34 +36,34 @@ class BinopExpr:
             total_expressions[i] = BinopExpr._concat_expression(total_expressions[i][0], total_expressions[i][1], op)
 
         if isinstance(value, str):
-            total_expressions.append(f"'{value}'")
+            total_expressions.append(f"'{ValueRenderer.render(value)}'")
         else:
-            total_expressions.append(str(value))
+            total_expressions.append(ValueRenderer.render(value))
 
         return tuple(total_expressions)
 
     @staticmethod
     def _concat_expression(left_expression, right_expression, op: ast):
-        if isinstance(op, ast.Add):
-            return f"{left_expression} + {right_expression}"
-
-        elif isinstance(op, ast.Sub):
-            return f"{left_expression} - {right_expression}"
+        _, symbol = BinopExpr._get_operator(op)
+        return f"{left_expression} {symbol} {right_expression}"
 
-        elif isinstance(op, ast.Mult):
-            return f"{left_expression} * {right_expression}"
-
-        elif isinstance(op, ast.Div):
-            return f"{left_expression} / {right_expression}"
+    @staticmethod
+    def _get_operator(op: ast):
+        operator_info = _OPERATORS.get(type(op))
 
-        elif isinstance(op, ast.FloorDiv):
-            return f"{left_expression} // {right_expression}"
+        if operator_info is None:
+            raise TypeError(f"[BinopExpr] {type(op)}는 잘못된 타입입니다.")
 
-        elif isinstance(op, ast.Mod):
-            return f"{left_expression} % {right_expression}"
+        return operator_info
 
-        elif isinstance(op, ast.Pow):
-            return f"{left_expression} ** {right_expression}"
 
-        else:
-            raise TypeError(f"[BinopExpr] {type(op)}는 잘못된 타입입니다.")
+# 연산자 타입 : (계산 함수, 연산자 기호)
+_OPERATORS = {
+    ast.Add: (operator.add, "+"),
+    ast.Sub: (operator.sub, "-"),
+    ast.Mult: (operator.mul, "*"),
+    ast.Div: (operator.truediv, "/"),  # 실수로 계산
+    ast.FloorDiv: (operator.floordiv, "//"),  # 정수로 계산
+    ast.Mod: (operator.mod, "%"),
+    ast.Pow: (operator.pow, "**"),
+}
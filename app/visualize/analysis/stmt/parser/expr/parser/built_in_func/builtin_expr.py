@@ -1,8 +1,10 @@
+import ast
 import builtins
 
+from app.visualize.analysis.stmt.parser.expr.arithmetic_guard import ArithmeticGuard
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, BuiltinObj
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
-from app.visualize.utils import utils
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class BuiltinExpr:
@@ -12,41 +14,57 @@ class BuiltinExpr:
         value = BuiltinExpr._get_value(func_name, args)
         expressions = BuiltinExpr._create_expressions(func_name, args, value)
 
-        var_type = utils.getStringType(value)
-        if var_type == "variable":
-            return BuiltinObj(value=value, expressions=expressions, type=ExprType(var_type))
+        var_type = ExprType.judge_collection_type(value)
+        if var_type is ExprType.VARIABLE:
+            return BuiltinObj(value=value, expressions=expressions, type=var_type)
 
-        elif var_type in {"tuple", "dict", "list"}:
-            return BuiltinObj(value=value, expressions=(expressions[-1],), type=ExprType(var_type))
+        elif var_type in (ExprType.TUPLE, ExprType.DICT, ExprType.LIST):
+            return BuiltinObj(value=value, expressions=(expressions[-1],), type=var_type)
 
         else:
             raise TypeError(f"[BuiltinExpr]:{var_type}는 지원하지 않습니다.")
 
     @staticmethod
     def is_builtin_func(func_name):
-        if func_name in dir(builtins) and callable(getattr(builtins, func_name)):
-            return True
-        else:
-            return False
+        return func_name in _BUILTIN_FUNC_NAMES
+
+    @staticmethod
+    def get_builtin_func_names():
+        return _BUILTIN_FUNC_NAMES
 
     @staticmethod
     def _get_value(func_name, args):
         func = getattr(builtins, func_name)
         values = [arg.value for arg in args]
 
+        # pow(a, b)는 a ** b와 같은 비용, pow(a, b, m)은 결과가 m보다 작으므로 검사하지 않음
+        if func_name == "pow" and len(values) == 2:
+            ArithmeticGuard.check_binop(ast.Pow, *values)
+
         try:
             return func(*values)
 
         except Exception as e:
-            NotImplementedError(f"[BuiltinExpr]:{func_name}은 지원하지 않습니다.")
+            raise NotImplementedError(f"[BuiltinExpr]:{func_name}은 지원하지 않습니다.") from e
 
     @staticmethod
     def _create_expressions(func_name: str, args: list[ExprObj], value):
         expressions = []
         if args:
-            expressions.append(f"{func_name}({', '.join(repr(arg.value) for arg in args)})")
+            expressions.append(f"{func_name}({', '.join(ValueRenderer.render_repr(arg.value) for arg in args)})")
         else:
             expressions.append("")
 
-        expressions.append(str(value))
+        expressions.append(ValueRenderer.render(value))
         return tuple(expressions)
+
+
+# 분석할 수 있는 builtin 함수 이름, 파일, import, 코드 실행, 객체 내부에 접근하는 함수(open, eval, getattr 등)는 제외
+# list, print, range, input, len은 CallExpr에서 따로 분석하고, 나머지는 인자로 값만 계산하는 함수
+_BUILTIN_FUNC_NAMES = frozenset(
+    (
+        "list", "print", "range", "input", "len",
+        "abs", "all", "any", "bin", "bool", "chr", "divmod", "float", "hex", "int", "max", "min", "oct", "ord", "pow",
+        "round", "sorted", "str", "sum",
+    )
+)  # fmt: skip
@@ -1,5 +1,6 @@
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, PrintObj
 from app.visualize.utils import utils
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class PrintExpr:
@@ -31,15 +32,16 @@ class PrintExpr:
         print_expressions = []
 
         for expressions in transposed_expressions:
-            str_expression = key_word_dict["sep"].join(expressions)
+            str_expression = key_word_dict["sep"].join(map(str, expressions))
             print_expressions.append(str_expression)
 
         return tuple(print_expressions) if print_expressions else ("",)
 
+    # 출력 결과도 응답에 담기므로 값을 str() 대신 ValueRenderer로 만들어 길이를 제한
     @staticmethod
     def _get_value(args: list[ExprObj], key_word_dict: dict):
-        arg_values = [str(arg.value) for arg in args]
+        arg_values = [ValueRenderer.render(arg.value) for arg in args]
 
-        str_expression = key_word_dict["sep"].join(arg_values)
+        str_expression = ValueRenderer.clip(key_word_dict["sep"].join(arg_values))
 
         return str_expression + key_word_dict["end"]
@@ -32,7 +32,8 @@ class RangeExpr:
         else:
             raise TypeError(f"[CallParser]: {arg_value_list} 인자의 개수가 잘못되었습니다.")
 
-        return tuple(range(int(start), int(end), int(step)))
+        # 값을 미리 만들지 않는 range 객체 (길이, 인덱싱, 반복 모두 상수 메모리로 동작)
+        return range(int(start), int(end), int(step))
 
     @staticmethod
     def _create_expressions(args_expressions: list[tuple]):
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, AttributeObj
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 from app.visualize.analysis.stmt.parser.expr.parser.attr_func.append_expr import AppendExpr
@@ -25,7 +27,7 @@ class CallExpr:
             return CallExpr._string_call_parse(func_name, args, keyword_arg_dict, elem_container)
 
         elif isinstance(func_name, AttributeObj):
-            return CallExpr._attribute_call_parse(func_name, args)
+            return CallExpr._attribute_call_parse(func_name, args, elem_container)
 
     @staticmethod
     def _string_call_parse(
@@ -45,38 +47,17 @@ class CallExpr:
     def _built_in_call_parse(
         func_name: str, args: list[ExprObj], keyword_arg_dict: dict, elem_container: ElementContainer
     ):
-        if not BuiltinExpr.is_builtin_func(func_name):
-            raise NotImplementedError(f"[CallParser]: {func_name} 은 아직 지원하지 않습니다.")
-
-        if all(func_name != item.value for item in ExprType):
-            common_obj = BuiltinExpr.parse(func_name, args)
-            return common_obj
-
-        if ExprType(func_name) is ExprType.LIST:
-            list_obj = ListExpr.parse(args)
-            return list_obj
-
-        if ExprType(func_name) is ExprType.PRINT:
-            print_obj = PrintExpr.parse(args, keyword_arg_dict)
-            return print_obj
+        handler = _BUILTIN_HANDLERS.get(func_name)
 
-        elif ExprType(func_name) is ExprType.RANGE:
-            range_obj = RangeExpr.parse(args)
-            return range_obj
-
-        elif ExprType(func_name) is ExprType.INPUT:
-            input_obj = InputExpr.parse(args, elem_container)
-            return input_obj
-
-        elif ExprType(func_name) is ExprType.LEN:
-            len_obj = LenExpr.parse(args)
-            return len_obj
-
-        else:
+        if handler is None:
             raise NotImplementedError(f"[CallParser]: {func_name} 은 아직 지원하지 않습니다.")
 
+        return handler(func_name, args, keyword_arg_dict, elem_container)
+
     @staticmethod
-    def _attribute_call_parse(attr_obj: AttributeObj, args: list[ExprObj]):
+    def _attribute_call_parse(attr_obj: AttributeObj, args: list[ExprObj], elem_container: ElementContainer):
+        # 지원하는 함수는 모두 list를 직접 바꾸므로, 이 list를 기록한 시각화 단계의 snapshot을 먼저 복사
+        elem_container.before_mutation(attr_obj.value.__self__)
 
         if attr_obj.type == ExprType.APPEND:
             append_obj = AppendExpr.parse(attr_obj, args)
@@ -100,3 +81,30 @@ class CallExpr:
 
         else:
             raise NotImplementedError(f"[CallParser]: {attr_obj.type} 은 아직 지원하지 않습니다.")
+
+
+# 따로 분석하는 builtin 함수, 호출 시점에 각 Expr 클래스의 함수를 찾도록 lambda로 감쌈
+_SPECIAL_BUILTIN_HANDLERS = {
+    ExprType.LIST.value: lambda func_name, args, keyword_arg_dict, elem_container: ListExpr.parse_call(args),
+    ExprType.PRINT.value: lambda func_name, args, keyword_arg_dict, elem_container: PrintExpr.parse(
+        args, keyword_arg_dict
+    ),
+    ExprType.RANGE.value: lambda func_name, args, keyword_arg_dict, elem_container: RangeExpr.parse(args),
+    ExprType.INPUT.value: lambda func_name, args, keyword_arg_dict, elem_container: InputExpr.parse(
+        args, elem_container
+    ),
+    ExprType.LEN.value: lambda func_name, args, keyword_arg_dict, elem_container: LenExpr.parse(args),
+}
+
+
+def _get_builtin_handler(func_name: str):
+    if func_name in _SPECIAL_BUILTIN_HANDLERS:
+        return _SPECIAL_BUILTIN_HANDLERS[func_name]
+
+    return lambda func_name, args, keyword_arg_dict, elem_container: BuiltinExpr.parse(func_name, args)
+
+
+# builtin 함수 이름 : 분석 함수, import 시점에 한 번 만들고 이후에는 이름으로 바로 찾음
+_BUILTIN_HANDLERS = MappingProxyType(
+    {func_name: _get_builtin_handler(func_name) for func_name in BuiltinExpr.get_builtin_func_names()}
+)
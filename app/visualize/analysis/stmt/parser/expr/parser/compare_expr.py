@@ -1,4 +1,5 @@
 import ast
+import operator
 
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, CompareObj
 from app.visualize.utils import utils
@@ -40,38 +41,8 @@ class CompareExpr:
 
     @staticmethod
     def _calculate_value(left_value, right_value, op: ast.cmpop):
-        if isinstance(op, ast.Eq):
-            return left_value == right_value
-
-        elif isinstance(op, ast.NotEq):
-            return left_value != right_value
-
-        elif isinstance(op, ast.Lt):
-            return left_value < right_value
-
-        elif isinstance(op, ast.LtE):
-            return left_value <= right_value
-
-        elif isinstance(op, ast.Gt):
-            return left_value > right_value
-
-        elif isinstance(op, ast.GtE):
-            return left_value >= right_value
-
-        elif isinstance(op, ast.Is):
-            return left_value is right_value
-
-        elif isinstance(op, ast.IsNot):
-            return left_value is not right_value
-
-        elif isinstance(op, ast.In):
-            return left_value in right_value
-
-        elif isinstance(op, ast.NotIn):
-            return left_value not in right_value
-
-        else:
-            raise TypeError(f"[compare_expr] {type(op)}는 잘못된 타입입니다.")
+        calculate, _ = CompareExpr._get_operator(op)
+        return calculate(left_value, right_value)
 
     @staticmethod
     def _create_expressions(left_obj, right_obj, op) -> tuple:
@@ -98,35 +69,29 @@ class CompareExpr:
 
     @staticmethod
     def _get_op_to_str(op: ast.cmpop):
-        if isinstance(op, ast.Eq):
-            return "=="
+        _, symbol = CompareExpr._get_operator(op)
+        return symbol
 
-        elif isinstance(op, ast.NotEq):
-            return "!="
-
-        elif isinstance(op, ast.Lt):
-            return "<"
-
-        elif isinstance(op, ast.LtE):
-            return "<="
-
-        elif isinstance(op, ast.Gt):
-            return ">"
-
-        elif isinstance(op, ast.GtE):
-            return ">="
-
-        elif isinstance(op, ast.Is):
-            return "is"
-
-        elif isinstance(op, ast.IsNot):
-            return "is not"
-
-        elif isinstance(op, ast.In):
-            return "in"
-
-        elif isinstance(op, ast.NotIn):
-            return "not in"
+    @staticmethod
+    def _get_operator(op: ast.cmpop):
+        operator_info = _OPERATORS.get(type(op))
 
-        else:
+        if operator_info is None:
             raise TypeError(f"[compare_expr] {type(op)}는 잘못된 타입입니다.")
+
+        return operator_info
+
+
+# 비교 연산자 타입 : (계산 함수, 연산자 기호)
+_OPERATORS = {
+    ast.Eq: (operator.eq, "=="),
+    ast.NotEq: (operator.ne, "!="),
+    ast.Lt: (operator.lt, "<"),
+    ast.LtE: (operator.le, "<="),
+    ast.Gt: (operator.gt, ">"),
+    ast.GtE: (operator.ge, ">="),
+    ast.Is: (operator.is_, "is"),
+    ast.IsNot: (operator.is_not, "is not"),
+    ast.In: (lambda left_value, right_value: left_value in right_value, "in"),
+    ast.NotIn: (lambda left_value, right_value: left_value not in right_value, "not in"),
+}
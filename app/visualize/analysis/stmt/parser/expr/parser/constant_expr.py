@@ -1,6 +1,7 @@
 import ast
 
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ConstantObj
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class ConstantExpr:
@@ -17,5 +18,5 @@ class ConstantExpr:
     @staticmethod
     def _create_expressions(value) -> tuple:
         if isinstance(value, str):
-            return (f"'{value}'",)
-        return (str(value),)
+            return (f"'{ValueRenderer.render(value)}'",)
+        return (ValueRenderer.render(value),)
@@ -1,6 +1,5 @@
-import json
-
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, DictObj
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class DictExpr:
@@ -25,5 +24,5 @@ class DictExpr:
 
     @staticmethod
     def _concat_expressions(value: dict):
-        expr = json.dumps(value)
+        expr = ValueRenderer.render_json(value)
         return (expr,)
@@ -1,5 +1,7 @@
-from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ListObj, ExprObj
+from app.visualize.analysis.stmt.parser.expr.arithmetic_guard import ArithmeticGuard
+from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ListObj, ExprObj, RangeObj
 from app.visualize.utils import utils
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class ListExpr:
@@ -11,6 +13,17 @@ class ListExpr:
 
         return ListObj(value=value, expressions=expressions)
 
+    # list(range(3))은 range의 요소로 list를 만듦, for문 밖에서 값으로 사용하는 range는 여기서 요소를 만듦
+    # 요소 수가 너무 많은 range는 list를 만들기 전에 거절
+    @staticmethod
+    def parse_call(args: list[ExprObj]):
+        if len(args) == 1 and isinstance(args[0], RangeObj):
+            ArithmeticGuard.check_length(len(args[0].value))
+            value = list(args[0].value)
+            return ListObj(value=value, expressions=(ValueRenderer.render(value),))
+
+        return ListExpr.parse(args)
+
     @staticmethod
     def _get_value(elts: list[ExprObj]):
         return [elt.value for elt in elts]
@@ -27,4 +40,4 @@ class ListExpr:
         transposed_expression_lists = utils.transpose_with_last_fill(elts_expression_lists)
 
         # [("a + 1", "20"), ("10 + 1", "20"), ("11", "20")] -> ("[a + 1,20]", "[10 + 1,20]", "[11,20]")
-        return tuple(f"[{', '.join(map(str, t))}]" for t in transposed_expression_lists)
+        return tuple(f"[{ValueRenderer.join(t)}]" for t in transposed_expression_lists)
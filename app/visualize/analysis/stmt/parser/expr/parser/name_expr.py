@@ -3,6 +3,7 @@ import ast
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import NameObj
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 from app.visualize.container.element_container import ElementContainer
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class NameExpr:
@@ -14,8 +15,9 @@ class NameExpr:
 
         elif isinstance(node.ctx, ast.Load):
             value = NameExpr._get_identifier_value(node.id, elem_container)
-            expressions = NameExpr._create_expressions(node.id, value)
-            return NameObj(value=value, expressions=expressions, type=ExprType.judge_collection_type(value))
+            expressions = NameExpr._create_expressions(node.id, value, elem_container)
+            value_type = ExprType.judge_collection_type(value)
+            return NameObj(value=value, expressions=expressions, type=value_type, value_type=value_type)
 
         elif isinstance(node.ctx, ast.Del):
             raise NotImplementedError(f"Unsupported node type: {type(node.ctx)}")
@@ -33,8 +35,12 @@ class NameExpr:
 
     # 변수의 변화 과정을 만들어 주는 함수
     @staticmethod
-    def _create_expressions(identifier_name, value) -> tuple:
+    def _create_expressions(identifier_name, value, elem_container: ElementContainer) -> tuple:
         if isinstance(value, str):
-            return tuple([identifier_name, f"'{value}'"])
+            return tuple([identifier_name, f"'{ValueRenderer.render(value)}'"])
 
-        return tuple([identifier_name, str(value)])
+        # 반복문에서 읽을 때마다 큰 list 전체를 다시 문자열로 만들지 않도록 container에 저장한 문자열을 사용
+        if isinstance(value, (list, tuple, dict)):
+            return tuple([identifier_name, elem_container.get_element_repr(identifier_name, value)])
+
+        return tuple([identifier_name, ValueRenderer.render(value)])
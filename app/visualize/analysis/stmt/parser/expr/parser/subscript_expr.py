@@ -6,35 +6,56 @@ from app.visualize.analysis.stmt.parser.expr.models.expr_obj import (
     SubscriptObj,
 )
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
+from app.visualize.analysis.stmt.parser.expr.models.subscript_target import SubscriptTarget
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class SubscriptExpr:
 
     @staticmethod
     def parse(target_obj: ExprObj, slice_obj: ExprObj, ctx: ast) -> SubscriptObj:
-        if isinstance(ctx, ast.Load):
-            value = SubscriptExpr._get_value(target_obj, slice_obj, ctx)
-            expressions = SubscriptExpr._create_expressions(target_obj, slice_obj, value)
+        if not isinstance(ctx, ast.Load):
+            raise TypeError(f"[StmtTraveler] {type(ctx)}는 지원하지 않는 타입입니다.")
 
-        elif isinstance(ctx, ast.Store):
-            value = SubscriptExpr._get_value(target_obj, slice_obj, ctx)
-            expressions = (value,)
+        value = SubscriptExpr._get_value(target_obj, slice_obj)
+        expressions = SubscriptExpr._create_expressions(target_obj, slice_obj, value)
 
-        else:
-            raise TypeError(f"[StmtTraveler] {type(ctx)}는 지원하지 않는 타입입니다.")
+        value_type = ExprType.judge_collection_type(value)
+        return SubscriptObj(value=value, expressions=expressions, type=value_type, value_type=value_type)
+
+    # 할당할 subscript(ast.Store)를 변수 node와 index node들로 나눔, a[i][j] -> a, [i, j]
+    @staticmethod
+    def split_target(node: ast.Subscript) -> tuple[ast.Name, list[ast.expr]]:
+        slice_nodes = []
+        while isinstance(node, ast.Subscript):
+            slice_nodes.append(node.slice)
+            node = node.value
+
+        if not isinstance(node, ast.Name):
+            raise TypeError(f"[StmtTraveler] {type(node)}의 요소에는 할당할 수 없습니다.")
 
-        return SubscriptObj(value=value, expressions=expressions, type=ExprType.judge_collection_type(value))
+        return node, slice_nodes[::-1]
 
     @staticmethod
-    def _get_value(target_obj_value: ExprObj, slice_obj_value: ExprObj, ctx: ast):
-        if isinstance(ctx, ast.Load):
-            return target_obj_value.value[slice_obj_value.value]
+    def parse_target(name_obj: ExprObj, slice_objs: list[ExprObj]) -> SubscriptObj:
+        indices = [slice_obj.value for slice_obj in slice_objs]
+        indices[0] = SubscriptExpr._fill_slice(indices[0], name_obj.value)
+        target = SubscriptTarget(name=name_obj.expressions[0], root=name_obj.value, indices=tuple(indices))
 
-        elif isinstance(ctx, ast.Store):
-            if slice_obj_value.type is ExprType.SLICE:
-                return target_obj_value.expressions[0] + str(slice_obj_value.expressions[-1])
-            else:
-                return target_obj_value.expressions[0] + "[" + str(slice_obj_value.expressions[-1]) + "]"
+        return SubscriptObj(value=target, expressions=(target.name,), type=ExprType.VARIABLE)
+
+    # a[:2] = v 처럼 생략된 범위를 할당할 때의 길이로 채움 (step이 없으면 같은 범위), 시각화할 index 범위로 사용
+    @staticmethod
+    def _fill_slice(index, collection):
+        if not isinstance(index, slice) or index.step is not None or not isinstance(collection, list):
+            return index
+
+        start, stop, _ = index.indices(len(collection))
+        return slice(start, stop)
+
+    @staticmethod
+    def _get_value(target_obj: ExprObj, slice_obj: ExprObj):
+        return target_obj.value[slice_obj.value]
 
     @staticmethod
     def _create_expressions(target_obj: ExprObj, slice_obj: ExprObj, subscript_value):
@@ -45,7 +66,7 @@ class SubscriptExpr:
         for slice_obj_expression in slice_obj.expressions:
             subscript_expressions.append(format_string.format(target_name, slice_obj_expression))
 
-        subscript_expressions.append(str(subscript_value))
+        subscript_expressions.append(ValueRenderer.render(subscript_value))
 
         return tuple(subscript_expressions)
 
@@ -1,5 +1,6 @@
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, TupleObj
 from app.visualize.utils import utils
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class TupleExpr:
@@ -27,4 +28,4 @@ class TupleExpr:
         transposed_expression_lists = utils.transpose_with_last_fill(elts_expression_lists)
 
         # [("a + 1", "20"), ("10 + 1", "20"), ("11", "20")] -> ("[a + 1, 20]", "[10 + 1, 20]", "[11, 20]")
-        return tuple(f"({', '.join(map(str, t))})" for t in transposed_expression_lists)
+        return tuple(f"({ValueRenderer.join(t)})" for t in transposed_expression_lists)
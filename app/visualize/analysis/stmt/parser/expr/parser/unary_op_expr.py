@@ -1,5 +1,7 @@
 import ast
+import operator
 
+from app.visualize.analysis.stmt.parser.expr.arithmetic_guard import ArithmeticGuard
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, ConstantObj
 
 
@@ -13,26 +15,20 @@ class UnaryOpExpr:
 
     @staticmethod
     def _get_value(op: ast, operand: ExprObj):
-        if isinstance(op, ast.Invert):
-            return ~operand.value
-        elif isinstance(op, ast.Not):
-            return not operand.value
-        elif isinstance(op, ast.UAdd):
-            return +operand.value
-        elif isinstance(op, ast.USub):
-            return -operand.value
+        calculate, _ = _OPERATORS[type(op)]
+        ArithmeticGuard.check_unary_op(type(op), operand.value)
+        return calculate(operand.value)
 
     @staticmethod
     def _concat_expressions(op: ast, operand: ExprObj):
-        expressions = []
+        _, symbol = _OPERATORS[type(op)]
+        return tuple(f"{symbol}{expression}" for expression in operand.expressions)
 
-        for expression in operand.expressions:
-            if isinstance(op, ast.Invert):
-                expressions.append(f"~{expression}")
-            elif isinstance(op, ast.Not):
-                expressions.append(f"not {expression}")
-            elif isinstance(op, ast.UAdd):
-                expressions.append(f"+{expression}")
-            elif isinstance(op, ast.USub):
-                expressions.append(f"-{expression}")
-        return tuple(expressions)
+
+# 단항 연산자 타입 : (계산 함수, 연산자 기호)
+_OPERATORS = {
+    ast.Invert: (operator.invert, "~"),
+    ast.Not: (operator.not_, "not "),
+    ast.UAdd: (operator.pos, "+"),
+    ast.USub: (operator.neg, "-"),
+}
@@ -0,0 +1,36 @@
+import ast
+
+from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, NameObj
+from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
+from app.visualize.analysis.stmt.parser.expr.parser.constant_expr import ConstantExpr
+
+# 미리 만든 분석 객체를 저장하는 node 속성 이름
+_STATIC_EXPR_OBJ_ATTR = "_viz_static_expr_obj"
+
+
+# 분석 전에 코드 전체 node를 한 번 훑어서, 언제 분석해도 결과가 같은 node의 분석 객체를 node에 미리 붙여두는 클래스
+# 반복문 body처럼 같은 node를 여러 번 분석할 때 상수(ast.Constant)와 할당 대상 이름(ast.Name, ast.Store)을 다시 만들지 않는다.
+class StaticExpr:
+
+    @staticmethod
+    def attach(tree: ast.AST):
+        for node in ast.walk(tree):
+            expr_obj = StaticExpr._create_static_expr_obj(node)
+
+            if expr_obj is not None:
+                setattr(node, _STATIC_EXPR_OBJ_ATTR, expr_obj)
+
+    # 미리 만든 분석 객체, attach 하지 않은 node면 None
+    @staticmethod
+    def get(node: ast.AST) -> ExprObj | None:
+        return getattr(node, _STATIC_EXPR_OBJ_ATTR, None)
+
+    @staticmethod
+    def _create_static_expr_obj(node: ast.AST):
+        if type(node) is ast.Constant:
+            return ConstantExpr.parse(node)
+
+        if type(node) is ast.Name and isinstance(node.ctx, ast.Store):
+            return NameObj(value=node.id, expressions=(node.id,), type=ExprType.NAME)
+
+        return None
@@ -15,6 +15,7 @@ class ExprStmt:
             value=expr_obj.value,
             expressions=expr_obj.expressions,
             expr_type=expr_obj.type,
+            value_type=expr_obj.value_type,
             call_stack_name=elem_container.get_call_stack_name(),
         )
 
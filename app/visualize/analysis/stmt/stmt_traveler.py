@@ -18,6 +18,7 @@ from app.visualize.analysis.stmt.parser.func_def_stmt import FuncDefStmt
 from app.visualize.analysis.stmt.parser.if_stmt import IfStmt
 from app.visualize.analysis.stmt.parser.return_stmt import ReturnStmt
 from app.visualize.analysis.stmt.parser.while_stmt import WhileStmt
+from app.visualize.analysis.stmt.viz_step_counter import VizStepCounter
 from app.visualize.container.element_container import ElementContainer
 
 
@@ -25,80 +26,97 @@ class StmtTraveler:
 
     @staticmethod
     def travel(nodes: ast, elem_container: ElementContainer):
-        body_objs = []
-        for node in nodes:
-            if body_objs and body_objs[-1].type == StmtType.RETURN:
-                return body_objs
-
-            if isinstance(node, ast.Assign):
-                stmt_obj = StmtTraveler._assign_travel(node, elem_container)
-                body_objs.append(stmt_obj)
-
-            elif isinstance(node, ast.For):
-                stmt_obj = StmtTraveler._for_travel(node, elem_container)
-                body_objs.append(stmt_obj)
-
-            elif isinstance(node, ast.Expr):
-                stmt_obj = StmtTraveler._expr_travel(node, elem_container)
-                body_objs.append(stmt_obj)
-
-            elif isinstance(node, ast.If):
-                stmt_obj = StmtTraveler._if_travel(node, [], [], elem_container)
-                body_objs.append(stmt_obj)
-                if stmt_obj.body_steps and stmt_obj.body_steps[-1].type == StmtType.RETURN:
-                    return body_objs
-
-            elif isinstance(node, ast.Pass | ast.Break | ast.Continue):
-                stmt_obj = StmtTraveler._flow_control_travel(node)
-                body_objs.append(stmt_obj)
-
-            elif isinstance(node, ast.Return):
-                stmt_obj = StmtTraveler._return_travel(node, elem_container)
-                body_objs.append(stmt_obj)
-                break
+        return list(StmtTraveler.iter_travel(nodes, elem_container))
 
-            elif isinstance(node, ast.While):
-                stmt_obj = StmtTraveler._while_travel(node, elem_container)
-                body_objs.append(stmt_obj)
+    # 분석이 끝난 stmt 객체를 하나씩 반환, return을 만나면 이후 node는 분석하지 않음
+    @staticmethod
+    def iter_travel(nodes: ast, elem_container: ElementContainer):
+        for node in nodes:
+            if StmtTraveler._is_stopped(node, elem_container):
+                return
 
-            elif isinstance(node, ast.FunctionDef):
-                stmt_obj = StmtTraveler._func_def_travel(node, elem_container)
-                body_objs.append(stmt_obj)
+            handler = _STMT_HANDLERS.get(type(node))
 
-            else:
+            if handler is None:
                 raise TypeError(f"[StmtTraveler] {type(node)}는 잘못된 타입입니다.")
 
-        return body_objs
+            stmt_obj = handler(node, elem_container)
+
+            # global 문처럼 시각화 단계가 없는 node
+            if stmt_obj is None:
+                continue
+
+            yield StmtTraveler._count_stmt_obj(stmt_obj, elem_container)
+
+            if stmt_obj.type == StmtType.RETURN:
+                return
+
+            if stmt_obj.type == StmtType.IF and stmt_obj.body_steps and stmt_obj.body_steps[-1].type == StmtType.RETURN:
+                return
+
+    # 새로운 stmt node를 분석할 handler(node, elem_container) 등록
+    @staticmethod
+    def register(node_type: type, handler):
+        _STMT_HANDLERS[node_type] = handler
+
+    @staticmethod
+    def _global_travel(node: ast.Global, elem_container: ElementContainer):
+        # 시각화 단계 없이 이후 할당이 전역 변수에 저장되도록 선언만 함
+        elem_container.declare_global(node.names)
+
+    @staticmethod
+    def _count_stmt_obj(stmt_obj, elem_container: ElementContainer):
+        # 분석 중에 시각화 단계 수를 세어 최대 개수를 넘으면 바로 중단
+        elem_container.consume_steps(VizStepCounter.count(stmt_obj))
+        return stmt_obj
+
+    # 시각화 단계 제한에서 결과를 자르는 경우, 제한을 넘은 뒤에는 node부터 분석하지 않고 멈춘 위치로 기록
+    @staticmethod
+    def _is_stopped(node: ast.stmt, elem_container: ElementContainer):
+        if not elem_container.is_analysis_stopped():
+            return False
+
+        elem_container.record_stop_lineno(node.lineno)
+        return True
+
+    # 사용자 함수의 body를 분석하는 기본 함수, 다른 분석 방식(NativeStmtTraveler)은 travel_func_body로 바꿔서 전달
+    @staticmethod
+    def _travel_func_body(user_func: UserFunc, local_elem_container: ElementContainer):
+        return StmtTraveler.travel(user_func.user_func_ast, local_elem_container)
 
     @staticmethod
-    def _assign_travel(node: ast.Assign, elem_container: ElementContainer):
+    def _assign_travel(node: ast.Assign, elem_container: ElementContainer, travel_func_body=None):
         assign_obj = AssignStmt.parse(node, elem_container)
         expr_stmt_obj = assign_obj.expr_stmt_obj
 
         if expr_stmt_obj.expr_type is ExprType.USER_FUNC:
-            return StmtTraveler._assign_user_func(assign_obj, elem_container, expr_stmt_obj, node)
-        expr_stmt_obj = assign_obj.expr_stmt_obj
+            return StmtTraveler._assign_user_func(
+                assign_obj, elem_container, expr_stmt_obj, node, travel_func_body or StmtTraveler._travel_func_body
+            )
+
         expr_obj = ExprObj(
             value=expr_stmt_obj.value, expressions=expr_stmt_obj.expressions, type=expr_stmt_obj.expr_type
         )
-        AssignStmt.set_value_to_target(assign_obj.targets, expr_obj, elem_container)
+        AssignStmt.set_value_to_target(
+            assign_obj.targets, expr_obj, elem_container, is_new_value=AssignStmt.is_new_value(node.value)
+        )
 
         return assign_obj
 
     @staticmethod
-    def _assign_user_func(assign_obj, elem_container, expr_stmt_obj, node):
+    def _assign_user_func(assign_obj, elem_container, expr_stmt_obj, node, travel_func_body):
         user_func: UserFunc = expr_stmt_obj.value
         func_name: str = user_func.name
         func_signature: str = expr_stmt_obj.expressions
-        body_asts: ast = user_func.user_func_ast
         args: dict = user_func.arguments
 
         local_elem_container = elem_container.make_local_elem_container(func_name, args)
 
-        steps = StmtTraveler.travel(body_asts, local_elem_container)
+        steps = travel_func_body(user_func, local_elem_container)
 
         return_obj = None
-        last_step = steps[-1]
+        # 결과를 자르는 경우 함수 body의 첫 문장 전에 분석이 멈췄으면 steps가 비어 있음
+        last_step = steps[-1] if steps else None
         if isinstance(last_step, ReturnStmtObj):
             return_obj = last_step
         elif isinstance(last_step, IfStmtObj):
@@ -108,9 +126,11 @@ class StmtTraveler:
                     break
                 last_step = last_step.body_steps[-1]
 
-        AssignStmt.set_value_to_target(
-            target_names=assign_obj.targets, expr_obj=return_obj, elem_container=elem_container
-        )
+        # 분석이 멈춰 return까지 가지 못한 경우 할당하지 않음 (할당 단계는 잘리는 단계 이후에 있음)
+        if not elem_container.is_analysis_stopped():
+            AssignStmt.set_value_to_target(
+                target_names=assign_obj.targets, expr_obj=return_obj, elem_container=elem_container
+            )
         user_func_stmt_obj = UserFuncStmtObj(
             id=node.lineno,
             func_name=func_name,
@@ -136,6 +156,11 @@ class StmtTraveler:
         body_objs = []
 
         for i in for_stmt_obj.iter_obj.value:
+            elem_container.check_deadline()
+            if StmtTraveler._is_stopped(node, elem_container):
+                break
+
+            elem_container.consume_steps(VizStepCounter.count_for_iteration())
             # init value 값 변경
             elem_container.add_element(for_stmt_obj.target_name, i)
             # for문 안 body 로직을 stmt 리스트로 변환
@@ -143,13 +168,13 @@ class StmtTraveler:
 
             # break 존재할 때
             if ForStmt.contain_flow_control(body_steps, BreakStmtObj):
-                body_steps = ForStmt.get_pre_flow_control_body_steps(body_steps, BreakStmtObj)
+                body_steps = StmtTraveler._get_pre_flow_control_body_steps(body_steps, BreakStmtObj, elem_container)
                 body_objs.append(BodyObj(cur_value=i, body_steps=body_steps))
                 break
 
             # continue 존재할 때
             if ForStmt.contain_flow_control(body_steps, ContinueStmtObj):
-                body_steps = ForStmt.get_pre_flow_control_body_steps(body_steps, ContinueStmtObj)
+                body_steps = StmtTraveler._get_pre_flow_control_body_steps(body_steps, ContinueStmtObj, elem_container)
                 body_objs.append(BodyObj(cur_value=i, body_steps=body_steps))
                 continue
 
@@ -158,6 +183,17 @@ class StmtTraveler:
         for_stmt_obj.body_objs = body_objs
         return for_stmt_obj
 
+    @staticmethod
+    def _get_pre_flow_control_body_steps(body_steps: list, flow_control_obj, elem_container: ElementContainer):
+        pre_flow_control_body_steps = ForStmt.get_pre_flow_control_body_steps(body_steps, flow_control_obj)
+
+        # flow control 이후에 잘려 나간 단계는 시각화되지 않으므로 budget에서 제외
+        elem_container.refund_steps(
+            VizStepCounter.count_all(body_steps) - VizStepCounter.count_all(pre_flow_control_body_steps)
+        )
+
+        return pre_flow_control_body_steps
+
     @staticmethod
     def _parse_for_body(bodies: list[ast.stmt], elem_container: ElementContainer):
         if not any(isinstance(body, ast.stmt) for body in bodies):
@@ -168,22 +204,21 @@ class StmtTraveler:
         return stmt_objs
 
     @staticmethod
-    def _expr_travel(node: ast.Expr, elem_container: ElementContainer):
+    def _expr_travel(node: ast.Expr, elem_container: ElementContainer, travel_func_body=None):
         expr_stmt_obj = ExprStmt.parse(node, elem_container)
 
         if expr_stmt_obj.expr_type is ExprType.USER_FUNC:
             user_func: UserFunc = expr_stmt_obj.value
             func_name: str = user_func.name
             func_signature: str = expr_stmt_obj.expressions
-            body_asts: ast = user_func.user_func_ast
             args: dict = user_func.arguments
 
             local_elem_container = elem_container.make_local_elem_container(func_name, args)
 
-            steps = StmtTraveler.travel(body_asts, local_elem_container)
+            steps = (travel_func_body or StmtTraveler._travel_func_body)(user_func, local_elem_container)
 
             return_obj = None
-            last_step = steps[-1]
+            last_step = steps[-1] if steps else None
             if isinstance(last_step, ReturnStmtObj):
                 return_obj = last_step
             elif isinstance(last_step, IfStmtObj):
@@ -301,10 +336,16 @@ class StmtTraveler:
         condition_value = True
 
         while condition_value:
+            # 무한 루프 방지: 반복 횟수와 분석 제한 시간 검사
+            elem_container.consume_while_cycle()
+            if StmtTraveler._is_stopped(node, elem_container):
+                break
+
             body_objs = []
             # ast.While의 조건문 파싱
             condition_obj = WhileStmt.parse_condition(node.test, elem_container)
             condition_value = condition_obj.value
+            elem_container.consume_steps(VizStepCounter.count_while_cycle(condition_obj.expressions))
 
             # 조건문이 False일 경우 body 로직을 탐색하지 않음
             if condition_value:
@@ -315,6 +356,8 @@ class StmtTraveler:
 
         # while의 else 로직을 저장
         while_else_objs = StmtTraveler.travel(node.orelse, elem_container)
+        # else 로직은 시각화 단계로 변환되지 않으므로 budget에서 제외
+        elem_container.refund_steps(VizStepCounter.count_all(while_else_objs))
 
         # id와 while의 결과를 저장한 객체 반환
         return WhileStmtObj(
@@ -326,3 +369,19 @@ class StmtTraveler:
     @staticmethod
     def _func_def_travel(node: ast.FunctionDef, elem_container: ElementContainer):
         return FuncDefStmt.parse(node, elem_container)
+
+
+# node 타입별 분석 함수, 호출 시점에 StmtTraveler의 함수를 찾도록 lambda로 감쌈
+_STMT_HANDLERS = {
+    ast.Assign: lambda node, elem_container: StmtTraveler._assign_travel(node, elem_container),
+    ast.For: lambda node, elem_container: StmtTraveler._for_travel(node, elem_container),
+    ast.Expr: lambda node, elem_container: StmtTraveler._expr_travel(node, elem_container),
+    ast.If: lambda node, elem_container: StmtTraveler._if_travel(node, [], [], elem_container),
+    ast.Pass: lambda node, elem_container: StmtTraveler._flow_control_travel(node),
+    ast.Break: lambda node, elem_container: StmtTraveler._flow_control_travel(node),
+    ast.Continue: lambda node, elem_container: StmtTraveler._flow_control_travel(node),
+    ast.Return: lambda node, elem_container: StmtTraveler._return_travel(node, elem_container),
+    ast.While: lambda node, elem_container: StmtTraveler._while_travel(node, elem_container),
+    ast.FunctionDef: lambda node, elem_container: StmtTraveler._func_def_travel(node, elem_container),
+    ast.Global: lambda node, elem_container: StmtTraveler._global_travel(node, elem_container),
+}
@@ -0,0 +1,109 @@
+from app.visualize.analysis.stmt.models.stmt_type import StmtType
+from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
+
+
+# 분석 결과 객체가 ConverterTraveler를 거쳐 만들어 낼 시각화 단계 수를 미리 계산하는 클래스
+# for, while의 반복 단계와 함수 body는 StmtTraveler에서 탐색하면서 따로 센다.
+class VizStepCounter:
+
+    @staticmethod
+    def count(stmt_obj) -> int:
+        if stmt_obj.type == StmtType.ASSIGN:
+            return VizStepCounter._count_assign(stmt_obj)
+
+        elif stmt_obj.type == StmtType.EXPR:
+            return VizStepCounter.count_expr(stmt_obj.expr_type, stmt_obj.expressions)
+
+        elif stmt_obj.type == StmtType.IF:
+            return VizStepCounter._count_if(stmt_obj)
+
+        elif stmt_obj.type == StmtType.RETURN:
+            return len(stmt_obj.expr)
+
+        elif stmt_obj.type in (StmtType.FLOW_CONTROL, StmtType.FUNC_DEF):
+            return 1
+
+        elif stmt_obj.type == StmtType.USER_FUNC:
+            # 함수 호출, call stack 생성, 함수 종료
+            return 3
+
+        # for, while은 반복할 때마다 센다.
+        return 0
+
+    # 이미 분석이 끝난 stmt 리스트 전체(중첩된 body 포함)의 시각화 단계 수
+    @staticmethod
+    def count_all(stmt_objs: list) -> int:
+        count = 0
+
+        for stmt_obj in stmt_objs:
+            count += VizStepCounter.count(stmt_obj)
+
+            if stmt_obj.type == StmtType.FOR:
+                for body_obj in stmt_obj.body_objs:
+                    count += VizStepCounter.count_for_iteration() + VizStepCounter.count_all(body_obj.body_steps)
+
+            elif stmt_obj.type == StmtType.WHILE:
+                for while_cycle in stmt_obj.while_cycles:
+                    count += VizStepCounter.count_while_cycle(while_cycle.condition_exprs)
+                    count += VizStepCounter.count_all(while_cycle.body_objs)
+
+            elif stmt_obj.type == StmtType.IF:
+                count += VizStepCounter.count_all(stmt_obj.body_steps)
+
+            elif stmt_obj.type == StmtType.USER_FUNC:
+                count += VizStepCounter.count_all(stmt_obj.body_steps)
+
+            elif stmt_obj.type == StmtType.ASSIGN and stmt_obj.expr_stmt_obj.type == StmtType.USER_FUNC:
+                count += VizStepCounter.count_all(stmt_obj.expr_stmt_obj.body_steps)
+
+        return count
+
+    @staticmethod
+    def count_expr(expr_type: ExprType, expressions) -> int:
+        if expr_type in (ExprType.VARIABLE, ExprType.LIST, ExprType.TUPLE, ExprType.DICT, ExprType.PRINT):
+            return len(expressions)
+
+        elif expr_type in (ExprType.APPEND, ExprType.EXTEND, ExprType.INSERT, ExprType.REMOVE):
+            return len(expressions) + 1
+
+        elif expr_type in (ExprType.POP, ExprType.LEN):
+            return 1
+
+        elif expr_type is ExprType.INPUT:
+            return 2
+
+        return 0
+
+    @staticmethod
+    def count_for_iteration() -> int:
+        # for header 갱신
+        return 1
+
+    @staticmethod
+    def count_while_cycle(condition_exprs: tuple) -> int:
+        # while 정의 + 조건식 변화 과정
+        return 1 + len(condition_exprs)
+
+    @staticmethod
+    def _count_assign(assign_obj) -> int:
+        expr_stmt_obj = assign_obj.expr_stmt_obj
+
+        if expr_stmt_obj.type == StmtType.USER_FUNC:
+            # 함수 호출, call stack 생성, 함수 종료, 반환값 할당
+            return 4
+
+        return VizStepCounter.count_expr(expr_stmt_obj.expr_type, expr_stmt_obj.expressions) + 1
+
+    @staticmethod
+    def _count_if(if_stmt_obj) -> int:
+        # if-else 구조 정의
+        count = 1
+
+        # 결과가 true인 조건문까지 조건식 변화 과정
+        for condition in if_stmt_obj.conditions:
+            count += len(condition.expressions)
+
+            if condition.result:
+                break
+
+        return count
@@ -1,19 +1,89 @@
 import ast
+import itertools
 
+from app import settings
 from app.models.request_code import RequestCode
+from app.visualize.analysis.native.native_preflight import NativePreflight
+from app.visualize.analysis.native.native_stmt_traveler import NativeStmtTraveler
+from app.visualize.analysis.stmt.parser.expr.expr_compiler import ExprCompiler
+from app.visualize.analysis.stmt.parser.expr.static_expr import StaticExpr
 from app.visualize.analysis.stmt.stmt_traveler import StmtTraveler
 from app.visualize.container.element_container import ElementContainer
+from app.visualize.container.step_budget import StepBudget
 from app.visualize.generator.converter_traveler import ConverterTraveler
 from app.visualize.generator.visualization_manager import VisualizationManager
+from app.web.exception.code_visualize_error import CodeVisualizeError
 
 
 class CodeVisualizer:
 
-    def __init__(self, request_code: RequestCode):
+    def __init__(self, request_code: RequestCode, step_budget: StepBudget = None):
         self._parsed_node = ast.parse(request_code.source_code)
-        self._elem_container = ElementContainer(request_code.input, "main")
+        StaticExpr.attach(self._parsed_node)
+        if settings.ANALYSIS_ENGINE == "compiled":
+            ExprCompiler.attach(self._parsed_node)
+        self._stmt_traveler = StmtTraveler
+        # native로 실행할 수 없는 코드는 interpreter로 분석
+        if settings.ANALYSIS_ENGINE == "native" and NativeStmtTraveler.can_travel(self._parsed_node.body):
+            self._stmt_traveler = NativeStmtTraveler
+        self._step_budget = StepBudget(truncate=settings.TRUNCATE_AT_MAX_STEPS) if step_budget is None else step_budget
+        self._elem_container = ElementContainer(request_code.input, "main", step_budget=self._step_budget)
         self._visualization_manager = VisualizationManager(request_code.source_code)
 
+        # interpreter로 분석하기 전에 제한 안에 끝날 코드인지 확인 (native는 실행하면서 같은 제한을 검사)
+        # 결과를 자르는 경우 제한을 넘는 코드도 제한까지의 결과를 반환해야 하므로 사전 실행하지 않음
+        if (
+            settings.NATIVE_PREFLIGHT_ENABLED
+            and not self._step_budget.is_truncating()
+            and self._stmt_traveler is StmtTraveler
+        ):
+            self._run_preflight(request_code)
+
     def visualize_code(self):
-        analyzed_stmt_list = StmtTraveler.travel(self._parsed_node.body, self._elem_container)
-        return ConverterTraveler.travel(analyzed_stmt_list, self._visualization_manager)
+        analyzed_stmt_list = self._stmt_traveler.travel(self._parsed_node.body, self._elem_container)
+        if not self._step_budget.is_truncating():
+            return ConverterTraveler.travel(analyzed_stmt_list, self._visualization_manager)
+
+        # 제한을 넘기 직전까지 분석한 문장에서 최대 개수만큼의 시각화 단계만 변환
+        viz_steps = ConverterTraveler.iter_travel(analyzed_stmt_list, self._visualization_manager)
+        return list(itertools.islice(viz_steps, self._step_budget.get_max_steps()))
+
+    # 응답의 result, 결과를 자른 경우 멈춘 이유와 위치를 함께 담음
+    def visualize_result(self) -> dict:
+        return {"code": self.visualize_code(), **self._get_truncation()}
+
+    # 최상위 문장 단위로 분석, 변환하여 만들어진 시각화 단계부터 차례로 반환
+    # 결과를 자르는 경우 최대 개수까지 반환한 뒤, 멈춘 이유와 위치를 예외로 전달
+    def iter_visualize_code(self):
+        viz_steps = (
+            viz
+            for analyzed_stmt in self._stmt_traveler.iter_travel(self._parsed_node.body, self._elem_container)
+            for viz in ConverterTraveler.iter_travel([analyzed_stmt], self._visualization_manager)
+        )
+        if not self._step_budget.is_truncating():
+            yield from viz_steps
+            return
+
+        yield from itertools.islice(viz_steps, self._step_budget.get_max_steps())
+
+        if self._step_budget.is_stopped():
+            raise CodeVisualizeError(self._step_budget.get_stop_reason(), self._get_truncation())
+
+    def _get_truncation(self) -> dict:
+        if not self._step_budget.is_stopped():
+            return {}
+
+        return {
+            "truncated": True,
+            "reason": self._step_budget.get_stop_reason().to_dict(),
+            "position": {"line": self._step_budget.get_stop_lineno()},
+        }
+
+    def _run_preflight(self, request_code: RequestCode):
+        preflight = NativePreflight(
+            timeout_seconds=settings.NATIVE_PREFLIGHT_TIMEOUT_SECONDS,
+            memory_limit_bytes=settings.NATIVE_PREFLIGHT_MEMORY_LIMIT_MB * 1024 * 1024,
+        )
+        preflight.check(request_code, self._step_budget.get_max_steps())
+        # 사전 실행(프로세스 시작 포함)에 걸린 시간은 분석 제한 시간에서 제외
+        self._step_budget.restart_deadline()
@@ -0,0 +1,39 @@
+import copy
+
+
+# 시각화 단계가 기록한 list, dict 값
+# 기록할 때는 복사하지 않고 원본을 가리키다가, 원본이 처음 바뀌기 직전에 ElementContainer가 freeze를 호출하면 그때 복사한다.
+# 바뀌지 않는 값은 복사하지 않으므로 기록 비용이 값의 크기와 관계없이 일정하다. (copy-on-write)
+class CollectionSnapshot:
+    __slots__ = ("_value",)
+
+    def __init__(self, value):
+        self._value = value
+
+    def get_value(self):
+        return self._value
+
+    # 원본을 복사해서 이후 원본이 바뀌어도 기록한 시점의 값을 유지
+    def freeze(self):
+        self._value = copy.copy(self._value)
+
+    def __len__(self):
+        return len(self._value)
+
+    def __getitem__(self, item):
+        return self._value[item]
+
+    def __iter__(self):
+        return iter(self._value)
+
+    def __eq__(self, other):
+        if isinstance(other, CollectionSnapshot):
+            other = other.get_value()
+
+        return self._value == other
+
+    def __str__(self):
+        return str(self._value)
+
+    def __repr__(self):
+        return f"CollectionSnapshot({self._value!r})"
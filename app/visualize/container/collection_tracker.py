@@ -0,0 +1,41 @@
+from app.visualize.container.collection_snapshot import CollectionSnapshot
+
+# 다른 값을 담을 수 있는 타입, 이 타입의 요소가 있으면 요소가 바뀌어도 값의 version이 바뀌지 않음
+_CONTAINER_TYPES = (list, tuple, dict, set)
+
+
+# 분석 중에 list, dict가 바뀌는 것을 추적하는 클래스, 함수 호출로 만들어지는 local container도 같은 tracker를 공유한다.
+# 시각화 단계가 기록한 CollectionSnapshot을 원본이 바뀌기 직전에 복사하고(copy-on-write),
+# 값마다 바뀐 횟수(version)를 세서 바뀌지 않은 값의 문자열을 다시 만들지 않도록 한다.
+class CollectionTracker:
+
+    def __init__(self):
+        self._snapshots = {}  # id(원본) : [snapshot]
+        self._versions = {}  # id(값) : 바뀐 횟수
+        # 모든 값이 바뀐 횟수, 다른 list 등을 요소로 가진 값은 요소만 바뀔 수 있으므로 이 횟수를 version으로 사용
+        self._mutation_count = 0
+
+    def take_snapshot(self, value) -> CollectionSnapshot:
+        snapshot = CollectionSnapshot(value)
+        self._snapshots.setdefault(id(value), []).append(snapshot)
+        return snapshot
+
+    # snapshot이 원본을 참조하고 있으므로 등록된 동안 같은 id의 다른 객체가 생기지 않음
+    def before_mutation(self, value):
+        for snapshot in self._snapshots.pop(id(value), ()):
+            snapshot.freeze()
+
+        self._versions[id(value)] = self._versions.get(id(value), 0) + 1
+        self._mutation_count += 1
+
+    # 같은 객체의 version이 같으면 값도 같음 (객체가 같은지는 호출하는 쪽에서 확인)
+    def get_version(self, value, is_flat: bool):
+        if is_flat:
+            return self._versions.get(id(value), 0)
+
+        return -1 - self._mutation_count
+
+    @staticmethod
+    def is_flat(value) -> bool:
+        elements = value.values() if isinstance(value, dict) else value
+        return not any(isinstance(element, _CONTAINER_TYPES) for element in elements)
@@ -1,23 +1,52 @@
+from app.visualize.analysis.stmt.parser.expr.models.subscript_target import SubscriptTarget
+from app.visualize.container.collection_tracker import CollectionTracker
+from app.visualize.container.step_budget import StepBudget
 from app.visualize.utils import utils
+from app.web.exception.error_enum import ErrorEnum
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
+# 변수를 저장하는 scope 하나를 나타내는 클래스
+# 함수의 local scope는 변수를 복사하지 않고 함수가 정의된 scope(parent)를 가리키며, 찾는 변수가 없으면 parent에서 찾는다.
 class ElementContainer:
 
-    def __init__(self, input_list: list, call_stack_name, input_index=0):
+    def __init__(
+        self,
+        input_list: list,
+        call_stack_name,
+        input_index=0,
+        step_budget: StepBudget = None,
+        parent: "ElementContainer" = None,
+        collection_tracker: CollectionTracker = None,
+    ):
         self._call_stack_name = call_stack_name
         self._element_dict = {}
         self._input_list = input_list
         self._input_index = input_index
+        # 함수 호출로 만들어지는 local container도 같은 budget을 공유한다.
+        self._step_budget = StepBudget() if step_budget is None else step_budget
+        self._parent = parent
+        self._collection_tracker = CollectionTracker() if collection_tracker is None else collection_tracker
+        # 변수 이름 : (값, version, 값의 문자열), 값이 바뀌지 않았으면 문자열을 다시 만들지 않음
+        self._repr_cache = {}
+        # global 문으로 선언되어 전역 scope에 저장해야 하는 변수 이름
+        self._global_names = set()
 
     def make_local_elem_container(self, func_name, args: dict):
         # 매개변수 개수와 들어온 값이 다른경우
         # if arg_names.length != args.length:
         #     raise ValueError("Argument length is not equal to input length")
 
-        local_elem_container = ElementContainer(self._input_list, func_name, self._input_index)
-
-        for var_name, var_value in self._element_dict.items():
-            local_elem_container.add_element(var_name, var_value)
+        # 함수가 정의된 scope를 parent로 연결 (호출한 scope의 변수는 보이지 않음)
+        parent = self._find_scope(func_name) or self._get_global_container()
+        local_elem_container = ElementContainer(
+            self._input_list,
+            func_name,
+            self._input_index,
+            self._step_budget,
+            parent=parent,
+            collection_tracker=self._collection_tracker,
+        )
 
         # 매개변수 저장
         for arg_name, arg_value in args.items():
@@ -26,57 +55,101 @@ class ElementContainer:
         return local_elem_container
 
     def get_element(self, name):
-        if name in self._element_dict:
-            return self._element_dict[name]
+        scope = self._find_scope(name)
 
-        return None
+        if scope is None:
+            return None
+
+        return scope._element_dict[name]
 
     def add_element(self, name, value):
         if utils.is_array(name) and utils.is_array(value):
             for i in range(len(name)):
-                self._element_dict[name[i]] = value[i]
+                self._set_element(name[i], value[i])
             return
 
         # 할당해야 하는 target이 리스트 의 특정 인덱스인 경우
-        if "[" in name and "]" in name:
+        if isinstance(name, SubscriptTarget):
             self._set_subscript_target(name, value)
             return
 
-        self._element_dict[name] = value
+        self._set_element(name, value)
         return
 
-    def get_element_dict(self):
-        return self._element_dict
+    # 시각화 단계에 기록할 값, list와 dict는 복사하지 않고 원본이 바뀌기 직전에 복사하는 snapshot으로 기록
+    def take_snapshot(self, value):
+        if not isinstance(value, (list, dict)):
+            return value
 
-    def _set_subscript_target(self, name, value):
-        # a[0:1]에서 a 추출
-        list_name = name.split("[")[0]
-        # a[0:1]에서 0:1 부분 추출
-        sliced_index = name[name.index("[") + 1 : name.index("]")]
-        # 0:1 -> [0, 1]
-        slice_list = list(sliced_index.split(":"))
+        return self._collection_tracker.take_snapshot(value)
 
-        # 해당 list를 찾아온다.
-        find_list = self._element_dict[list_name]
+    # list, dict를 직접 바꾸기 전에 호출, 이 값을 기록한 snapshot을 먼저 복사하고 값의 version을 올림
+    def before_mutation(self, value):
+        self._collection_tracker.before_mutation(value)
 
-        # 찾아온 list가 tuple이면 예외
-        if isinstance(find_list, tuple):
-            raise TypeError(f"[element container] {type(find_list)}은 수정할 수 없습니다.")
+    # 변수 값(list, tuple, dict)의 문자열, 같은 값이 바뀌지 않았으면 이전에 만든 문자열을 다시 사용
+    def get_element_repr(self, name, value) -> str:
+        entry = self._repr_cache.get(name)
+
+        if entry is not None and entry[0] is value:
+            cached_value, is_flat, version, value_repr = entry
+            if version == self._collection_tracker.get_version(value, is_flat):
+                return value_repr
+
+        is_flat = CollectionTracker.is_flat(value)
+        value_repr = ValueRenderer.render(value)
+        self._repr_cache[name] = (value, is_flat, self._collection_tracker.get_version(value, is_flat), value_repr)
+        return value_repr
 
-        # start, end, step 인 경우
-        if len(slice_list) > 1:
-            slice_list = map(int, sliced_index.split(":"))
-            find_list[slice(*slice_list)] = value
+    # global 문 : 이후 이 scope에서 names에 할당하면 전역 scope에 저장
+    def declare_global(self, names: list):
+        if self._parent is not None:
+            self._global_names.update(names)
+
+    def _set_element(self, name, value):
+        if name in self._global_names:
+            self._get_global_container()._element_dict[name] = value
             return
 
-        # 값 하나만 바꾸는 경우
-        try:
-            change_idx = int(slice_list[0])  # 정수 또는 실수로 변환
-        except ValueError:
-            change_idx = slice_list[0]
+        self._element_dict[name] = value
+
+    # 현재 scope부터 parent 방향으로 name이 저장된 scope를 찾음
+    def _find_scope(self, name):
+        if name in self._global_names:
+            return self._get_global_container()._find_scope(name)
 
-        find_list[change_idx] = value
-        return
+        scope = self
+        while scope is not None:
+            if name in scope._element_dict:
+                return scope
+            scope = scope._parent
+
+        return None
+
+    def _get_global_container(self):
+        scope = self
+        while scope._parent is not None:
+            scope = scope._parent
+
+        return scope
+
+    # 실제 실행에서 기록한 변수 값으로 이 scope와 전역 scope의 변수를 덮어씀
+    def load_snapshot(self, local_variables: dict, global_variables: dict):
+        self._element_dict.update(local_variables)
+        self._get_global_container()._element_dict.update(global_variables)
+
+    def get_element_dict(self):
+        return self._element_dict
+
+    def _set_subscript_target(self, target: SubscriptTarget, value):
+        collection = target.get_collection()
+
+        # 찾아온 list가 tuple이면 예외
+        if isinstance(collection, tuple):
+            raise TypeError(f"[element container] {type(collection)}은 수정할 수 없습니다.")
+
+        self.before_mutation(collection)
+        collection[target.indices[-1]] = value
 
     def get_input(self):
         if not self._input_list[self._input_index]:
@@ -86,5 +159,33 @@ class ElementContainer:
         self._input_index += 1
         return return_input
 
+    def get_input_list(self):
+        return self._input_list
+
     def get_call_stack_name(self):
         return self._call_stack_name
+
+    def consume_steps(self, count: int):
+        self._step_budget.consume(count)
+
+    def refund_steps(self, count: int):
+        self._step_budget.refund(count)
+
+    def consume_while_cycle(self):
+        self._step_budget.consume_while_cycle()
+
+    def check_deadline(self):
+        self._step_budget.check_deadline()
+
+    def is_analysis_stopped(self):
+        return self._step_budget.is_stopped()
+
+    def record_stop_lineno(self, lineno: int):
+        self._step_budget.record_stop_lineno(lineno)
+
+    def stop_analysis(self, error_enum: ErrorEnum, lineno: int):
+        self._step_budget.stop(error_enum)
+        self._step_budget.record_stop_lineno(lineno)
+
+    def get_step_budget(self):
+        return self._step_budget
@@ -0,0 +1,88 @@
+import time
+
+from app import settings
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+class StepBudget:
+
+    def __init__(
+        self,
+        max_steps: int = settings.MAX_VIZ_STEPS,
+        timeout_seconds: float = settings.ANALYSIS_TIMEOUT_SECONDS,
+        max_while_cycles: int = settings.MAX_WHILE_CYCLES,
+        truncate: bool = False,
+    ):
+        self._max_steps = max_steps
+        self._used_steps = 0
+        self._timeout_seconds = timeout_seconds
+        self._deadline = time.monotonic() + timeout_seconds
+        self._max_while_cycles = max_while_cycles
+        self._while_cycles = 0
+        # True면 제한을 넘어도 예외 없이 멈춘 이유와 위치만 기록하고, 분석은 다음 문장에서 멈춤
+        self._truncate = truncate
+        self._stop_reason = None
+        self._stop_lineno = None
+
+    # 분석 중 생성될 시각화 단계 수를 누적하고, 최대 개수를 넘으면 즉시 분석을 중단
+    def consume(self, count: int):
+        self._used_steps += count
+
+        if self._used_steps > self._max_steps:
+            self.stop(ErrorEnum.VISUALIZE_TIMEOUT)
+
+    # 분석은 했지만 시각화되지 않는 단계(break 이후의 body 등)를 되돌림
+    def refund(self, count: int):
+        self._used_steps -= count
+
+    # while문 한 바퀴마다 호출되어 반복 횟수와 분석 제한 시간을 검사
+    def consume_while_cycle(self):
+        self._while_cycles += 1
+
+        if self._while_cycles > self._max_while_cycles:
+            self.stop(ErrorEnum.EXECUTION_TIMEOUT)
+
+        self.check_deadline()
+
+    def check_deadline(self):
+        if self.is_past_deadline():
+            self.stop(ErrorEnum.EXECUTION_TIMEOUT)
+
+    # 분석을 여러 요청에 나누어 진행하는 경우(이어 받기) 요청마다 제한 시간을 다시 시작
+    def restart_deadline(self):
+        self._deadline = time.monotonic() + self._timeout_seconds
+
+    def is_past_deadline(self):
+        return time.monotonic() > self._deadline
+
+    # 제한을 넘어 분석을 멈춤, 결과를 자르지 않으면 바로 예외를 발생시키고 자르는 경우 처음 넘은 제한만 기록
+    def stop(self, error_enum: ErrorEnum):
+        if not self._truncate:
+            raise CodeVisualizeError(error_enum)
+
+        if self._stop_reason is None:
+            self._stop_reason = error_enum
+
+    # 분석을 멈춘 뒤 처음으로 분석하지 않은 문장의 줄 번호를 기록
+    def record_stop_lineno(self, lineno: int):
+        if self._stop_lineno is None:
+            self._stop_lineno = lineno
+
+    def is_truncating(self):
+        return self._truncate
+
+    def is_stopped(self):
+        return self._stop_reason is not None
+
+    def get_stop_reason(self):
+        return self._stop_reason
+
+    def get_stop_lineno(self):
+        return self._stop_lineno
+
+    def get_used_steps(self):
+        return self._used_steps
+
+    def get_max_steps(self):
+        return self._max_steps
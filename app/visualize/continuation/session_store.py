@@ -0,0 +1,54 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from app.visualize.continuation.visualize_session import VisualizeSession
+
+
+# 이어 받기를 기다리는 VisualizeSession을 보관하는 LRU 저장소
+# session마다 분석 상태 전체를 보관하므로 크기 대신 개수(max_sessions)로 제한하고,
+# ttl_seconds 동안 다시 요청하지 않은 session은 사용하지 않는다.
+class SessionStore:
+
+    def __init__(self, max_sessions: int, ttl_seconds: float):
+        self._max_sessions = max_sessions
+        self._ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # session id : (만료 시각, session)
+        self._lock = threading.Lock()
+
+    def put(self, session: VisualizeSession) -> str:
+        session_id = secrets.token_urlsafe(16)
+
+        with self._lock:
+            self._entries[session_id] = (time.monotonic() + self._ttl_seconds, session)
+
+            while len(self._entries) > self._max_sessions:
+                self._entries.popitem(last=False)
+
+        return session_id
+
+    # 요청할 때마다 만료 시각을 다시 시작
+    def get(self, session_id: str) -> VisualizeSession | None:
+        with self._lock:
+            entry = self._entries.get(session_id)
+
+            if entry is None:
+                return None
+
+            expires_at, session = entry
+            if expires_at < time.monotonic():
+                del self._entries[session_id]
+                return None
+
+            self._entries[session_id] = (time.monotonic() + self._ttl_seconds, session)
+            self._entries.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id: str):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def get_session_count(self):
+        with self._lock:
+            return len(self._entries)
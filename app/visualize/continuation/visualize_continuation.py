@@ -0,0 +1,52 @@
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.continuation.session_store import SessionStore
+from app.visualize.continuation.visualize_session import VisualizeSession
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+# 시각화 결과의 첫 page를 반환하고, 다음 page가 있으면 session을 저장하여 continuation token을 함께 반환하는 클래스
+# token은 "session id.page 번호" 형식이며 클라이언트는 내용을 해석하지 않고 그대로 다시 보낸다.
+class VisualizeContinuation:
+
+    @staticmethod
+    def start(request_code: RequestCode, session_store: SessionStore) -> dict:
+        session = VisualizeSession(
+            request_code, page_size=settings.MAX_VIZ_STEPS, max_pages=settings.CONTINUATION_MAX_PAGES
+        )
+        result = session.fetch(session.get_page())
+
+        # 한 page 안에 끝나면 session을 보관하지 않음
+        if not session.has_next_page():
+            return result
+
+        session_id = session_store.put(session)
+        return VisualizeContinuation._add_token(result, session_id, session)
+
+    @staticmethod
+    def resume(continuation_token: str, session_store: SessionStore) -> dict:
+        session_id, _, page = continuation_token.partition(".")
+        session = session_store.get(session_id)
+
+        if session is None or not page.isdigit():
+            raise CodeVisualizeError(ErrorEnum.CONTINUATION_EXPIRED)
+
+        try:
+            result = session.fetch(int(page))
+        except Exception:
+            # 학생 코드의 예외 등으로 분석이 끝난 session은 이어서 분석할 수 없음
+            session_store.remove(session_id)
+            raise
+
+        if result is None:
+            raise CodeVisualizeError(ErrorEnum.CONTINUATION_EXPIRED)
+
+        if not session.has_next_page():
+            return result
+
+        return VisualizeContinuation._add_token(result, session_id, session)
+
+    @staticmethod
+    def _add_token(result: dict, session_id: str, session: VisualizeSession) -> dict:
+        return {**result, "continuation_token": f"{session_id}.{session.get_page()}"}
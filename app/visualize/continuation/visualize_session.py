@@ -0,0 +1,74 @@
+import itertools
+import threading
+
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.code_visualizer import CodeVisualizer
+from app.visualize.container.step_budget import StepBudget
+from app.web.exception.code_visualize_error import CodeVisualizeError
+
+
+# 시각화 결과를 page(page_size개의 시각화 단계) 단위로 나누어 반환하는 클래스
+# 분석 상태(ElementContainer, traveler 위치)는 CodeVisualizer.iter_visualize_code generator가 멈춘 곳에 그대로 남아 있어서,
+# 다음 page를 요청하면 처음부터 다시 분석하지 않고 멈춘 곳부터 필요한 만큼만 이어서 분석한다.
+# (generator는 최상위 문장 단위로 멈추므로 최상위 반복문 하나는 한 번에 분석됨)
+class VisualizeSession:
+
+    def __init__(self, request_code: RequestCode, page_size: int, max_pages: int):
+        # 모든 page의 합에 대한 제한, 분석 제한 시간은 page마다 다시 시작
+        self._step_budget = StepBudget(
+            max_steps=page_size * max_pages,
+            max_while_cycles=settings.MAX_WHILE_CYCLES * max_pages,
+            truncate=True,
+        )
+        self._viz_steps = CodeVisualizer(request_code, self._step_budget).iter_visualize_code()
+        self._page_size = page_size
+        # 다음 page가 있는지 확인하려고 미리 만든 시각화 단계
+        self._next_viz = None
+        # 다음에 반환할 page 번호와 마지막으로 반환한 page
+        self._page = 0
+        self._last_result = None
+        self._lock = threading.Lock()
+
+    def get_page(self):
+        return self._page
+
+    def has_next_page(self):
+        return self._next_viz is not None
+
+    # page 번호의 결과를 반환, 응답을 받지 못해 같은 page를 다시 요청한 경우 마지막 결과를 다시 반환
+    # 이미 지나간 page나 아직 만들 수 없는 page는 None
+    def fetch(self, page: int) -> dict | None:
+        with self._lock:
+            if page == self._page - 1:
+                return self._last_result
+
+            if page != self._page:
+                return None
+
+            self._last_result = self._next_page()
+            self._page += 1
+            return self._last_result
+
+    def _next_page(self) -> dict:
+        self._step_budget.restart_deadline()
+        viz_steps = self._viz_steps if self._next_viz is None else itertools.chain([self._next_viz], self._viz_steps)
+        self._next_viz = None
+        code = []
+
+        try:
+            for viz in viz_steps:
+                if len(code) == self._page_size:
+                    self._next_viz = viz
+                    return {"code": code, "truncated": True}
+
+                code.append(viz)
+
+        except CodeVisualizeError as e:
+            # 모든 page의 합이나 분석 제한 시간을 넘어 분석을 멈춘 경우, 멈춘 이유와 위치를 함께 반환
+            if not self._step_budget.is_stopped():
+                raise
+
+            return {"code": code, **e.result}
+
+        return {"code": code}
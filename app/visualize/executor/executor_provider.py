@@ -0,0 +1,43 @@
+import threading
+
+from app import settings
+from app.visualize.executor.inline_executor import InlineExecutor
+from app.visualize.executor.process_executor import ProcessExecutor
+
+_executor = None
+_lock = threading.Lock()
+
+
+# 설정(VISUALIZE_BACKEND)에 맞는 코드 시각화 실행기를 처음 사용할 때 생성하여 반환
+def get_visualize_executor():
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = _create_executor()
+
+        return _executor
+
+
+def shutdown_visualize_executor():
+    global _executor
+
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def _create_executor():
+    if settings.VISUALIZE_BACKEND == "process":
+        return ProcessExecutor(
+            worker_count=settings.WORKER_COUNT,
+            job_timeout_seconds=settings.WORKER_JOB_TIMEOUT_SECONDS,
+            memory_limit_bytes=settings.WORKER_MEMORY_LIMIT_MB * 1024 * 1024,
+            cpu_limit_seconds=settings.WORKER_CPU_LIMIT_SECONDS,
+        )
+
+    elif settings.VISUALIZE_BACKEND == "inline":
+        return InlineExecutor()
+
+    raise ValueError(f"[executor_provider] {settings.VISUALIZE_BACKEND}는 지원하지 않는 실행기입니다.")
@@ -0,0 +1,33 @@
+from fastapi.encoders import jsonable_encoder
+
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.code_visualizer import CodeVisualizer
+from app.visualize.continuation.session_store import SessionStore
+from app.visualize.continuation.visualize_continuation import VisualizeContinuation
+
+
+# 서버 프로세스 안에서 바로 코드를 시각화하는 실행기 (개발, 테스트용)
+class InlineExecutor:
+
+    def __init__(self):
+        self._session_store = SessionStore(
+            max_sessions=settings.CONTINUATION_MAX_SESSIONS, ttl_seconds=settings.CONTINUATION_SESSION_TTL_SECONDS
+        )
+
+    def run(self, request_code: RequestCode) -> dict:
+        if settings.CONTINUATION_ENABLED:
+            return jsonable_encoder(VisualizeContinuation.start(request_code, self._session_store))
+
+        return jsonable_encoder(CodeVisualizer(request_code).visualize_result())
+
+    # 결과를 자른 응답의 continuation token으로 다음 page를 반환
+    def resume(self, continuation_token: str) -> dict:
+        return jsonable_encoder(VisualizeContinuation.resume(continuation_token, self._session_store))
+
+    def stream(self, request_code: RequestCode):
+        for viz in CodeVisualizer(request_code).iter_visualize_code():
+            yield jsonable_encoder(viz)
+
+    def shutdown(self):
+        return
@@ -0,0 +1,326 @@
+import itertools
+import logging
+import multiprocessing
+import resource
+import signal
+import threading
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.code_visualizer import CodeVisualizer
+from app.visualize.continuation.session_store import SessionStore
+from app.visualize.continuation.visualize_continuation import VisualizeContinuation
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+# worker에 보내는 작업 종류
+_RUN = "run"  # 시각화 결과 전체를 한 번에 반환
+_STREAM = "stream"  # 시각화 단계를 만들어지는 대로 하나씩 반환
+_RESUME = "resume"  # worker에 보관한 session의 다음 page를 반환
+
+
+# 미리 띄워 둔 worker 프로세스에서 코드를 시각화하는 실행기
+# worker 마다 메모리(RLIMIT_AS), CPU 시간(RLIMIT_CPU) 제한을 걸고, 제한 시간을 넘긴 worker는 종료 후 새로 띄운다.
+# 이어 받기 session은 session을 만든 worker에 보관되므로, continuation token 앞에 worker key를 붙여 같은 worker로 보낸다.
+class ProcessExecutor:
+
+    def __init__(
+        self,
+        worker_count: int,
+        job_timeout_seconds: float,
+        memory_limit_bytes: int,
+        cpu_limit_seconds: int,
+        start_method: str = "forkserver",
+    ):
+        self._job_timeout_seconds = job_timeout_seconds
+        self._memory_limit_bytes = memory_limit_bytes
+        self._cpu_limit_seconds = cpu_limit_seconds
+        self._context = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            # 분석 모듈을 미리 import한 forkserver에서 worker를 띄워 worker 시작 비용을 줄임
+            self._context.set_forkserver_preload([__name__])
+        self._worker_keys = itertools.count()
+        self._idle_workers = []
+        # 작업을 기다리는 worker와 실행 중인 worker를 포함한 모든 worker의 key
+        self._live_worker_keys = set()
+        self._idle_condition = threading.Condition()
+
+        for _ in range(worker_count):
+            self._idle_workers.append(self._spawn_worker())
+
+    def run(self, request_code: RequestCode) -> dict:
+        worker = self._acquire_worker()
+
+        try:
+            return self._to_worker_token(worker.run(request_code, self._job_timeout_seconds), worker)
+
+        except _WorkerLostError as e:
+            raise e.to_visualize_error() from e
+
+        finally:
+            self._release_worker(worker)
+
+    # 결과를 자른 응답의 continuation token으로 session을 보관한 worker에서 다음 page를 반환
+    def resume(self, continuation_token: str) -> dict:
+        worker_key, _, session_token = continuation_token.partition(".")
+        worker = self._acquire_worker(worker_key)
+
+        # session을 보관하던 worker가 교체됨
+        if worker is None:
+            raise CodeVisualizeError(ErrorEnum.CONTINUATION_EXPIRED)
+
+        try:
+            return self._to_worker_token(worker.resume(session_token, self._job_timeout_seconds), worker)
+
+        except _WorkerLostError as e:
+            raise e.to_visualize_error() from e
+
+        finally:
+            self._release_worker(worker)
+
+    # 시각화 단계를 worker가 만드는 대로 하나씩 반환
+    def stream(self, request_code: RequestCode):
+        worker = self._acquire_worker()
+
+        try:
+            yield from worker.stream(request_code, self._job_timeout_seconds)
+
+        except _WorkerLostError as e:
+            raise e.to_visualize_error() from e
+
+        finally:
+            self._release_worker(worker)
+
+    def shutdown(self):
+        with self._idle_condition:
+            while self._idle_workers:
+                self._idle_workers.pop().kill()
+
+    def _spawn_worker(self):
+        worker = _Worker(str(next(self._worker_keys)), self._context, self._memory_limit_bytes, self._cpu_limit_seconds)
+        self._live_worker_keys.add(worker.get_key())
+        return worker
+
+    # 작업을 기다리는 worker를 가져옴, worker_key가 있으면 그 worker가 작업을 마칠 때까지 기다림
+    def _acquire_worker(self, worker_key: str = None):
+        with self._idle_condition:
+            while True:
+                if worker_key is not None and worker_key not in self._live_worker_keys:
+                    return None
+
+                for worker in self._idle_workers:
+                    if worker_key is None or worker.get_key() == worker_key:
+                        self._idle_workers.remove(worker)
+                        return worker
+
+                self._idle_condition.wait()
+
+    def _release_worker(self, worker):
+        reusable_worker = self._get_reusable_worker(worker)
+
+        with self._idle_condition:
+            self._idle_workers.append(reusable_worker)
+            self._idle_condition.notify_all()
+
+    def _get_reusable_worker(self, worker):
+        if not worker.is_running_job():
+            return worker
+
+        # 제한 시간 초과, 리소스 제한으로 죽었거나 결과를 끝까지 받지 않은 worker는 새 worker로 교체
+        logging.warning("[ProcessExecutor] worker 교체")
+        worker.kill()
+        with self._idle_condition:
+            self._live_worker_keys.discard(worker.get_key())
+        return self._spawn_worker()
+
+    @staticmethod
+    def _to_worker_token(result: dict, worker):
+        if "continuation_token" in result:
+            result["continuation_token"] = f"{worker.get_key()}.{result['continuation_token']}"
+
+        return result
+
+
+class _Worker:
+
+    def __init__(self, key: str, context, memory_limit_bytes: int, cpu_limit_seconds: int):
+        self._key = key
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_worker_main, args=(child_conn, memory_limit_bytes, cpu_limit_seconds), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._running_job = False
+
+    def run(self, request_code: RequestCode, timeout_seconds: float):
+        deadline = time.monotonic() + timeout_seconds
+        self._send(_RUN, request_code)
+        status, payload = self._recv(deadline)
+
+        return _unpack_result(status, payload)
+
+    def resume(self, session_token: str, timeout_seconds: float):
+        deadline = time.monotonic() + timeout_seconds
+        self._send(_RESUME, session_token)
+        status, payload = self._recv(deadline)
+
+        return _unpack_result(status, payload)
+
+    def stream(self, request_code: RequestCode, timeout_seconds: float):
+        deadline = time.monotonic() + timeout_seconds
+        self._send(_STREAM, request_code)
+
+        while True:
+            status, payload = self._recv(deadline)
+
+            if status == "step":
+                yield payload
+            elif status == "ok":
+                return
+            else:
+                _unpack_result(status, payload)
+
+    def get_key(self):
+        return self._key
+
+    def is_running_job(self):
+        return self._running_job
+
+    def _send(self, mode: str, job: RequestCode | str):
+        self._running_job = True
+        try:
+            self._conn.send((mode, job))
+        except OSError as e:
+            raise self._to_worker_lost_error() from e
+
+    def _recv(self, deadline: float):
+        try:
+            if not self._conn.poll(max(deadline - time.monotonic(), 0)):
+                raise _WorkerLostError(ErrorEnum.EXECUTION_TIMEOUT, "job timeout")
+
+            status, payload = self._conn.recv()
+
+        except (EOFError, OSError) as e:
+            raise self._to_worker_lost_error() from e
+
+        if status != "step":
+            self._running_job = False
+
+        return status, payload
+
+    def _to_worker_lost_error(self):
+        # worker가 CPU 시간 제한(SIGXCPU) 등으로 종료된 경우
+        self._process.join(timeout=1)
+        if self._process.exitcode == -signal.SIGXCPU:
+            return _WorkerLostError(ErrorEnum.EXECUTION_TIMEOUT, "cpu limit")
+        return _WorkerLostError(ErrorEnum.MEMORY_LIMIT_EXCEEDED, f"exitcode {self._process.exitcode}")
+
+    def kill(self):
+        self._conn.close()
+        if self._process.is_alive():
+            self._process.kill()
+        self._process.join()
+
+
+class _WorkerLostError(Exception):
+
+    def __init__(self, error_enum: ErrorEnum, reason: str):
+        super().__init__(reason)
+        self.error_enum = error_enum
+
+    def to_visualize_error(self):
+        return CodeVisualizeError(self.error_enum)
+
+
+def _worker_main(conn, memory_limit_bytes: int, cpu_limit_seconds: int):
+    # 서버 종료(Ctrl+C)는 부모 프로세스가 처리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+    # 이어 받기 session은 worker 프로세스 안에 보관
+    session_store = SessionStore(
+        max_sessions=settings.CONTINUATION_MAX_SESSIONS, ttl_seconds=settings.CONTINUATION_SESSION_TTL_SECONDS
+    )
+
+    while True:
+        try:
+            mode, job = conn.recv()
+        except EOFError:
+            return
+
+        _set_cpu_limit(cpu_limit_seconds)
+        if mode == _STREAM:
+            conn.send(_visualize_stream(conn, job))
+        elif mode == _RESUME:
+            conn.send(_resume(job, session_store))
+        else:
+            conn.send(_visualize(job, session_store))
+
+
+def _set_cpu_limit(cpu_limit_seconds: int):
+    # RLIMIT_CPU는 프로세스 누적 CPU 시간이므로 작업마다 지금까지 사용한 시간에 제한 시간을 더해 설정
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used_seconds = int(usage.ru_utime + usage.ru_stime) + 1
+    resource.setrlimit(resource.RLIMIT_CPU, (used_seconds + cpu_limit_seconds, resource.RLIM_INFINITY))
+
+
+def _visualize(request_code: RequestCode, session_store: SessionStore):
+    try:
+        if settings.CONTINUATION_ENABLED:
+            return "ok", jsonable_encoder(VisualizeContinuation.start(request_code, session_store))
+
+        return "ok", jsonable_encoder(CodeVisualizer(request_code).visualize_result())
+
+    except Exception as e:
+        return _to_error_result(e)
+
+
+def _resume(session_token: str, session_store: SessionStore):
+    try:
+        return "ok", jsonable_encoder(VisualizeContinuation.resume(session_token, session_store))
+
+    except Exception as e:
+        return _to_error_result(e)
+
+
+def _visualize_stream(conn, request_code: RequestCode):
+    try:
+        for viz in CodeVisualizer(request_code).iter_visualize_code():
+            conn.send(("step", jsonable_encoder(viz)))
+
+        return "ok", None
+
+    except Exception as e:
+        return _to_error_result(e)
+
+
+def _to_error_result(e: Exception):
+    if isinstance(e, CodeVisualizeError):
+        return "visualize_error", (e.error_enum.name, e.result)
+
+    elif isinstance(e, NotImplementedError):
+        return "not_implemented", e.args
+
+    elif isinstance(e, MemoryError):
+        return "visualize_error", (ErrorEnum.MEMORY_LIMIT_EXCEEDED.name, {})
+
+    return "error", f"{type(e).__name__}: {e}"
+
+
+# worker가 보낸 결과를 서버 프로세스의 결과나 예외로 변환
+def _unpack_result(status: str, payload):
+    if status == "ok":
+        return payload
+
+    elif status == "visualize_error":
+        error_name, result = payload
+        raise CodeVisualizeError(ErrorEnum[error_name], result)
+
+    elif status == "not_implemented":
+        raise NotImplementedError(*payload)
+
+    raise RuntimeError(f"[ProcessExecutor] {payload}")
@@ -1,16 +1,18 @@
 from app.visualize.analysis.stmt.models.assign_stmt_obj import AssignStmtObj
+from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
+from app.visualize.analysis.stmt.parser.expr.models.subscript_target import SubscriptTarget
 from app.visualize.generator.models.assign_viz import AssignViz
 from app.visualize.generator.models.variable_vlz import Variable, SubscriptIdx
 from app.visualize.generator.visualization_manager import VisualizationManager
 from app.visualize.utils import utils
-from app.visualize.utils.utils import getStringType
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class AssignConverter:
     @staticmethod
     def convert(assign_obj: AssignStmtObj, viz_manager: VisualizationManager):
         expr_stmt_obj = assign_obj.expr_stmt_obj
-        var_type = getStringType(expr_stmt_obj.value)
+        var_type = expr_stmt_obj.value_type.value
         call_stack_name = assign_obj.call_stack_name
 
         return AssignConverter._convert_to_assign_viz(
@@ -20,21 +22,22 @@ class AssignConverter:
     @staticmethod
     def convert_user_func(assign_obj: AssignStmtObj, viz_manager: VisualizationManager):
         user_func_stmt_obj = assign_obj.expr_stmt_obj
-        var_type = utils.getStringType(user_func_stmt_obj.expr[-1])
+        var_type = ExprType.judge_collection_type(user_func_stmt_obj.value).value
         call_stack_name = assign_obj.call_stack_name
 
-        return AssignViz(
-            variables=[
-                Variable(
-                    id=user_func_stmt_obj.id,
-                    expr=user_func_stmt_obj.expr[-1],
-                    name=assign_obj.targets[0],
-                    code=viz_manager.get_code_by_idx(user_func_stmt_obj.id),
-                    type=var_type,
-                )
-            ],
-            callStackName=call_stack_name,
-        )
+        target = assign_obj.targets[0]
+        code = viz_manager.get_code_by_idx(user_func_stmt_obj.id)
+
+        if isinstance(target, SubscriptTarget):
+            variable = AssignConverter._create_subscript_variable(
+                user_func_stmt_obj.id, user_func_stmt_obj.expr[-1], target, code, var_type
+            )
+        else:
+            variable = Variable(
+                id=user_func_stmt_obj.id, expr=user_func_stmt_obj.expr[-1], name=target, code=code, type=var_type
+            )
+
+        return AssignViz(variables=[variable], callStackName=call_stack_name)
 
     @staticmethod
     def _convert_to_assign_viz(expr_stmt_obj, viz_manager, targets, var_type: str, call_stack_name: str):
@@ -62,7 +65,7 @@ class AssignConverter:
                 [
                     Variable(
                         id=expr_stmt_obj.id,
-                        expr=str(expr_stmt_obj.value[idx]),
+                        expr=ValueRenderer.render(expr_stmt_obj.value[idx]),
                         name=target[idx],
                         code=viz_manager.get_code_by_idx(expr_stmt_obj.id),
                         type="variable",
@@ -71,16 +74,14 @@ class AssignConverter:
                 ]
             )
 
-        elif utils.is_subscript(target):
-            target, idx = utils.extract_subscript(target)
+        elif isinstance(target, SubscriptTarget):
             variable_list.append(
-                Variable(
-                    id=expr_stmt_obj.id,
-                    expr=expr_stmt_obj.expressions[-1] if expr_stmt_obj.expressions else None,
-                    name=target,
-                    idx=idx,
-                    code=viz_manager.get_code_by_idx(expr_stmt_obj.id),
-                    type=var_type,
+                AssignConverter._create_subscript_variable(
+                    expr_stmt_obj.id,
+                    expr_stmt_obj.expressions[-1] if expr_stmt_obj.expressions else None,
+                    target,
+                    viz_manager.get_code_by_idx(expr_stmt_obj.id),
+                    var_type,
                 )
             )
 
@@ -100,3 +101,18 @@ class AssignConverter:
                     type=var_type,
                 )
             )
+
+    # 중첩된 target(a[i][j] = v)은 변수의 첫 번째 요소(a[i])가 바뀐 것으로 시각화
+    @staticmethod
+    def _create_subscript_variable(id, expr, target: SubscriptTarget, code, var_type: str):
+        index = target.indices[0]
+
+        if isinstance(index, slice):
+            idx = SubscriptIdx(start=index.start, end=index.stop)
+        else:
+            idx = SubscriptIdx(start=index, end=index)
+
+        if target.element_expr is not None:
+            expr = target.element_expr
+
+        return Variable(id=id, expr=expr, name=target.name, idx=idx, code=code, type=var_type)
@@ -10,7 +10,6 @@ from app.visualize.generator.models.len_viz import LenViz
 from app.visualize.generator.models.print_viz import PrintViz
 from app.visualize.generator.models.variable_vlz import Variable
 from app.visualize.generator.visualization_manager import VisualizationManager
-from app.visualize.utils.utils import getStringType
 
 
 class ExprConverter:
@@ -63,7 +62,7 @@ class ExprConverter:
                 id=call_id,
                 depth=depth,
                 expr=expr_stmt_obj.expressions[idx],
-                type=getStringType(expr_stmt_obj.expressions[-1]),
+                type=expr_stmt_obj.value_type.value,
                 code=viz_manager.get_code_by_idx(call_id),
             )
             for idx in range(len(expr_stmt_obj.expressions))
@@ -102,7 +101,7 @@ class ExprConverter:
                     expr=expr_stmt_obj.expressions[-1],
                     name=expr_stmt_obj.value,
                     code=viz_manager.get_code_by_idx(call_id),
-                    type=getStringType(expr_stmt_obj.expressions[-1]),
+                    type=expr_stmt_obj.value_type.value,
                 ),
                 type=expr_stmt_obj.expr_type.value,
                 callStackName=expr_stmt_obj.call_stack_name,
@@ -120,7 +119,7 @@ class ExprConverter:
                     expr=expr_stmt_obj.expressions[-1],
                     name=expr_stmt_obj.expressions[0],
                     code=viz_manager.get_code_by_idx(call_id),
-                    type=getStringType(expr_stmt_obj.expressions[-1]),
+                    type=expr_stmt_obj.value_type.value,
                 ),
                 type=expr_stmt_obj.expr_type.value,
             )
@@ -152,7 +151,7 @@ class ExprConverter:
                 expr=expr_stmt_obj.expressions[1],
                 console=expr_stmt_obj.value + "\n",
                 code=viz_manager.get_code_by_idx(call_id),
-                type=getStringType(expr_stmt_obj.value),
+                type=expr_stmt_obj.value_type.value,
             )
         )
         return input_vizs
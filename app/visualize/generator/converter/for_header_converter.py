@@ -4,6 +4,7 @@ from app.visualize.analysis.stmt.parser.expr.models.expr_obj import RangeObj, Na
 from app.visualize.generator.highlight.for_highlight import ForHighlight
 from app.visualize.generator.models.for_viz import ForViz, ForConditionViz
 from app.visualize.generator.visualization_manager import VisualizationManager
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class ForHeaderConvertor:
@@ -19,7 +20,7 @@ class ForHeaderConvertor:
 
     @staticmethod
     def get_updated_header(header_viz: ForViz, new_cur):
-        new_condition = header_viz.condition.copy_with_cur(new_cur)
+        new_condition = header_viz.condition.copy_with_cur(ValueRenderer.render(new_cur))
 
         return header_viz.update(new_condition, ForHighlight.get_highlight_attr(new_condition))
 
@@ -66,13 +67,34 @@ class ForHeaderConvertor:
 
     @staticmethod
     def _get_list_condition(target_name, iter_obj):
-        # ['1','2','3'..]
-        condition_value = list(map(str, iter_obj.value))
+        # 전체 값을 문자열로 바꾸지 않고 처음과 마지막 값만 사용
+        first_value, last_value = ForHeaderConvertor._get_first_and_last(iter_obj.value)
+        first_value = ValueRenderer.render(first_value)
 
         return ForConditionViz(
             target_name,
-            cur=condition_value[0],
-            start=condition_value[0],
-            end=condition_value[-1],
+            cur=first_value,
+            start=first_value,
+            end=ValueRenderer.render(last_value),
             step=str(1),
         )
+
+    # 인덱스로 접근할 수 없는 dict 등은 처음부터 반복하여 마지막 값을 찾음
+    @staticmethod
+    def _get_first_and_last(value):
+        if not value:
+            raise IndexError("[ForHeaderConvertor]: 반복할 값이 없습니다.")
+
+        first_value = next(iter(value))
+
+        if isinstance(value, _INDEXABLE_TYPES):
+            return first_value, value[-1]
+
+        for last_value in value:
+            pass
+
+        return first_value, last_value
+
+
+# 마지막 값을 value[-1]로 바로 읽을 수 있는 타입
+_INDEXABLE_TYPES = (range, list, tuple, str)
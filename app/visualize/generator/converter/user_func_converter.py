@@ -1,8 +1,9 @@
 from app.visualize.analysis.stmt.models.user_func_stmt_obj import UserFuncStmtObj
+from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 from app.visualize.generator.models.user_func_viz import CallUserFuncViz, CreateCallStackViz, Argument, EndUserFuncViz
 from app.visualize.generator.models.variable_vlz import SubscriptIdx
 from app.visualize.generator.visualization_manager import VisualizationManager
-from app.visualize.utils.utils import getStringType
+from app.visualize.utils.value_renderer import ValueRenderer
 
 
 class UserFuncConverter:
@@ -21,18 +22,7 @@ class UserFuncConverter:
     @staticmethod
     def convert_to_create_call_stack(user_func_stmt_obj: UserFuncStmtObj, viz_manager: VisualizationManager):
         arguments = [
-            Argument(
-                id=user_func_stmt_obj.id,
-                expr=str(arg_value),
-                name=arg_name,
-                type=getStringType(arg_value),
-                code=viz_manager.get_code_by_idx(user_func_stmt_obj.id),
-                idx=(
-                    SubscriptIdx(start=0, end=len(arg_value) - 1)
-                    if getStringType(arg_value) in ("list", "tuple")
-                    else SubscriptIdx(start=0, end=0)
-                ),
-            )
+            UserFuncConverter._create_argument(user_func_stmt_obj, viz_manager, arg_name, arg_value)
             for arg_name, arg_value in user_func_stmt_obj.args.items()
         ]
 
@@ -43,6 +33,23 @@ class UserFuncConverter:
             code=viz_manager.get_code_by_idx(user_func_stmt_obj.id),
         )
 
+    @staticmethod
+    def _create_argument(user_func_stmt_obj: UserFuncStmtObj, viz_manager: VisualizationManager, arg_name, arg_value):
+        arg_type = ExprType.judge_collection_type(arg_value)
+
+        return Argument(
+            id=user_func_stmt_obj.id,
+            expr=ValueRenderer.render(arg_value),
+            name=arg_name,
+            type=arg_type.value,
+            code=viz_manager.get_code_by_idx(user_func_stmt_obj.id),
+            idx=(
+                SubscriptIdx(start=0, end=len(arg_value) - 1)
+                if arg_type in (ExprType.LIST, ExprType.TUPLE)
+                else SubscriptIdx(start=0, end=0)
+            ),
+        )
+
     @staticmethod
     def convert_to_end_user_func(user_func_stmt_obj: UserFuncStmtObj, targets, viz_manager: VisualizationManager):
 
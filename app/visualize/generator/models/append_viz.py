@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from app.visualize.generator.models.variable_vlz import Variable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttributeViz:
     variable: Variable
     type: str
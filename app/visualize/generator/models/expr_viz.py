@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExprViz:
     id: int
     depth: int
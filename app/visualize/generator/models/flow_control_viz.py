@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlowControlViz:
     id: int
     depth: int
@@ -11,7 +11,7 @@ class FlowControlViz:
     type: str = field(default="flowControl", init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReturnFlowControlViz:
     id: int
     depth: int
@@ -1,7 +1,7 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForConditionViz:
     target: str
     cur: str
@@ -14,12 +14,12 @@ class ForConditionViz:
 
     def changed_attr(self):
         if str(self.cur) == self.start:
-            return list(self.__dict__.keys())
+            return [attr.name for attr in fields(self)]
 
         return ["cur"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForViz:
     id: int
     depth: int
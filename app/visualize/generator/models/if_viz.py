@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionViz:
     id: int
     expr: str
@@ -9,7 +9,7 @@ class ConditionViz:
     code: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IfElseDefineViz:
     depth: int
     conditions: tuple[ConditionViz, ...]
@@ -17,7 +17,7 @@ class IfElseDefineViz:
     type: str = field(default="ifElseDefine", init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IfElseChangeViz:
     id: int
     depth: int
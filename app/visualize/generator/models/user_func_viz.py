@@ -4,7 +4,7 @@ from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 from app.visualize.generator.models.variable_vlz import SubscriptIdx
 
 
-@dataclass
+@dataclass(slots=True)
 class Argument:
     id: int
     expr: str
@@ -14,7 +14,7 @@ class Argument:
     idx: SubscriptIdx = field(default=SubscriptIdx(0, 0))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CallUserFuncViz:
     id: int
     assignName: str
@@ -24,7 +24,7 @@ class CallUserFuncViz:
     type: str = field(default="callUserFunc", init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateCallStackViz:
     id: int
     args: list[Argument]
@@ -33,7 +33,7 @@ class CreateCallStackViz:
     type: str = field(default="createCallStack", init=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EndUserFuncViz:
     id: int
     depth: int
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileDefineViz:
     id: int
     expr: str
@@ -11,7 +11,7 @@ class WhileDefineViz:
     type: str = "whileDefine"
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileChangeConditionViz:
     id: int
     depth: int
@@ -0,0 +1,154 @@
+import json
+import math
+
+from app import settings
+
+# 값이 너무 커서 생략한 부분을 나타내는 표시
+ELISION = "..."
+
+# 다른 값을 담는 타입과 str(), repr()에서 사용하는 괄호
+_BRACKETS = {list: ("[", "]"), tuple: ("(", ")"), set: ("{", "}"), dict: ("{", "}")}
+
+
+# 시각화 표현식에 넣을 값을 문자열로 만드는 클래스
+# str(), repr(), json.dumps()와 같은 형식으로 만들되, 요소 개수, 문자열 길이, 중첩 깊이가 설정값을 넘는 부분은 ...로 생략한다.
+# 값이 아무리 커도 시각화 단계 하나에서 만드는 문자열의 길이와 비용이 제한된다.
+class ValueRenderer:
+
+    def __init__(self, json_format: bool = False):
+        self._json_format = json_format
+        self._max_elements = settings.RENDER_MAX_ELEMENTS
+        self._max_depth = settings.RENDER_MAX_DEPTH
+        # 앞으로 더 만들 수 있는 문자열 길이, 괄호와 구분자는 세지 않음
+        self._remaining_length = settings.RENDER_MAX_LENGTH
+
+    # str(value)
+    @staticmethod
+    def render(value) -> str:
+        if type(value) in _BRACKETS:
+            return ValueRenderer()._render(value, 0)
+
+        return ValueRenderer._render_str(value)
+
+    # repr(value)
+    @staticmethod
+    def render_repr(value) -> str:
+        return ValueRenderer()._render(value, 0)
+
+    # json.dumps(value)
+    @staticmethod
+    def render_json(value) -> str:
+        return ValueRenderer(json_format=True)._render(value, 0)
+
+    # 요소의 표현식을 ", "로 이어 붙임, [a + 1, 20]의 "a + 1, 20" 부분
+    @staticmethod
+    def join(expressions) -> str:
+        max_elements = settings.RENDER_MAX_ELEMENTS
+        text = ValueRenderer.clip(", ".join(str(expression) for expression in expressions[:max_elements]))
+
+        if len(expressions) > max_elements and not text.endswith(ELISION):
+            text += ", " + ELISION
+
+        return text
+
+    @staticmethod
+    def clip(text: str) -> str:
+        max_length = settings.RENDER_MAX_LENGTH
+
+        if len(text) <= max_length:
+            return text
+
+        return text[:max_length] + ELISION
+
+    @staticmethod
+    def _render_str(value) -> str:
+        if type(value) is int:
+            return ValueRenderer._render_int(value)
+
+        return ValueRenderer.clip(str(value))
+
+    # 아주 큰 정수는 10진수 문자열로 바꾸는 비용이 크므로 자릿수만 표시
+    @staticmethod
+    def _render_int(value: int) -> str:
+        digits = math.floor(value.bit_length() * math.log10(2)) + 1
+
+        if digits > settings.RENDER_MAX_LENGTH:
+            return f"{'-' if value < 0 else ''}{ELISION}({digits} digits)"
+
+        return str(value)
+
+    def _render(self, value, depth: int) -> str:
+        brackets = _BRACKETS.get(type(value))
+
+        if brackets is None:
+            text = self._render_scalar(value)
+            self._remaining_length -= len(text)
+            return text
+
+        if self._json_format and type(value) is not dict:
+            brackets = _BRACKETS[list]
+
+        return self._render_collection(value, brackets, depth)
+
+    def _render_collection(self, value, brackets: tuple, depth: int) -> str:
+        open_bracket, close_bracket = brackets
+
+        if not value:
+            return "set()" if type(value) is set and not self._json_format else open_bracket + close_bracket
+
+        if depth >= self._max_depth:
+            return open_bracket + ELISION + close_bracket
+
+        items = value.items() if type(value) is dict else value
+        parts = []
+
+        for i, item in enumerate(items):
+            if i == self._max_elements or self._remaining_length <= 0:
+                parts.append(ELISION)
+                break
+
+            if type(value) is dict:
+                key, item_value = item
+                parts.append(f"{self._render_key(key, depth + 1)}: {self._render(item_value, depth + 1)}")
+            else:
+                parts.append(self._render(item, depth + 1))
+
+        text = ", ".join(parts)
+
+        # 요소가 하나인 tuple은 (1,)로 표시
+        if type(value) is tuple and len(value) == 1 and not self._json_format:
+            text += ","
+
+        return open_bracket + text + close_bracket
+
+    # json.dumps는 dict의 key를 문자열로 바꿈
+    def _render_key(self, key, depth: int) -> str:
+        if self._json_format and type(key) is not str:
+            key = self._render_scalar(key)
+
+        return self._render(key, depth)
+
+    def _render_scalar(self, value) -> str:
+        if type(value) is str:
+            return self._render_text(value)
+
+        if type(value) is int:
+            return ValueRenderer._render_int(value)
+
+        if self._json_format:
+            try:
+                return ValueRenderer.clip(json.dumps(value))
+            except (TypeError, ValueError):
+                return ValueRenderer.clip(str(value))
+
+        return ValueRenderer.clip(repr(value))
+
+    # 따옴표 안쪽을 잘라서 'abc...' 형식으로 표시
+    def _render_text(self, value: str) -> str:
+        max_length = settings.RENDER_MAX_LENGTH
+        text = json.dumps(value[:max_length]) if self._json_format else repr(value[:max_length])
+
+        if len(value) <= max_length:
+            return text
+
+        return text[:-1] + ELISION + text[-1]
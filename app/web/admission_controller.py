@@ -0,0 +1,95 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from app.web.exception.server_busy_error import ServerBusyError
+
+_END = object()
+
+
+# 코드 시각화 요청의 동시 실행 개수와 대기열 길이를 제한하는 클래스
+# 대기열이 가득 찼거나 대기 시간이 길어지면 요청을 기다리게 하지 않고 바로 거절한다.
+class AdmissionController:
+
+    def __init__(
+        self, max_concurrency: int, max_queue_size: int, queue_timeout_seconds: float, retry_after_seconds: int
+    ):
+        self._max_concurrency = max_concurrency
+        self._max_queue_size = max_queue_size
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._retry_after_seconds = retry_after_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._thread_pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="edupi-visualize")
+        self._running_count = 0
+        self._waiting_count = 0
+        self._rejected_count = 0
+
+    # 실행 슬롯을 얻은 뒤 전용 스레드 풀에서 func를 실행
+    async def run(self, func, *args):
+        await self._acquire()
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._thread_pool, func, *args)
+        finally:
+            self._running_count -= 1
+            self._semaphore.release()
+
+    # 실행 슬롯을 얻은 뒤 iter_func가 반환한 generator의 값을 전용 스레드 풀에서 하나씩 꺼내 반환
+    async def stream(self, iter_func, *args):
+        await self._acquire()
+        iterator = iter_func(*args)
+        future = None
+
+        try:
+            while True:
+                future = self._thread_pool.submit(next, iterator, _END)
+                item = await asyncio.wrap_future(future)
+
+                if item is _END:
+                    return
+
+                yield item
+
+        finally:
+            # 중간에 연결이 끊긴 경우에도 generator를 닫아 실행기(worker)를 정리
+            # 스레드에서 next()가 실행 중이면 끝난 뒤에 닫음
+            if future is None or future.done():
+                self._thread_pool.submit(iterator.close)
+            else:
+                future.add_done_callback(lambda _: iterator.close())
+
+            self._running_count -= 1
+            self._semaphore.release()
+
+    # 응답을 보내기 시작하기 전에 대기열이 가득 찼는지 확인
+    def check_capacity(self):
+        if self._semaphore.locked() and self._waiting_count >= self._max_queue_size:
+            self._reject()
+
+    def get_stats(self) -> dict:
+        return {
+            "running": self._running_count,
+            "queue_depth": self._waiting_count,
+            "max_concurrency": self._max_concurrency,
+            "max_queue_size": self._max_queue_size,
+            "rejected": self._rejected_count,
+        }
+
+    def shutdown(self):
+        self._thread_pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _acquire(self):
+        self.check_capacity()
+
+        self._waiting_count += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self._queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            self._reject()
+        finally:
+            self._waiting_count -= 1
+
+        self._running_count += 1
+
+    def _reject(self):
+        self._rejected_count += 1
+        raise ServerBusyError(retry_after_seconds=self._retry_after_seconds, queue_depth=self._waiting_count)
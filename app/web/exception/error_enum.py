@@ -6,6 +6,13 @@ class ErrorEnum(Enum):
     # 400
     NOT_SUPPORTED_VISUALIZE = "CV-400001", "It contains syntax that we can't visualize yet."
     VISUALIZE_TIMEOUT = "CV-400002", "The code is too long."
+    EXECUTION_TIMEOUT = "CV-400003", "The code took too long to run."
+    MEMORY_LIMIT_EXCEEDED = "CV-400004", "The code used too much memory."
+    CONTINUATION_EXPIRED = "CV-400005", "The visualization has expired. Please run the code again."
+    OPERATION_TOO_LARGE = "CV-400006", "The code computes a value that is too large."
+
+    # 503
+    SERVER_BUSY = "CV-503001", "The server is busy. Please try again later."
 
     def __init__(self, code, detail):
         self.code = code
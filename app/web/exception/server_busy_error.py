@@ -0,0 +1,14 @@
+from starlette import status
+
+from app.web.base_exception import BaseCustomException
+from app.web.exception.error_enum import ErrorEnum
+
+
+class ServerBusyError(BaseCustomException):
+    def __init__(self, retry_after_seconds: int, queue_depth: int):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_enum=ErrorEnum.SERVER_BUSY,
+            result={"queue_depth": queue_depth},
+        )
+        self.retry_after_seconds = retry_after_seconds
@@ -4,8 +4,10 @@ from fastapi import FastAPI, Request
 from starlette import status
 from starlette.responses import JSONResponse
 
+from app.web.base_exception import BaseCustomException
 from app.web.exception.code_visualize_error import CodeVisualizeError
 from app.web.exception.error_enum import ErrorEnum
+from app.web.exception.server_busy_error import ServerBusyError
 from app.web.models.error_response import ErrorResponse
 
 
@@ -15,6 +17,15 @@ def setup_exception_handlers(app: FastAPI):
         response = ErrorResponse(code=exc.error_enum.code, detail=exc.error_enum.detail, result=exc.result)
         return JSONResponse(status_code=exc.status_code, content=response.to_dict())
 
+    @app.exception_handler(ServerBusyError)
+    async def server_busy_exception_handler(request: Request, exc: ServerBusyError):
+        response = ErrorResponse(code=exc.error_enum.code, detail=exc.error_enum.detail, result=exc.result)
+        return JSONResponse(
+            status_code=exc.status_code,
+            content=response.to_dict(),
+            headers={"Retry-After": str(exc.retry_after_seconds)},
+        )
+
     @app.exception_handler(NotImplementedError)
     async def code_execute_exception_handler(request: Request, exc: NotImplementedError):
         logging.error(f"[NotImplementedError Exception] : {exc.args}")
@@ -30,3 +41,16 @@ def setup_exception_handlers(app: FastAPI):
                                  detail=ErrorEnum.NOT_SUPPORTED_VISUALIZE.detail)
 
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=response.to_dict())
+
+
+# 예외를 응답 body로 변환 (이미 응답을 보내기 시작한 스트리밍 응답처럼 핸들러를 거치지 않는 경우에 사용)
+def to_error_response(exc: Exception) -> ErrorResponse:
+    if isinstance(exc, BaseCustomException):
+        return ErrorResponse(code=exc.error_enum.code, detail=exc.error_enum.detail, result=exc.result)
+
+    elif isinstance(exc, NotImplementedError):
+        logging.error(f"[NotImplementedError Exception] : {exc.args}")
+    else:
+        logging.error(f"[Unknown Exception] : {exc.args}")
+
+    return ErrorResponse(code=ErrorEnum.NOT_SUPPORTED_VISUALIZE.code, detail=ErrorEnum.NOT_SUPPORTED_VISUALIZE.detail)
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from app.models.request_code import RequestCode
+
+
+# 같은 코드와 입력으로 들어온 요청의 응답 body(bytes)를 저장하는 LRU 캐시
+# 전체 크기(max_bytes)를 넘으면 가장 오래 사용하지 않은 결과부터 지우고, ttl_seconds가 지난 결과는 사용하지 않는다.
+class ResultCache:
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key : (만료 시각, 응답 body)
+        self._used_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def make_key(request_code: RequestCode) -> str:
+        payload = json.dumps([request_code.source_code, request_code.input], ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, body = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return body
+
+    def put(self, key: str, body: bytes):
+        # 캐시 전체보다 큰 결과는 저장하지 않음
+        if len(body) > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, body)
+            self._used_bytes += len(body)
+
+            while self._used_bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "used_bytes": self._used_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def _remove(self, key: str):
+        _, body = self._entries.pop(key)
+        self._used_bytes -= len(body)
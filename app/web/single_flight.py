@@ -0,0 +1,28 @@
+import asyncio
+
+
+# 같은 key로 동시에 들어온 작업을 한 번만 실행하고, 나머지 요청은 그 결과(예외 포함)를 함께 받도록 하는 클래스
+class SingleFlight:
+
+    def __init__(self):
+        self._in_flight = {}  # key : 실행 중인 작업(asyncio.Task)
+        self._coalesced_count = 0
+
+    async def run(self, key: str, coroutine_func, *args):
+        task = self._in_flight.get(key)
+
+        if task is None:
+            # 먼저 들어온 요청이 연결을 끊어도 기다리는 요청이 있으므로 작업은 별도 task로 실행
+            task = asyncio.ensure_future(coroutine_func(*args))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self._coalesced_count += 1
+
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> dict:
+        return {
+            "in_flight": len(self._in_flight),
+            "coalesced": self._coalesced_count,
+        }
@@ -0,0 +1,95 @@
+# ExprTraveler, BinopExpr, CompareExpr의 node/연산자 분기 비용 측정
+# 이전 방식(isinstance 분기)과 현재 방식(type을 key로 하는 dict 조회)을 같은 node 목록으로 비교한다.
+#
+# 실행 : python -m benchmarks.dispatch_benchmark
+import ast
+import timeit
+
+from app.visualize.analysis.stmt.parser.expr import expr_traveler
+from app.visualize.analysis.stmt.parser.expr.expr_traveler import ExprTraveler
+from app.visualize.analysis.stmt.parser.expr.parser import binop_expr, compare_expr
+from app.visualize.container.element_container import ElementContainer
+
+SOURCE = """
+a = 10
+b = [1, 2, 3]
+c = a + b[0] * 2 - 3 // 1 % 4
+d = (a, b, 'x')
+e = {'k': a}
+f = a < 20 <= 30 != 4
+g = len(b) + sum(b)
+h = -a
+i = f'{a} {b[0]}'
+j = b[1:2]
+k = a ** 2 / 3
+l = a in b
+"""
+
+# 이전 ExprTraveler.travel의 isinstance 분기 순서
+EXPR_NODE_TYPES = (
+    ast.BinOp,
+    ast.Name,
+    ast.Constant,
+    ast.Call,
+    ast.List,
+    ast.Tuple,
+    ast.Dict,
+    ast.Compare,
+    ast.Subscript,
+    ast.Slice,
+    ast.Attribute,
+    ast.UnaryOp,
+    ast.FormattedValue,
+    ast.JoinedStr,
+    ast.arguments,
+)
+BINOP_OP_TYPES = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+COMPARE_OP_TYPES = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Is, ast.IsNot, ast.In, ast.NotIn)
+
+
+def isinstance_dispatch(nodes, node_types):
+    for node in nodes:
+        for node_type in node_types:
+            if isinstance(node, node_type):
+                break
+
+
+def dict_dispatch(nodes, handlers):
+    for node in nodes:
+        handlers.get(type(node))
+
+
+def measure(name, func, repeat=5, number=2000):
+    seconds = min(timeit.repeat(func, repeat=repeat, number=number))
+    print(f"{name:<40} {seconds / number * 1e6:8.2f} us/loop")
+    return seconds
+
+
+def main():
+    tree = ast.parse(SOURCE)
+    expr_nodes = [node for node in ast.walk(tree) if type(node) in expr_traveler._EXPR_HANDLERS]
+    binop_ops = [node.op for node in ast.walk(tree) if isinstance(node, ast.BinOp)] * 10
+    compare_ops = [op for node in ast.walk(tree) if isinstance(node, ast.Compare) for op in node.ops] * 10
+
+    print(f"expr node {len(expr_nodes)}개, 산술 연산자 {len(binop_ops)}개, 비교 연산자 {len(compare_ops)}개")
+
+    for title, nodes, node_types, handlers in (
+        ("ExprTraveler.travel", expr_nodes, EXPR_NODE_TYPES, expr_traveler._EXPR_HANDLERS),
+        ("BinopExpr 연산자", binop_ops, BINOP_OP_TYPES, binop_expr._OPERATORS),
+        ("CompareExpr 연산자", compare_ops, COMPARE_OP_TYPES, compare_expr._OPERATORS),
+    ):
+        before = measure(f"{title} - isinstance 분기", lambda: isinstance_dispatch(nodes, node_types))
+        after = measure(f"{title} - dict 조회", lambda: dict_dispatch(nodes, handlers))
+        print(f"{'':<40} {before / after:8.2f}x\n")
+
+    # 실제 분석 : 할당문 오른쪽 식 전체를 ExprTraveler로 분석
+    def travel_all():
+        elem_container = ElementContainer([], "main")
+        for stmt in tree.body:
+            elem_container.add_element(stmt.targets[0].id, ExprTraveler.travel(stmt.value, elem_container).value)
+
+    measure("ExprTraveler.travel 전체 분석", travel_all, number=500)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# 분석 엔진 비교 : interpreter(ExprTraveler가 매번 node를 분기), compiled(ExprCompiler가 만든 closure 실행),
+# native(NativeTracer로 실제 실행한 기록을 따라 분석)
+# 같은 코드를 두 엔진으로 분석하여 걸린 시간과 결과가 같은지 확인한다. (변환 단계는 두 엔진이 같으므로 제외)
+#
+# 실행 : python -m benchmarks.engine_benchmark
+import ast
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.analysis.native.native_stmt_traveler import NativeStmtTraveler
+from app.visualize.analysis.stmt.parser.expr.expr_compiler import ExprCompiler
+from app.visualize.analysis.stmt.parser.expr.static_expr import StaticExpr
+from app.visualize.analysis.stmt.stmt_traveler import StmtTraveler
+from app.visualize.code_visualizer import CodeVisualizer
+from app.visualize.container.element_container import ElementContainer
+
+SOURCES = {
+    "중첩 for + if": """
+total = 0
+for i in range(8):
+    for j in range(8):
+        if j % 2 == 0:
+            total = total + i * j - 1
+        else:
+            total = total - 1
+""",
+    "while + list": """
+n = 0
+a = [1, 2, 3]
+while n < 80:
+    n = n + a[n % 3] * 2 - 1
+    a[0] = n
+""",
+    "함수 호출": """
+def add(x, y):
+    return x + y * 2
+
+s = 0
+for i in range(40):
+    s = add(s, i)
+""",
+}
+
+
+def analyze(source, engine):
+    tree = ast.parse(source)
+    StaticExpr.attach(tree)
+    if engine == "compiled":
+        ExprCompiler.attach(tree)
+    if engine == "native":
+        return NativeStmtTraveler.travel(tree.body, ElementContainer([""], "main"))
+
+    return StmtTraveler.travel(tree.body, ElementContainer([""], "main"))
+
+
+def visualize(source, engine):
+    settings.ANALYSIS_ENGINE = engine
+    return jsonable_encoder(CodeVisualizer(RequestCode(source_code=source, input="")).visualize_code())
+
+
+def measure(func, repeat=5, number=5):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    print(f"{'코드':<16} {'interpreter':>12} {'compiled':>12} {'native':>12}  결과")
+    for name, source in SOURCES.items():
+        interpreter = measure(lambda: analyze(source, "interpreter"))
+        compiled = measure(lambda: analyze(source, "compiled"))
+        native = measure(lambda: analyze(source, "native"))
+        expected = visualize(source, "interpreter")
+        same = [engine for engine in ("compiled", "native") if visualize(source, engine) == expected]
+
+        print(
+            f"{name:<16} {interpreter * 1e3:>10.2f}ms {compiled * 1e3:>10.2f}ms {native * 1e3:>10.2f}ms"
+            f"  interpreter와 같음: {', '.join(same) or '없음'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
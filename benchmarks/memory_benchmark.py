@@ -0,0 +1,89 @@
+# 분석 객체(ExprObj, ExprStmtObj, ...)와 시각화 객체(Variable, PrintViz, ...)가 차지하는 메모리 측정
+# 1. 중첩 반복문 코드를 분석, 변환한 결과를 들고 있을 때 시각화 단계 하나당 bytes (tracemalloc)
+# 2. 같은 필드를 가진 __dict__ 기반 dataclass와 현재 dataclass의 객체 하나당 bytes 비교
+#
+# 실행 : python -m benchmarks.memory_benchmark
+import ast
+import dataclasses
+import gc
+import tracemalloc
+
+from app.visualize.analysis.stmt.stmt_traveler import StmtTraveler
+from app.visualize.container.element_container import ElementContainer
+from app.visualize.generator.converter_traveler import ConverterTraveler
+from app.visualize.generator.visualization_manager import VisualizationManager
+
+SOURCE = """
+total = 0
+for i in range(10):
+    for j in range(5):
+        total = total + i * j
+        print(total)
+"""
+
+INSTANCE_COUNT = 10000
+
+
+def measure_bytes(func):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return result, size
+
+
+def visualize():
+    analysis_objs = StmtTraveler.travel(ast.parse(SOURCE).body, ElementContainer([], "main"))
+    viz_objs = ConverterTraveler.travel(analysis_objs, VisualizationManager(SOURCE))
+    return analysis_objs, viz_objs
+
+
+def collect_instances(analysis_objs, viz_objs):
+    samples = {}
+    stack = [*analysis_objs, *viz_objs]
+
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            samples.setdefault(type(obj), obj)
+            stack.extend(getattr(obj, field.name) for field in dataclasses.fields(obj))
+
+    return samples
+
+
+# 같은 필드, 같은 값을 가지지만 __slots__ 없이 __dict__에 값을 저장하는 dataclass 생성
+def to_dict_backed(cls, sample):
+    dict_backed_cls = dataclasses.make_dataclass(
+        cls.__name__, [(field.name, field.type) for field in dataclasses.fields(cls)], frozen=True
+    )
+    values = {field.name: getattr(sample, field.name) for field in dataclasses.fields(cls)}
+    return lambda: dict_backed_cls(**values)
+
+
+def copy_of(sample):
+    values = {field.name: getattr(sample, field.name) for field in dataclasses.fields(sample) if field.init}
+    return lambda: type(sample)(**values)
+
+
+def main():
+    (analysis_objs, viz_objs), trace_bytes = measure_bytes(visualize)
+    print(f"시각화 단계 {len(viz_objs)}개, 단계당 {trace_bytes / len(viz_objs):,.0f} bytes (분석 + 시각화 객체 전체)\n")
+
+    print(f"{'class':<24} {'__dict__':>10} {'현재':>10}")
+    for cls, sample in sorted(collect_instances(analysis_objs, viz_objs).items(), key=lambda item: item[0].__name__):
+        dict_backed = to_dict_backed(cls, sample)
+        current = copy_of(sample)
+        _, dict_backed_bytes = measure_bytes(lambda: [dict_backed() for _ in range(INSTANCE_COUNT)])
+        _, current_bytes = measure_bytes(lambda: [current() for _ in range(INSTANCE_COUNT)])
+        print(f"{cls.__name__:<24} {dict_backed_bytes / INSTANCE_COUNT:>10.0f} {current_bytes / INSTANCE_COUNT:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# 사전 실행(NativePreflight) 비교 : 시각화 단계 제한을 넘는 코드를 거절하기까지 걸린 시간과 제한 안의 코드에 더해지는 시간
+# interpreter도 분석 중에 단계 수를 세어 바로 중단하므로, 사전 실행이 도움이 되는 경우는 표현식 하나의 계산이 오래 걸리거나
+# 메모리를 많이 쓰는 코드처럼 분석 단계에서는 중간에 멈출 수 없는 코드이다.
+#
+# 실행 : python -m benchmarks.preflight_benchmark
+import time
+
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.code_visualizer import CodeVisualizer
+
+SOURCES = {
+    "제한 초과 (print)": "for i in range(5000):\n    print(i)\n",
+    "제한 초과 (while)": "a = 0\nwhile a < 100000:\n    a = a + 1\n",
+    "제한 초과 (계산)": "total = 0\nfor i in range(300):\n    for j in range(300):\n        total = total + i * j\n",
+    "긴 계산": "a = 3 ** 3 ** 14\n",
+    "큰 메모리": "a = list(range(10 ** 8))\n",
+    "제한 안": "total = 0\nfor i in range(30):\n    total = total + i\n",
+}
+
+
+def measure(source, preflight):
+    settings.NATIVE_PREFLIGHT_ENABLED = preflight
+    start = time.perf_counter()
+
+    try:
+        CodeVisualizer(RequestCode(source_code=source, input="")).visualize_code()
+        result = "성공"
+    except Exception as e:
+        result = e.error_enum.name if hasattr(e, "error_enum") else type(e).__name__
+
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(f"{'코드':<16} {'사전 실행 없음':>14} {'사전 실행':>12}  결과")
+    for name, source in SOURCES.items():
+        without_preflight, result = measure(source, False)
+        with_preflight, preflight_result = measure(source, True)
+
+        print(
+            f"{name:<16} {without_preflight * 1e3:>12.1f}ms {with_preflight * 1e3:>10.1f}ms"
+            f"  {result} / {preflight_result}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@ import ast
 from unittest.mock import MagicMock
 
 import pytest
+from fastapi.encoders import jsonable_encoder
 
+from app import settings
+from app.models.request_code import RequestCode
 from app.visualize.analysis.stmt.models.expr_stmt_obj import ExprStmtObj
+from app.visualize.code_visualizer import CodeVisualizer
 from app.visualize.container.element_container import ElementContainer
 from app.visualize.generator.visualization_manager import VisualizationManager
 
@@ -12,6 +16,7 @@ from app.visualize.generator.visualization_manager import VisualizationManager
 def elem_container():
     mock = MagicMock(spec=ElementContainer)
     mock.get_element.return_value = 10
+    mock.is_analysis_stopped.return_value = False
     return mock
 
 
@@ -60,3 +65,17 @@ def create_ast():
 @pytest.fixture
 def create_expr_stmt_obj():
     return ExprStmtObj(id=1, value="", expressions=("",), expr_type="")
+
+
+@pytest.fixture
+def visualize_with_engine(monkeypatch):
+    # 분석 엔진을 바꿔서 코드를 시각화한 결과를 반환하는 함수, 예외가 발생하면 (예외 타입, 메시지)를 반환
+    def _visualize_with_engine(engine, source_code, input_=""):
+        monkeypatch.setattr(settings, "ANALYSIS_ENGINE", engine)
+
+        try:
+            return jsonable_encoder(CodeVisualizer(RequestCode(source_code=source_code, input=input_)).visualize_code())
+        except Exception as e:
+            return type(e), str(e)
+
+    return _visualize_with_engine
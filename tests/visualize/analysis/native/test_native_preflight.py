@@ -0,0 +1,128 @@
+import subprocess
+import time
+
+import pytest
+
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.analysis.native.native_preflight import NativePreflight
+from app.visualize.analysis.stmt.stmt_traveler import StmtTraveler
+from app.visualize.code_visualizer import CodeVisualizer
+from app.visualize.continuation.visualize_session import VisualizeSession
+from app.visualize.container.step_budget import StepBudget
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+@pytest.fixture
+def preflight():
+    return NativePreflight(timeout_seconds=3, memory_limit_bytes=256 * 1024 * 1024)
+
+
+@pytest.mark.parametrize(
+    "source_code",
+    [
+        pytest.param("a = 1\nfor i in range(10):\n    a = a + i\n", id="제한 안"),
+        pytest.param("a = 1 / 0\n", id="학생 코드 예외"),
+    ],
+)
+def test_제한_안에_끝나는_코드는_통과(preflight, source_code):
+    preflight.check(RequestCode(source_code, ""), max_steps=100)
+
+
+@pytest.mark.parametrize(
+    "source_code, error_enum",
+    [
+        pytest.param("for i in range(200):\n    print(i)\n", ErrorEnum.VISUALIZE_TIMEOUT, id="최대 단계 초과"),
+        pytest.param("a = 0\nwhile True:\n    a = a + 1\n", ErrorEnum.VISUALIZE_TIMEOUT, id="무한 반복"),
+        pytest.param("a = sorted(range(10 ** 9))\n", ErrorEnum.MEMORY_LIMIT_EXCEEDED, id="메모리 초과"),
+    ],
+)
+def test_제한을_넘는_코드는_거절(preflight, source_code, error_enum):
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        preflight.check(RequestCode(source_code, ""), max_steps=100)
+
+    assert exc_info.value.error_enum is error_enum
+
+
+def test_제한_시간_안에_끝나지_않으면_VISUALIZE_TIMEOUT():
+    preflight = NativePreflight(timeout_seconds=0.5, memory_limit_bytes=256 * 1024 * 1024)
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        preflight.check(RequestCode("a = sum(range(10 ** 10))\n", ""), max_steps=100)
+
+    assert exc_info.value.error_enum is ErrorEnum.VISUALIZE_TIMEOUT
+
+
+@pytest.mark.parametrize(
+    "source_code",
+    [
+        pytest.param("a = ().__class__\n", id="내부 속성 접근"),
+        pytest.param(
+            "def f():\n    pass\nf.g = (f.g.gi_frame.f_back.f_back.f_globals for x in [1])\n",
+            id="generator frame으로 서버 모듈 접근",
+        ),
+    ],
+)
+def test_실행해도_안전한지_알_수_없는_코드는_실행하지_않음(preflight, mocker, source_code):
+    mock_run = mocker.patch.object(subprocess, "run")
+
+    preflight.check(RequestCode(source_code, ""), max_steps=100)
+
+    mock_run.assert_not_called()
+
+
+def test_사전_실행_프로세스에_서버의_환경_변수를_전달하지_않음(preflight, mocker):
+    mock_run = mocker.patch.object(
+        subprocess, "run", return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout="ok\n")
+    )
+
+    preflight.check(RequestCode("a = 1\n", ""), max_steps=100)
+
+    assert mock_run.call_args.kwargs["env"] == {}
+
+
+def test_사전_실행이_거절하면_interpreter로_분석하지_않음(monkeypatch, mocker):
+    monkeypatch.setattr(settings, "NATIVE_PREFLIGHT_ENABLED", True)
+    mock_iter_travel = mocker.spy(StmtTraveler, "iter_travel")
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        CodeVisualizer(RequestCode("for i in range(5000):\n    print(i)\n", "")).visualize_code()
+
+    assert exc_info.value.error_enum is ErrorEnum.VISUALIZE_TIMEOUT
+    mock_iter_travel.assert_not_called()
+
+
+def test_사전_실행에_걸린_시간은_분석_제한_시간에서_제외(monkeypatch, mocker):
+    monkeypatch.setattr(settings, "NATIVE_PREFLIGHT_ENABLED", True)
+    mocker.patch.object(NativePreflight, "check", side_effect=lambda request_code, max_steps: time.sleep(0.3))
+    step_budget = StepBudget(timeout_seconds=0.2)
+
+    CodeVisualizer(RequestCode("a = 1\n", ""), step_budget)
+
+    assert not step_budget.is_past_deadline()
+
+
+@pytest.mark.parametrize(
+    "source_code",
+    [
+        pytest.param("for i in range(5000):\n    print(i)\n", id="최대 단계 초과"),
+        pytest.param("i = 0\nwhile True:\n    i = i + 1\n", id="무한 반복"),
+    ],
+)
+def test_결과를_자르는_경우_사전_실행하지_않고_제한까지의_결과를_반환(monkeypatch, source_code):
+    monkeypatch.setattr(settings, "NATIVE_PREFLIGHT_ENABLED", True)
+    monkeypatch.setattr(settings, "TRUNCATE_AT_MAX_STEPS", True)
+
+    result = CodeVisualizer(RequestCode(source_code, "")).visualize_result()
+
+    assert result["truncated"] is True
+    assert len(result["code"]) == settings.MAX_VIZ_STEPS
+
+
+def test_이어_받기_session도_사전_실행하지_않음(monkeypatch):
+    monkeypatch.setattr(settings, "NATIVE_PREFLIGHT_ENABLED", True)
+    session = VisualizeSession(RequestCode("for i in range(5000):\n    print(i)\n", ""), page_size=100, max_pages=2)
+
+    assert len(session.fetch(0)["code"]) == 100
+    assert session.has_next_page()
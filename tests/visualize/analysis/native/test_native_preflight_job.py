@@ -0,0 +1,54 @@
+import os
+import resource
+
+import pytest
+
+from app.visualize.analysis.native import native_preflight_job
+from app.visualize.analysis.native.native_preflight_job import OK, run_job
+
+
+@pytest.fixture
+def mock_os(mocker):
+    # 테스트 프로세스의 권한과 리소스 제한은 바꾸지 않음
+    mocker.patch.object(resource, "setrlimit")
+    for name in ("setgroups", "setgid", "setuid"):
+        mocker.patch.object(os, name)
+
+    return mocker
+
+
+def job(source_code="a = 1\n"):
+    return {
+        "source_code": source_code,
+        "input": [""],
+        "max_steps": 10,
+        "timeout_seconds": 1,
+        "memory_limit_bytes": 256 * 1024 * 1024,
+    }
+
+
+def test_root로_실행되면_권한_없는_사용자로_바꾼_뒤_실행(mock_os):
+    mock_os.patch.object(os, "geteuid", return_value=0)
+
+    assert run_job(job()) == OK
+
+    os.setgroups.assert_called_once_with([])
+    os.setgid.assert_called_once_with(native_preflight_job._UNPRIVILEGED_ID)
+    os.setuid.assert_called_once_with(native_preflight_job._UNPRIVILEGED_ID)
+
+
+def test_root가_아니면_사용자를_바꾸지_않음(mock_os):
+    mock_os.patch.object(os, "geteuid", return_value=1000)
+
+    assert run_job(job()) == OK
+
+    os.setuid.assert_not_called()
+
+
+def test_파일_쓰기와_프로세스_생성을_제한(mock_os):
+    mock_os.patch.object(os, "geteuid", return_value=1000)
+
+    run_job(job())
+
+    resource.setrlimit.assert_any_call(resource.RLIMIT_FSIZE, (0, 0))
+    resource.setrlimit.assert_any_call(resource.RLIMIT_NPROC, (0, 0))
@@ -0,0 +1,117 @@
+import ast
+
+import pytest
+
+from app.visualize.analysis.native.native_stmt_traveler import NativeStmtTraveler
+from app.visualize.analysis.native.native_tracer import NativeTracer
+
+
+@pytest.mark.parametrize(
+    "source_code, input_",
+    [
+        pytest.param("for i in range(5):\n    if i % 2 == 0:\n        continue\n    print(i)\n", "", id="for continue"),
+        pytest.param("for i in range(10):\n    if i == 3:\n        break\n    print(i)\n", "", id="for break"),
+        pytest.param("for i in [1, 2]:\n    for j in [3, 4]:\n        print(i * j)\n", "", id="중첩 for"),
+        pytest.param("n = 3\nwhile n > 0:\n    n = n - 1\nelse:\n    print(n)\n", "", id="while else"),
+        pytest.param(
+            "a = 5\nif a > 10:\n    print('big')\nelif a > 3:\n    print('mid')\nelse:\n    print('small')\n",
+            "",
+            id="if elif else",
+        ),
+        pytest.param(
+            "def add(a, b):\n    return a + b\ndef twice(x):\n    y = add(x, x)\n    return y\nz = twice(3)\n",
+            "",
+            id="함수 안에서 함수 호출",
+        ),
+        pytest.param(
+            "n = 1\ndef f(a):\n    global n\n    n = a\n    return a\ny = f(3)\nprint(n, y)\n", "", id="global"
+        ),
+        pytest.param("a = input()\nb = input()\n", "only", id="input 부족"),
+    ],
+)
+def test_native_engine_interpreter와_같은_결과(visualize_with_engine, source_code, input_):
+    expected = visualize_with_engine("interpreter", source_code, input_)
+
+    assert visualize_with_engine("native", source_code, input_) == expected
+
+
+def test_while_break는_실제_실행대로_반복을_멈춤(visualize_with_engine):
+    source_code = "n = 0\nwhile True:\n    n = n + 1\n    if n > 2:\n        break\nprint(n)\n"
+
+    result = visualize_with_engine("native", source_code)
+
+    assert result[-1]["console"] == "3\n"
+
+
+def test_continue_이후의_문장은_실행하지_않음(visualize_with_engine):
+    source_code = (
+        "total = 0\nfor i in range(4):\n    if i == 1:\n        continue\n    total = total + i\nprint(total)\n"
+    )
+
+    result = visualize_with_engine("native", source_code)
+
+    assert result[-1]["console"] == "5\n"
+
+
+def test_같은_list를_가리키는_변수는_함께_바뀜(visualize_with_engine):
+    result = visualize_with_engine("native", "a = [1]\nb = a\nb.append(2)\nprint(a)\n")
+
+    assert result[-1]["console"] == "[1, 2]\n"
+
+
+def test_학생_코드의_예외는_실제_예외로_전달(visualize_with_engine):
+    assert visualize_with_engine("native", "a = 1\nb = c\n") == (NameError, "name 'c' is not defined")
+
+
+@pytest.mark.parametrize(
+    "source_code, expected",
+    [
+        pytest.param("a = 1\nfor i in range(a):\n    print(i)\n", True, id="지원"),
+        pytest.param("a = 1; b = 2\n", False, id="한 줄에 여러 문장"),
+        pytest.param("a = [1,\n     2]\n", False, id="여러 줄 문장"),
+        pytest.param("if True: a = 1\n", False, id="header와 같은 줄의 body"),
+        pytest.param("def f():\n    'doc'\n", False, id="상수만 있는 문장"),
+        pytest.param("a = [1]\na.append(2)\nb = a.pop()\n", True, id="list 함수"),
+        pytest.param("a = ().__class__\n", False, id="내부 속성 접근"),
+        pytest.param("import os\n", False, id="지원하지 않는 문장"),
+        pytest.param("a = '{0.__class__}'.format(1)\n", False, id="str.format"),
+        pytest.param("a = [1]\nb = a.copy()\n", False, id="허용하지 않은 속성"),
+        pytest.param("def f():\n    pass\nf.g = 1\n", False, id="속성에 할당"),
+        pytest.param("g = (x for x in [1])\n", False, id="generator"),
+        pytest.param("a = [x for x in [1]]\n", False, id="comprehension"),
+        pytest.param("f = lambda: 1\n", False, id="lambda"),
+        pytest.param("def f():\n    yield 1\n", False, id="yield"),
+        pytest.param("def f():\n    pass\nb = f.f_globals\n", False, id="함수의 globals"),
+        pytest.param(
+            "def f():\n    pass\nf.g = (f.g.gi_frame.f_back.f_back.f_globals for x in [1])\n",
+            False,
+            id="generator frame으로 서버 모듈 접근",
+        ),
+        pytest.param("a = 2\nb = a * a\n", False, id="상수가 아닌 곱셈"),
+        pytest.param("a = 2\na **= 2\n", False, id="상수가 아닌 거듭제곱"),
+        pytest.param("a = pow(2, 10)\n", False, id="pow 함수"),
+        pytest.param("a = list(range(3))\n", False, id="range로 list 생성"),
+        pytest.param("a = 3 ** 10 ** 8\n", False, id="결과가 너무 큰 상수 연산"),
+        pytest.param("a = 2 ** 10\nb = a + a\n", True, id="작은 상수 연산과 덧셈"),
+    ],
+)
+def test_can_travel(source_code, expected):
+    assert NativeStmtTraveler.can_travel(ast.parse(source_code).body) is expected
+
+
+def test_native로_실행할_수_없는_코드는_interpreter로_분석(visualize_with_engine):
+    source_code = "a = [1,\n     2]\nprint(a)\n"
+
+    assert visualize_with_engine("native", source_code) == visualize_with_engine("interpreter", source_code)
+
+
+def test_frame을_따라_서버_모듈에_접근하는_코드는_실행하지_않음(visualize_with_engine, mocker):
+    source_code = (
+        "def f():\n    pass\nf.g = (f.g.gi_frame.f_back.f_back.f_globals for x in [1])\n"
+        "list(f.g)[0]['os'].system('echo escaped')\n"
+    )
+    mock_run = mocker.spy(NativeTracer, "run")
+
+    visualize_with_engine("native", source_code)
+
+    mock_run.assert_not_called()
@@ -0,0 +1,105 @@
+import ast
+import sys
+
+import pytest
+
+from app.visualize.analysis.native.models.trace_obj import CallTrace, LineEvent
+from app.visualize.analysis.native.native_tracer import NativeTracer
+from app.visualize.container.step_budget import StepBudget
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+def run(source_code, input_list=None, step_budget=None):
+    tracer = NativeTracer(input_list or [""], step_budget or StepBudget())
+    return tracer.run(ast.parse(source_code))
+
+
+def test_줄마다_실행_직전의_변수_값_기록():
+    trace_obj = run("a = [1]\nb = a\nb.append(2)\n")
+
+    assert trace_obj.error is None
+    assert [event.lineno for event in trace_obj.main_trace.events] == [1, 2, 3]
+    assert trace_obj.main_trace.events[0].local_variables == {}
+    assert trace_obj.main_trace.events[2].local_variables == {"a": [1], "b": [1]}
+
+
+def test_기록한_값은_이후_실행에서_바뀌지_않고_변수_사이의_참조는_유지():
+    trace_obj = run("a = [1]\nb = a\nb.append(2)\nc = 0\n")
+    before_append = trace_obj.main_trace.events[2].local_variables
+
+    assert before_append["a"] == [1]
+    assert before_append["a"] is before_append["b"]
+
+
+def test_함수_호출은_호출한_frame_안에_CallTrace로_기록():
+    trace_obj = run("def f(x):\n    y = x + 1\n    return y\nz = f(1)\n")
+    events = trace_obj.main_trace.events
+
+    assert [type(event) for event in events] == [LineEvent, LineEvent, CallTrace]
+    assert events[2].func_name == "f"
+    assert [event.lineno for event in events[2].events] == [2, 3]
+    assert events[2].events[1].local_variables == {"x": 1, "y": 2}
+
+
+def test_함수_frame은_사용하는_전역_변수만_기록():
+    trace_obj = run("n = 1\nm = 2\ndef f():\n    return n\nf()\n")
+    call_trace = trace_obj.main_trace.events[-1]
+
+    assert call_trace.events[0].global_variables == {"n": 1}
+
+
+def test_input은_요청의_input을_차례로_반환():
+    trace_obj = run("a = input()\nb = input('num')\nc = 0\n", ["hello", "41"])
+
+    assert trace_obj.main_trace.events[-1].local_variables == {"a": "hello", "b": "41"}
+
+
+@pytest.mark.parametrize(
+    "source_code, error_type",
+    [
+        pytest.param("f = open('a.txt')\n", NameError, id="open"),
+        pytest.param("import os\n", ImportError, id="import"),
+        pytest.param("a = 1 / 0\n", ZeroDivisionError, id="학생 코드 예외"),
+    ],
+)
+def test_학생_코드의_예외는_실행을_멈추고_결과에_저장(source_code, error_type):
+    trace_obj = run(source_code)
+
+    assert isinstance(trace_obj.error, error_type)
+
+
+def test_실행한_줄이_최대_개수를_넘으면_VISUALIZE_TIMEOUT():
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        run("a = 0\nwhile True:\n    a = a + 1\n", step_budget=StepBudget(max_steps=10))
+
+    assert exc_info.value.error_enum is ErrorEnum.VISUALIZE_TIMEOUT
+
+
+def test_분석_제한_시간이_지나면_EXECUTION_TIMEOUT():
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        run("a = [i for i in range(10)]\n", step_budget=StepBudget(timeout_seconds=-1))
+
+    assert exc_info.value.error_enum is ErrorEnum.EXECUTION_TIMEOUT
+
+
+def test_값이_너무_커지면_실행을_멈추고_결과에_저장():
+    trace_obj = run("s = 'x'\nwhile True:\n    s = s + s\n", step_budget=StepBudget(max_steps=1000))
+
+    assert trace_obj.error.error_enum is ErrorEnum.OPERATION_TOO_LARGE
+
+
+@pytest.mark.parametrize("name", ["print", "input"])
+def test_print_input은_서버_모듈의_전역_변수에_접근할_수_없음(name):
+    safe_builtins = NativeTracer([""], StepBudget())._create_builtins(None)
+
+    assert not hasattr(safe_builtins[name], "__globals__")
+    assert not hasattr(safe_builtins[name].func, "__globals__")
+
+
+def test_실행이_끝나면_이전_tracer를_복원():
+    previous_trace = sys.gettrace()
+
+    run("a = 1\n")
+
+    assert sys.gettrace() is previous_trace
@@ -49,6 +49,16 @@ def test_parse(mocker, elem_container_dict: dict, expressions: tuple, args: list
     mock_create_expressions.assert_called_once_with(args[0])
 
 
+def test_parse_value_type은_인자의_타입():
+    attr_obj = AttributeObj(value=[1].append, expressions=("a", "[1]"), type=ExprType.APPEND)
+    args = [NameObj(value=[2, 3], expressions=("b", "[2, 3]"), type=ExprType.LIST)]
+
+    result = AppendExpr.parse(attr_obj, args)
+
+    assert result.value == "a"
+    assert result.value_type is ExprType.LIST
+
+
 def test_parse_wrong_arguments():
     attr_obj = MagicMock(spec=AttributeObj)
     args = [MagicMock(spec=ExprObj), MagicMock(spec=ExprObj)]
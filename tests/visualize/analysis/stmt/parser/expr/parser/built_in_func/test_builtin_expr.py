@@ -0,0 +1,48 @@
+import pytest
+
+from app.visualize.analysis.stmt.parser.expr.models.expr_obj import BuiltinObj, ConstantObj
+from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
+from app.visualize.analysis.stmt.parser.expr.parser.built_in_func.builtin_expr import BuiltinExpr
+
+
+@pytest.mark.parametrize(
+    "func_name, args, expected",
+    [
+        pytest.param(
+            "abs",
+            [ConstantObj(value=-3, expressions=("-3",))],
+            BuiltinObj(value=3, expressions=("abs(-3)", "3"), type=ExprType.VARIABLE),
+            id="abs(-3): success case",
+        ),
+        pytest.param(
+            "divmod",
+            [ConstantObj(value=7, expressions=("7",)), ConstantObj(value=2, expressions=("2",))],
+            BuiltinObj(value=(3, 1), expressions=("(3, 1)",), type=ExprType.TUPLE),
+            id="divmod(7, 2): success case",
+        ),
+    ],
+)
+def test_parse(func_name, args, expected):
+    assert BuiltinExpr.parse(func_name, args) == expected
+
+
+@pytest.mark.parametrize(
+    "func_name",
+    [
+        pytest.param("eval", id="eval"),
+        pytest.param("exec", id="exec"),
+        pytest.param("compile", id="compile"),
+        pytest.param("open", id="open"),
+        pytest.param("__import__", id="__import__"),
+        pytest.param("getattr", id="getattr"),
+    ],
+)
+def test_is_builtin_func_안전하지_않은_builtin은_제외(func_name):
+    assert not BuiltinExpr.is_builtin_func(func_name)
+
+
+def test_parse_실패한_builtin은_예외를_전달():
+    with pytest.raises(NotImplementedError) as exc_info:
+        BuiltinExpr.parse("int", [ConstantObj(value="abc", expressions=("abc",))])
+
+    assert isinstance(exc_info.value.__cause__, ValueError)
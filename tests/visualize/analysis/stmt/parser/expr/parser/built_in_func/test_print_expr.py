@@ -1,5 +1,6 @@
 import pytest
 
+from app import settings
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ConstantObj, BinopObj, PrintObj, ExprObj
 from app.visualize.analysis.stmt.parser.expr.parser.built_in_func.print_expr import PrintExpr
 
@@ -165,3 +166,12 @@ def test_create_expressions(args: list[ExprObj], keyword_arg_dict: dict, expecte
 )
 def test_get_value(args: list[ExprObj], keyword_arg_dict: dict, expected: PrintObj):
     PrintExpr._get_value(args, keyword_arg_dict)
+
+
+def test_get_value_긴_값은_설정한_길이까지만_출력(monkeypatch):
+    monkeypatch.setattr(settings, "RENDER_MAX_LENGTH", 10)
+    args = [ConstantObj(value="x" * 1000000, expressions=("'xxx...'",)), ConstantObj(value=2**20000, expressions=())]
+
+    result = PrintExpr._get_value(args, {"sep": " ", "end": "\n"})
+
+    assert result == "xxxxxxxxxx...\n"
@@ -11,18 +11,18 @@ from app.visualize.analysis.stmt.parser.expr.parser.built_in_func.range_expr imp
     [
         pytest.param(
             [ConstantObj(value=5, expressions=("5",))],
-            RangeObj(value=tuple(range(0, 5, 1)), expressions=(RangeExpression(start="0", end="5", step="1"),)),
+            RangeObj(value=range(0, 5, 1), expressions=(RangeExpression(start="0", end="5", step="1"),)),
             id="range(5): success case",
         ),
         pytest.param(
             [ConstantObj(value=1, expressions=("1",)), ConstantObj(value=5, expressions=("5",))],
-            RangeObj(value=tuple(range(1, 5, 1)), expressions=(RangeExpression(start="1", end="5", step="1"),)),
+            RangeObj(value=range(1, 5, 1), expressions=(RangeExpression(start="1", end="5", step="1"),)),
             id="range(1, 5): success case",
         ),
         pytest.param(
             [ConstantObj(value=1, expressions=("1",)), NameObj(value=5, expressions=("a", "5"), type=ExprType.NAME)],
             RangeObj(
-                value=tuple(range(1, 5, 1)),
+                value=range(1, 5, 1),
                 expressions=(
                     RangeExpression(start="1", end="a", step="1"),
                     RangeExpression(start="1", end="5", step="1"),
@@ -36,7 +36,7 @@ from app.visualize.analysis.stmt.parser.expr.parser.built_in_func.range_expr imp
                 ConstantObj(value=5, expressions=("5",)),
                 ConstantObj(value=2, expressions=("2",)),
             ],
-            RangeObj(value=tuple(range(1, 5, 2)), expressions=(RangeExpression(start="1", end="5", step="2"),)),
+            RangeObj(value=range(1, 5, 2), expressions=(RangeExpression(start="1", end="5", step="2"),)),
             id="range(1, 5, 2): success case",
         ),
     ],
@@ -57,17 +57,17 @@ def test_parse(mocker, args: list[ExprObj], expected: RangeObj):
     [
         pytest.param(
             [5],
-            tuple(range(0, 5, 1)),
+            range(0, 5, 1),
             id="range(5): success case",
         ),
         pytest.param(
             [1, 5],
-            tuple(range(1, 5, 1)),
+            range(1, 5, 1),
             id="range(1, 5): success case",
         ),
         pytest.param(
             [1, 5, 2],
-            tuple(range(1, 5, 2)),
+            range(1, 5, 2),
             id="range(1, 5, 2): success case",
         ),
     ],
@@ -138,3 +138,10 @@ def test_make_unit_range_expression(range_list: list, expected):
 def test_make_unit_range_expression_fail():
     with pytest.raises(TypeError):
         RangeExpr._make_unit_range_expression([1, 2, 3, 4])
+
+
+def test_get_value_큰_range도_값을_만들지_않음():
+    result = RangeExpr._get_value([10**12])
+
+    assert isinstance(result, range)
+    assert (len(result), result[0], result[-1]) == (10**12, 0, 10**12 - 1)
@@ -5,6 +5,8 @@ import pytest
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ExprObj, BinopObj, ConstantObj, NameObj
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 from app.visualize.analysis.stmt.parser.expr.parser.binop_expr import BinopExpr
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
 
 
 @pytest.mark.parametrize(
@@ -67,6 +69,20 @@ def test_calculate_value(left_value, right_value, op, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "left_value, right_value, op",
+    [
+        pytest.param(9, 9**9, ast.Pow(), id="9 ** 9 ** 9: fail case"),
+        pytest.param("x", 10**9, ast.Mult(), id="'x' * 10 ** 9: fail case"),
+    ],
+)
+def test_calculate_value_결과가_너무_크면_계산하지_않음(left_value, right_value, op):
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        BinopExpr._calculate_value(left_value, right_value, op)
+
+    assert exc_info.value.error_enum is ErrorEnum.OPERATION_TOO_LARGE
+
+
 @pytest.mark.parametrize(
     "left_obj, right_obj, op, value, expected",
     [
@@ -8,6 +8,7 @@ from app.visualize.analysis.stmt.parser.expr.models.expr_obj import (
     RangeObj,
 )
 from app.visualize.analysis.stmt.parser.expr.models.range_expression import RangeExpression
+from app.visualize.analysis.stmt.parser.expr.parser.built_in_func.builtin_expr import BuiltinExpr
 from app.visualize.analysis.stmt.parser.expr.parser.built_in_func.print_expr import PrintExpr
 from app.visualize.analysis.stmt.parser.expr.parser.built_in_func.range_expr import RangeExpr
 from app.visualize.analysis.stmt.parser.expr.parser.call_expr import CallExpr
@@ -85,3 +86,31 @@ def test_built_in_range_call_parse(mocker, func_name: str, args: list[ExprObj],
 
     assert result == expected
     mock_range_expr_class.assert_called_once_with(args)
+
+
+def test_built_in_common_call_parse(mocker):
+    args = [ConstantObj(value=-3, expressions=("-3",))]
+    mock_builtin_expr_parse = mocker.patch.object(BuiltinExpr, "parse", return_value=mocker.sentinel.builtin_obj)
+
+    result = CallExpr._built_in_call_parse("abs", args, {}, ElementContainer([], "main"))
+
+    assert result is mocker.sentinel.builtin_obj
+    mock_builtin_expr_parse.assert_called_once_with("abs", args)
+
+
+@pytest.mark.parametrize(
+    "func_name",
+    [
+        pytest.param("tuple", id="분석 함수가 없는 builtin: tuple"),
+        pytest.param("dict", id="분석 함수가 없는 builtin: dict"),
+        pytest.param("unknown_func", id="builtin이 아닌 함수"),
+        pytest.param("__name__", id="호출할 수 없는 builtin 속성"),
+        pytest.param("eval", id="코드를 실행하는 builtin: eval"),
+        pytest.param("open", id="파일에 접근하는 builtin: open"),
+        pytest.param("getattr", id="객체 내부에 접근하는 builtin: getattr"),
+        pytest.param("__import__", id="import 하는 builtin: __import__"),
+    ],
+)
+def test_built_in_call_parse_fail(func_name: str):
+    with pytest.raises(NotImplementedError):
+        CallExpr._built_in_call_parse(func_name, [], {}, ElementContainer([], "main"))
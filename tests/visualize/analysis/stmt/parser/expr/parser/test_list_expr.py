@@ -1,8 +1,18 @@
 import pytest
 
-from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ListObj, ExprObj, ConstantObj, NameObj, BinopObj
+from app.visualize.analysis.stmt.parser.expr.models.expr_obj import (
+    ListObj,
+    ExprObj,
+    ConstantObj,
+    NameObj,
+    BinopObj,
+    RangeObj,
+)
+from app.visualize.analysis.stmt.parser.expr.models.range_expression import RangeExpression
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 from app.visualize.analysis.stmt.parser.expr.parser.list_expr import ListExpr
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
 
 
 @pytest.mark.parametrize(
@@ -88,3 +98,20 @@ def test_concat_expression(mocker, expressions, transposed_expression_lists_resu
     result = ListExpr._concat_expressions(elts)
 
     assert result == expected
+
+
+def test_parse_call_range는_요소로_list를_만듦():
+    range_obj = RangeObj(value=range(3), expressions=(RangeExpression(start="0", end="3", step="1"),))
+
+    result = ListExpr.parse_call([range_obj])
+
+    assert result == ListObj(value=[0, 1, 2], expressions=("[0, 1, 2]",))
+
+
+def test_parse_call_요소가_너무_많은_range는_list를_만들지_않음():
+    range_obj = RangeObj(value=range(10**8), expressions=(RangeExpression(start="0", end="100000000", step="1"),))
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        ListExpr.parse_call([range_obj])
+
+    assert exc_info.value.error_enum is ErrorEnum.OPERATION_TOO_LARGE
@@ -4,6 +4,7 @@ import pytest
 from app.visualize.analysis.stmt.parser.expr.models.expr_obj import NameObj
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 from app.visualize.analysis.stmt.parser.expr.parser.name_expr import NameExpr
+from app.visualize.container.element_container import ElementContainer
 
 
 @pytest.mark.parametrize(
@@ -33,6 +34,12 @@ from app.visualize.analysis.stmt.parser.expr.parser.name_expr import NameExpr
             NameObj(value=[0, 1, 2, 3, 4], expressions=("a", "[0, 1, 2, 3, 4]"), type=ExprType.LIST),
             id="a ast.Load(): success case",
         ),
+        pytest.param(
+            ast.Name(ctx=ast.Load(), id="a"),
+            "[0, 1]",
+            NameObj(value="[0, 1]", expressions=("a", "'[0, 1]'"), type=ExprType.VARIABLE),
+            id="a ast.Load(): 리스트처럼 보이는 문자열도 variable",
+        ),
     ],
 )
 def test_parse(set_element_return_value, mocker, node: ast.Name, elem_value, expected: NameObj):
@@ -44,7 +51,7 @@ def test_parse(set_element_return_value, mocker, node: ast.Name, elem_value, exp
     assert isinstance(result, NameObj)
     if isinstance(node.ctx, ast.Load):
         mock_get_identifier_value.assert_called_once_with(node.id, mock_elem_container)
-        mock_create_expressions.assert_called_once_with(node.id, expected.value)
+        mock_create_expressions.assert_called_once_with(node.id, expected.value, mock_elem_container)
     assert result == expected
 
 
@@ -71,9 +78,11 @@ def test_get_identifier_value(elem_container, identifier, expected):
         pytest.param("a", 10, ("a", "10"), id="a 10: success case"),
         pytest.param("abc", 10, ("abc", "10"), id="abc 10: success case"),
         pytest.param("b", "Hello", ("b", "'Hello'"), id="b Hello: success case"),
+        pytest.param("c", [1, 2], ("c", "[1, 2]"), id="c [1, 2]: success case"),
+        pytest.param("d", {"k": 1}, ("d", "{'k': 1}"), id="d {'k': 1}: success case"),
     ],
 )
 def test_create_expressions(identifier_name, value, expected):
-    result = NameExpr._create_expressions(identifier_name, value)
+    result = NameExpr._create_expressions(identifier_name, value, ElementContainer([], "main"))
 
     assert result == expected
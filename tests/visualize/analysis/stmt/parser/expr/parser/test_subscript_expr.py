@@ -11,6 +11,7 @@ from app.visualize.analysis.stmt.parser.expr.models.expr_obj import (
 )
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 from app.visualize.analysis.stmt.parser.expr.models.slice_expression import SliceExpression
+from app.visualize.analysis.stmt.parser.expr.models.subscript_target import SubscriptTarget
 from app.visualize.analysis.stmt.parser.expr.parser.subscript_expr import SubscriptExpr
 
 
@@ -103,28 +104,6 @@ from app.visualize.analysis.stmt.parser.expr.parser.subscript_expr import Subscr
             ),
             id="a[:] - ast.Load: success case",
         ),
-        pytest.param(
-            NameObj(
-                value=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
-                expressions=("a", "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]"),
-                type=ExprType.LIST,
-            ),
-            ConstantObj(value=0, expressions=("0",)),
-            ast.Store(),
-            SubscriptObj(value="a[0]", expressions=("a[0]", "0"), type=ExprType.LIST),
-            id="a[0] - ast.Store: success case",
-        ),
-        pytest.param(
-            NameObj(
-                value=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
-                expressions=("a", "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]"),
-                type=ExprType.LIST,
-            ),
-            SliceObj(value=slice(2, 5), expressions=(SliceExpression(lower="2", upper="5"),)),
-            ast.Store(),
-            SubscriptObj(value="a[2:5]", expressions=("a[2:5]", "[2, 3, 4]"), type=ExprType.LIST),
-            id="a[2:5] - ast.Store: success case",
-        ),
     ],
 )
 def test_parse(mocker, target_obj: ExprObj, slice_obj: ExprObj, ctx, expected: SubscriptObj):
@@ -137,7 +116,7 @@ def test_parse(mocker, target_obj: ExprObj, slice_obj: ExprObj, ctx, expected: S
     result = SubscriptExpr.parse(target_obj, slice_obj, ctx)
 
     assert isinstance(result, SubscriptObj)
-    mock_get_value.assert_called_once_with(target_obj, slice_obj, ctx)
+    mock_get_value.assert_called_once_with(target_obj, slice_obj)
     mock_expr_type.assert_called_once_with(expected.value)
 
 
@@ -172,50 +151,81 @@ def test_get_value_load(slice_obj_value: ExprObj, expected):
         expressions=("l", "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]"),
         type=ExprType.LIST,
     )
-    result = SubscriptExpr._get_value(target_obj_value, slice_obj_value, ast.Load())
+    result = SubscriptExpr._get_value(target_obj_value, slice_obj_value)
 
     assert result == expected
 
 
+def test_parse_store_not_supported():
+    with pytest.raises(TypeError):
+        SubscriptExpr.parse(
+            NameObj(value=[0], expressions=("a", "[0]")), ConstantObj(value=0, expressions=("0",)), ast.Store()
+        )
+
+
 @pytest.mark.parametrize(
-    "target_obj_value, slice_obj_value, expected",
+    "code, expected_name, expected_slices",
+    [
+        pytest.param("a[0] = 1", "a", ["0"], id="a[0] success case"),
+        pytest.param("a[i][j:k] = 1", "a", ["i", "j:k"], id="a[i][j:k] success case"),
+    ],
+)
+def test_split_target(code, expected_name, expected_slices):
+    target_node = ast.parse(code).body[0].targets[0]
+
+    name_node, slice_nodes = SubscriptExpr.split_target(target_node)
+
+    assert name_node.id == expected_name
+    assert [ast.unparse(slice_node) for slice_node in slice_nodes] == expected_slices
+
+
+def test_split_target_not_name():
+    target_node = ast.parse("f()[0] = 1").body[0].targets[0]
+
+    with pytest.raises(TypeError):
+        SubscriptExpr.split_target(target_node)
+
+
+@pytest.mark.parametrize(
+    "name_obj, slice_objs, expected",
     [
         pytest.param(
-            NameObj(
-                value=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
-                expressions=("l", "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]"),
-                type=ExprType.LIST,
-            ),
-            ConstantObj(value=0, expressions=("0",)),
-            "l[0]",
-            id="a[0] success case",
+            NameObj(value=[0, 1, 2], expressions=("l", "[0, 1, 2]"), type=ExprType.LIST),
+            [ConstantObj(value=0, expressions=("0",))],
+            SubscriptTarget(name="l", root=[0, 1, 2], indices=(0,)),
+            id="l[0] success case",
         ),
         pytest.param(
-            NameObj(
-                value=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
-                expressions=("l", "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]"),
-                type=ExprType.LIST,
-            ),
-            SliceObj(value=slice(0, 5), expressions=(SliceExpression(lower="0", upper="5"),)),
-            "l[0:5]",
-            id="a[:5] success case",
+            NameObj(value=[0, 1, 2], expressions=("l", "[0, 1, 2]"), type=ExprType.LIST),
+            [SliceObj(value=slice(None, 2), expressions=(SliceExpression(upper="2"),))],
+            SubscriptTarget(name="l", root=[0, 1, 2], indices=(slice(0, 2),)),
+            id="l[:2] success case",
         ),
         pytest.param(
-            NameObj(
-                value={"key1": "value1", "key2": "value2"},
-                expressions=("d", "{'key1': 'value1', 'key2': 'value2'}"),
-                type=ExprType.LIST,
-            ),
-            ConstantObj(value="key1", expressions=("key1",)),
-            "d[key1]",
+            NameObj(value=[0, 1, 2], expressions=("l", "[0, 1, 2]"), type=ExprType.LIST),
+            [SliceObj(value=slice(None, None, 2), expressions=(SliceExpression(step="2"),))],
+            SubscriptTarget(name="l", root=[0, 1, 2], indices=(slice(None, None, 2),)),
+            id="l[::2] success case",
+        ),
+        pytest.param(
+            NameObj(value={"key1": "value1"}, expressions=("d", "{'key1': 'value1'}"), type=ExprType.DICT),
+            [ConstantObj(value="key1", expressions=("key1",))],
+            SubscriptTarget(name="d", root={"key1": "value1"}, indices=("key1",)),
             id="d['key1'] success case",
         ),
+        pytest.param(
+            NameObj(value=[[0, 1], [2, 3]], expressions=("l", "[[0, 1], [2, 3]]"), type=ExprType.LIST),
+            [ConstantObj(value=1, expressions=("1",)), ConstantObj(value=0, expressions=("0",))],
+            SubscriptTarget(name="l", root=[[0, 1], [2, 3]], indices=(1, 0)),
+            id="l[1][0] success case",
+        ),
     ],
 )
-def test_get_value_store(target_obj_value: ExprObj, slice_obj_value: ExprObj, expected):
-    result = SubscriptExpr._get_value(target_obj_value, slice_obj_value, ast.Store())
+def test_parse_target(name_obj: ExprObj, slice_objs: list[ExprObj], expected: SubscriptTarget):
+    result = SubscriptExpr.parse_target(name_obj, slice_objs)
 
-    assert result == expected
+    assert result.value == expected
+    assert result.value.root is name_obj.value
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,73 @@
+import ast
+
+import pytest
+
+from app import settings
+from app.visualize.analysis.stmt.parser.expr.arithmetic_guard import ArithmeticGuard
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+@pytest.fixture(autouse=True)
+def small_limits(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_INT_RESULT_BITS", 64)
+    monkeypatch.setattr(settings, "MAX_SEQUENCE_RESULT_LENGTH", 10)
+
+
+@pytest.mark.parametrize(
+    "op_type, left, right",
+    [
+        pytest.param(ast.Add, 2**62, 2**62, id="2 ** 62 + 2 ** 62: success case"),
+        pytest.param(ast.Add, "hello", "world", id="'hello' + 'world': success case"),
+        pytest.param(ast.Mult, 2**31, 2**31, id="2 ** 31 * 2 ** 31: success case"),
+        pytest.param(ast.Mult, "*", 10, id="'*' * 10: success case"),
+        pytest.param(ast.Mult, 5, [0, 1], id="5 * [0, 1]: success case"),
+        pytest.param(ast.Mult, "*", -(10**9), id="'*' * -10 ** 9: success case"),
+        pytest.param(ast.Pow, 2, 63, id="2 ** 63: success case"),
+        pytest.param(ast.Pow, 1, 10**100, id="1 ** 10 ** 100: success case"),
+        pytest.param(ast.Pow, 10, -(10**100), id="10 ** -10 ** 100: success case"),
+        pytest.param(ast.Pow, 2.0, 1000, id="2.0 ** 1000: success case"),
+        pytest.param(ast.FloorDiv, 10**100, 3, id="10 ** 100 // 3: success case"),
+    ],
+)
+def test_check_binop(op_type, left, right):
+    ArithmeticGuard.check_binop(op_type, left, right)
+
+
+@pytest.mark.parametrize(
+    "op_type, left, right",
+    [
+        pytest.param(ast.Add, 2**64 - 1, 1, id="2 ** 64 - 1 + 1: fail case"),
+        pytest.param(ast.Sub, -(2**64) + 1, 1, id="-2 ** 64 + 1 - 1: fail case"),
+        pytest.param(ast.Add, "hello", "world!", id="'hello' + 'world!': fail case"),
+        pytest.param(ast.Add, [0] * 6, [0] * 5, id="[0] * 6 + [0] * 5: fail case"),
+        pytest.param(ast.Mult, 2**32, 2**32, id="2 ** 32 * 2 ** 32: fail case"),
+        pytest.param(ast.Mult, "x", 10**9, id="'x' * 10 ** 9: fail case"),
+        pytest.param(ast.Mult, 11, (0,), id="11 * (0,): fail case"),
+        pytest.param(ast.Pow, 2, 65, id="2 ** 65: fail case"),
+        pytest.param(ast.Pow, -3, 41, id="-3 ** 41: fail case"),
+        pytest.param(ast.Pow, 9, 9**9, id="9 ** 9 ** 9: fail case"),
+        pytest.param(ast.Pow, 2, 10**400, id="2 ** 10 ** 400: fail case"),
+    ],
+)
+def test_check_binop_결과가_너무_크면_예외(op_type, left, right):
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        ArithmeticGuard.check_binop(op_type, left, right)
+
+    assert exc_info.value.error_enum is ErrorEnum.OPERATION_TOO_LARGE
+
+
+def test_check_unary_op():
+    ArithmeticGuard.check_unary_op(ast.USub, 2**62)
+    ArithmeticGuard.check_unary_op(ast.Not, 2**100)
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        ArithmeticGuard.check_unary_op(ast.Invert, 2**64 - 1)
+
+    assert exc_info.value.error_enum is ErrorEnum.OPERATION_TOO_LARGE
+
+
+def test_기본_설정으로_허용하는_정수는_문자열로_바꿀_수_있음(monkeypatch):
+    monkeypatch.undo()
+
+    assert str(2**settings.MAX_INT_RESULT_BITS - 1)
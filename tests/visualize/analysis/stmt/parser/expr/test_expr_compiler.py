@@ -0,0 +1,61 @@
+import ast
+
+import pytest
+
+from app.visualize.analysis.stmt.parser.expr.expr_compiler import ExprCompiler
+from app.visualize.analysis.stmt.parser.expr.expr_traveler import ExprTraveler
+from app.visualize.analysis.stmt.parser.expr.parser.binop_expr import BinopExpr
+from app.visualize.container.element_container import ElementContainer
+
+
+@pytest.mark.parametrize(
+    "source_code, input_",
+    [
+        pytest.param("a = 10\nb = a + 3 * 2\nc, d = 1, 2\nprint(a, b, c, d)\n", "", id="할당"),
+        pytest.param(
+            "a = [1, 2, 3]\na.append(4)\na.extend([5, 6])\na.insert(0, 9)\na.remove(2)\nb = a[1:3]\na[0] = 7\n"
+            "n = len(a)\nprint(a, n)\na.pop()\n",
+            "",
+            id="list 함수",
+        ),
+        pytest.param(
+            "total = 0\nfor i in range(1, 6):\n    if i % 2 == 0:\n        continue\n    total = total + i\n",
+            "",
+            id="for",
+        ),
+        pytest.param("a = 0\nwhile a < 5:\n    a = a + 1\nelse:\n    print('end')\n", "", id="while"),
+        pytest.param(
+            "def fact(n):\n    if n <= 1:\n        return 1\n    r = fact(n - 1)\n    return n * r\nx = fact(5)\n",
+            "",
+            id="재귀 함수",
+        ),
+        pytest.param("a = input()\nb = int(input('num'))\nprint(a, b + 1)\n", "hello\n41", id="input"),
+        pytest.param("name = 'kim'\nprint(f'{name} is {len(name) + 1:>4}')\n", "", id="f-string"),
+        pytest.param(
+            "d = {'a': 1}\nt = (1, 2)\nprint(d, t[1], -t[0], not True, 1 < 2 < 3, 2 in t)\n", "", id="dict, tuple"
+        ),
+        pytest.param("a = [[1, 2], [3, 4]]\nprint(a[1][0], sorted(a[0]), max(a[0]))\n", "", id="중첩 list, builtin"),
+        pytest.param("a = [1] + [2]\n", "", id="지원하지 않는 피연산자"),
+        pytest.param("a = b\n", "", id="정의되지 않은 변수"),
+        pytest.param("for i in range(2000):\n    print(i)\n", "", id="최대 단계 초과"),
+    ],
+)
+def test_compiled_engine_interpreter와_같은_결과(visualize_with_engine, source_code, input_):
+    expected = visualize_with_engine("interpreter", source_code, input_)
+
+    assert visualize_with_engine("compiled", source_code, input_) == expected
+
+
+def test_attach_이후_travel은_node_분기_없이_closure_실행(mocker):
+    node = ast.parse("a + 1", mode="eval").body
+    ExprCompiler.attach(node)
+    elem_container = ElementContainer([], "main")
+    elem_container.add_element("a", 10)
+    mock_binop_travel = mocker.spy(ExprTraveler, "binop_travel")
+    mock_binop_parse = mocker.spy(BinopExpr, "parse")
+
+    result = ExprTraveler.travel(node, elem_container)
+
+    assert result.value == 11
+    mock_binop_travel.assert_not_called()
+    mock_binop_parse.assert_called_once()
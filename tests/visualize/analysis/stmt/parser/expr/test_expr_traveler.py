@@ -0,0 +1,18 @@
+import ast
+
+import pytest
+
+from app.visualize.analysis.stmt.parser.expr import expr_traveler
+from app.visualize.analysis.stmt.parser.expr.expr_traveler import ExprTraveler
+
+
+def test_register_새로운_node_handler_등록(monkeypatch, elem_container):
+    monkeypatch.setattr(expr_traveler, "_EXPR_HANDLERS", dict(expr_traveler._EXPR_HANDLERS))
+    ExprTraveler.register(ast.Lambda, lambda node, container: "lambda handler")
+
+    assert ExprTraveler.travel(ast.parse("lambda: 1").body[0].value, elem_container) == "lambda handler"
+
+
+def test_travel_지원하지_않는_node(elem_container):
+    with pytest.raises(TypeError):
+        ExprTraveler.travel(ast.parse("lambda: 1").body[0].value, elem_container)
@@ -0,0 +1,38 @@
+import ast
+
+from app.visualize.analysis.stmt.parser.expr.expr_traveler import ExprTraveler
+from app.visualize.analysis.stmt.parser.expr.models.expr_obj import ConstantObj, NameObj
+from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
+from app.visualize.analysis.stmt.parser.expr.parser.constant_expr import ConstantExpr
+from app.visualize.analysis.stmt.parser.expr.parser.name_expr import NameExpr
+from app.visualize.analysis.stmt.parser.expr.static_expr import StaticExpr
+from app.visualize.container.element_container import ElementContainer
+
+
+def test_attach_상수와_할당_대상에만_분석_객체를_붙임():
+    tree = ast.parse("a = b + 'x'")
+    assign = tree.body[0]
+
+    StaticExpr.attach(tree)
+
+    assert StaticExpr.get(assign.targets[0]) == NameObj(value="a", expressions=("a",), type=ExprType.NAME)
+    assert StaticExpr.get(assign.value.right) == ConstantObj(value="x", expressions=("'x'",))
+    assert StaticExpr.get(assign.value.left) is None
+    assert StaticExpr.get(assign.value) is None
+
+
+def test_travel_붙여둔_분석_객체를_다시_만들지_않음(mocker):
+    tree = ast.parse("for i in range(3):\n    a = 10")
+    StaticExpr.attach(tree)
+    body_assign = tree.body[0].body[0]
+    mock_constant_parse = mocker.spy(ConstantExpr, "parse")
+    mock_name_parse = mocker.spy(NameExpr, "parse")
+    elem_container = ElementContainer([], "main")
+
+    results = [ExprTraveler.travel(body_assign.value, elem_container) for _ in range(3)]
+    targets = [ExprTraveler.travel(body_assign.targets[0], elem_container) for _ in range(3)]
+
+    assert all(result is results[0] for result in results)
+    assert all(target is targets[0] for target in targets)
+    mock_constant_parse.assert_not_called()
+    mock_name_parse.assert_not_called()
@@ -14,6 +14,7 @@ from app.visualize.analysis.stmt.parser.expr.models.expr_obj import (
     BinopObj,
 )
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
+from app.visualize.container.element_container import ElementContainer
 
 
 @pytest.mark.parametrize(
@@ -115,3 +116,26 @@ def test_change_node_to_expr_obj(elem_container, node):
     result = AssignStmt._change_node_to_expr_obj(node, elem_container)
 
     assert isinstance(result, ExprObj)
+
+
+def test_set_value_to_target_새로_만든_값은_첫_번째_변수만_그대로_저장():
+    elem_container = ElementContainer([], "main")
+    value = [1, 2]
+    expr_obj = ListObj(value=value, expressions=("[1, 2]",))
+
+    AssignStmt.set_value_to_target(("a", "b"), expr_obj, elem_container, is_new_value=True)
+
+    assert elem_container.get_element("a") is value
+    assert elem_container.get_element("b") == value
+    assert elem_container.get_element("b") is not value
+
+
+def test_set_value_to_target_다른_변수의_값은_복사():
+    elem_container = ElementContainer([], "main")
+    value = [1, 2]
+    expr_obj = NameObj(value=value, expressions=("c", "[1, 2]"), type=ExprType.LIST)
+
+    AssignStmt.set_value_to_target(("a",), expr_obj, elem_container)
+
+    assert elem_container.get_element("a") == value
+    assert elem_container.get_element("a") is not value
@@ -18,8 +18,12 @@ from app.visualize.analysis.stmt.parser.expr.models.expr_obj import CompareObj
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
 from app.visualize.analysis.stmt.parser.if_stmt import IfStmt
 from app.visualize.analysis.stmt.parser.while_stmt import WhileStmt
+from app.visualize.analysis.stmt import stmt_traveler
 from app.visualize.analysis.stmt.stmt_traveler import StmtTraveler
 from app.visualize.container.element_container import ElementContainer
+from app.visualize.container.step_budget import StepBudget
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
 
 
 @pytest.mark.parametrize(
@@ -439,3 +443,52 @@ def test__while_travel(mocker, create_ast, elem_container, while_code, condition
 
     assert mock_while_stmt.call_count == len(condition_objs)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        pytest.param("for i in range(100000):\n    a = i", id="for"),
+        pytest.param("a = 0\nwhile a < 100000:\n    a = a + 1", id="while"),
+    ],
+)
+def test_travel_budget_초과시_분석_중단(code):
+    elem_container = ElementContainer([], "main", step_budget=StepBudget(max_steps=100))
+
+    with pytest.raises(CodeVisualizeError):
+        StmtTraveler.travel(ast.parse(code).body, elem_container)
+
+    # 모든 반복을 끝까지 분석하지 않고 최대 개수를 넘는 즉시 중단
+    assert elem_container.get_element("a") < 100
+
+
+def test__while_travel_무한_루프_중단():
+    elem_container = ElementContainer([], "main", step_budget=StepBudget(max_while_cycles=10))
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        StmtTraveler._while_travel(ast.parse("while True:\n    pass").body[0], elem_container)
+
+    assert exc_info.value.error_enum is ErrorEnum.EXECUTION_TIMEOUT
+
+
+def test_travel_global_선언():
+    elem_container = ElementContainer([], "main")
+    elem_container.add_element("count", 0)
+    local_elem_container = elem_container.make_local_elem_container("inc", {})
+
+    stmt_objs = StmtTraveler.travel(ast.parse("global count\ncount = 1").body, local_elem_container)
+
+    assert len(stmt_objs) == 1
+    assert elem_container.get_element("count") == 1
+
+
+def test_register_새로운_node_handler_등록(monkeypatch, mocker, elem_container):
+    monkeypatch.setattr(stmt_traveler, "_STMT_HANDLERS", dict(stmt_traveler._STMT_HANDLERS))
+    expr_stmt_obj = ExprStmtObj(id=1, value="", expressions=("",), expr_type=ExprType.NAME, call_stack_name="main")
+    mock_handler = mocker.Mock(return_value=expr_stmt_obj)
+    StmtTraveler.register(ast.Delete, mock_handler)
+
+    stmt_objs = StmtTraveler.travel(ast.parse("del a").body, elem_container)
+
+    assert stmt_objs == [expr_stmt_obj]
+    mock_handler.assert_called_once()
@@ -0,0 +1,138 @@
+import pytest
+
+from app.visualize.analysis.stmt.parser.expr.models.subscript_target import SubscriptTarget
+from app.visualize.container.element_container import ElementContainer
+
+
+@pytest.fixture
+def global_container():
+    container = ElementContainer([], "main")
+    container.add_element("a", 1)
+    container.add_element("func", "details")
+    return container
+
+
+def test_make_local_elem_container_상위_scope_변수_조회(global_container):
+    local_container = global_container.make_local_elem_container("func", {"x": 10})
+
+    assert local_container.get_element("a") == 1
+    assert local_container.get_element("x") == 10
+    # 상위 scope의 변수를 복사하지 않음
+    assert local_container.get_element_dict() == {"x": 10}
+
+
+def test_add_element_local_변수가_전역_변수를_가림(global_container):
+    local_container = global_container.make_local_elem_container("func", {})
+    local_container.add_element("a", 5)
+
+    assert local_container.get_element("a") == 5
+    assert global_container.get_element("a") == 1
+
+
+def test_declare_global_전역_변수에_할당(global_container):
+    local_container = global_container.make_local_elem_container("func", {})
+    local_container.declare_global(["a", "b"])
+    local_container.add_element("a", 5)
+    local_container.add_element("b", 7)
+
+    assert global_container.get_element("a") == 5
+    assert global_container.get_element("b") == 7
+    assert local_container.get_element_dict() == {}
+
+
+def test_make_local_elem_container_호출한_scope의_변수는_보이지_않음(global_container):
+    caller_container = global_container.make_local_elem_container("func", {"caller_var": 3})
+    callee_container = caller_container.make_local_elem_container("func", {})
+
+    assert callee_container.get_element("caller_var") is None
+    assert callee_container.get_element("a") == 1
+
+
+def test_make_local_elem_container_함수가_정의된_scope_연결(global_container):
+    outer_container = global_container.make_local_elem_container("func", {"outer_var": 3})
+    outer_container.add_element("inner", "details")
+    inner_container = outer_container.make_local_elem_container("inner", {})
+
+    assert inner_container.get_element("outer_var") == 3
+
+
+def test_add_element_상위_scope_list_요소_변경(global_container):
+    global_container.add_element("arr", [1, 2, 3])
+    local_container = global_container.make_local_elem_container("func", {})
+    arr = local_container.get_element("arr")
+    local_container.add_element(SubscriptTarget(name="arr", root=arr, indices=(0,)), 9)
+
+    assert global_container.get_element("arr") == [9, 2, 3]
+
+
+def test_add_element_중첩된_list_요소_변경(global_container):
+    global_container.add_element("arr", [[1, 2], [3, 4]])
+    arr = global_container.get_element("arr")
+    global_container.add_element(SubscriptTarget(name="arr", root=arr, indices=(1, slice(0, 1))), [9])
+
+    assert global_container.get_element("arr") == [[1, 2], [9, 4]]
+
+
+def test_add_element_tuple_요소_변경_예외(global_container):
+    global_container.add_element("arr", (1, 2))
+
+    with pytest.raises(TypeError):
+        global_container.add_element(SubscriptTarget(name="arr", root=(1, 2), indices=(0,)), 9)
+
+
+def test_take_snapshot_값이_바뀌기_전까지_복사하지_않음(global_container):
+    arr = [1, 2]
+    snapshot = global_container.take_snapshot(arr)
+
+    assert snapshot.get_value() is arr
+
+    global_container.before_mutation(arr)
+    arr.append(3)
+
+    assert snapshot == [1, 2]
+    assert len(snapshot) == 2
+
+
+def test_take_snapshot_local_scope에서_값을_바꿔도_복사(global_container):
+    global_container.add_element("arr", [1, 2])
+    snapshot = global_container.take_snapshot(global_container.get_element("arr"))
+    local_container = global_container.make_local_elem_container("func", {})
+
+    arr = local_container.get_element("arr")
+    local_container.add_element(SubscriptTarget(name="arr", root=arr, indices=(0,)), 9)
+
+    assert snapshot == [1, 2]
+    assert global_container.get_element("arr") == [9, 2]
+
+
+def test_take_snapshot_list_dict가_아니면_그대로_반환(global_container):
+    assert global_container.take_snapshot(10) == 10
+    assert global_container.take_snapshot((1, 2)) == (1, 2)
+
+
+def test_get_element_repr_바뀌지_않은_값은_이전_문자열_사용(global_container):
+    arr = [1, 2]
+    value_repr = global_container.get_element_repr("arr", arr)
+
+    assert global_container.get_element_repr("arr", arr) is value_repr
+
+
+def test_get_element_repr_값이_바뀌면_다시_만듦(global_container):
+    arr = [1, 2]
+    global_container.get_element_repr("arr", arr)
+
+    global_container.before_mutation(arr)
+    arr.append(3)
+
+    assert global_container.get_element_repr("arr", arr) == "[1, 2, 3]"
+    assert global_container.get_element_repr("arr", [1]) == "[1]"
+
+
+def test_get_element_repr_중첩된_값의_요소가_바뀌면_다시_만듦(global_container):
+    arr = [[1], [2]]
+    global_container.get_element_repr("arr", arr)
+
+    global_container.before_mutation(arr[0])
+    arr[0].append(3)
+
+    assert global_container.get_element_repr("arr", arr) == "[[1, 3], [2]]"
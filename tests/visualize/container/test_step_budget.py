@@ -0,0 +1,84 @@
+import pytest
+
+from app.visualize.container.element_container import ElementContainer
+from app.visualize.container.step_budget import StepBudget
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+def test_consume_최대_개수_이하():
+    step_budget = StepBudget(max_steps=10)
+
+    step_budget.consume(4)
+    step_budget.consume(6)
+
+    assert step_budget.get_used_steps() == 10
+
+
+def test_consume_최대_개수_초과시_예외():
+    step_budget = StepBudget(max_steps=10)
+    step_budget.consume(10)
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        step_budget.consume(1)
+
+    assert exc_info.value.error_enum is ErrorEnum.VISUALIZE_TIMEOUT
+
+
+def test_refund():
+    step_budget = StepBudget(max_steps=10)
+    step_budget.consume(8)
+
+    step_budget.refund(3)
+
+    assert step_budget.get_used_steps() == 5
+
+
+def test_local_elem_container_budget_공유():
+    elem_container = ElementContainer([], "main", step_budget=StepBudget(max_steps=10))
+    local_elem_container = elem_container.make_local_elem_container("func", {})
+
+    elem_container.consume_steps(4)
+    local_elem_container.consume_steps(5)
+
+    assert local_elem_container.get_step_budget() is elem_container.get_step_budget()
+    assert elem_container.get_step_budget().get_used_steps() == 9
+
+
+def test_consume_while_cycle_최대_반복_횟수_초과시_예외():
+    step_budget = StepBudget(max_while_cycles=2)
+    step_budget.consume_while_cycle()
+    step_budget.consume_while_cycle()
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        step_budget.consume_while_cycle()
+
+    assert exc_info.value.error_enum is ErrorEnum.EXECUTION_TIMEOUT
+
+
+def test_check_deadline_제한_시간_초과시_예외():
+    step_budget = StepBudget(timeout_seconds=0)
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        step_budget.check_deadline()
+
+    assert exc_info.value.error_enum is ErrorEnum.EXECUTION_TIMEOUT
+
+
+def test_truncate_제한_초과시_예외_없이_처음_넘은_제한_기록():
+    step_budget = StepBudget(max_steps=10, timeout_seconds=0, truncate=True)
+
+    step_budget.consume(11)
+    step_budget.check_deadline()
+
+    assert step_budget.is_stopped()
+    assert step_budget.get_stop_reason() is ErrorEnum.VISUALIZE_TIMEOUT
+
+
+def test_truncate_처음_멈춘_위치만_기록():
+    step_budget = StepBudget(truncate=True)
+
+    step_budget.record_stop_lineno(3)
+    step_budget.record_stop_lineno(1)
+
+    assert step_budget.get_stop_lineno() == 3
@@ -0,0 +1,32 @@
+from app.visualize.continuation.session_store import SessionStore
+
+
+def test_put_get():
+    store = SessionStore(max_sessions=2, ttl_seconds=60)
+    session = object()
+
+    session_id = store.put(session)
+
+    assert store.get(session_id) is session
+    assert store.get("unknown") is None
+
+
+def test_put_최대_개수_초과시_오래_사용하지_않은_session_제거():
+    store = SessionStore(max_sessions=2, ttl_seconds=60)
+    first_id = store.put(object())
+    second_id = store.put(object())
+    store.get(first_id)
+
+    store.put(object())
+
+    assert store.get(first_id) is not None
+    assert store.get(second_id) is None
+    assert store.get_session_count() == 2
+
+
+def test_get_유효_시간이_지나면_제거():
+    store = SessionStore(max_sessions=2, ttl_seconds=0)
+    session_id = store.put(object())
+
+    assert store.get(session_id) is None
+    assert store.get_session_count() == 0
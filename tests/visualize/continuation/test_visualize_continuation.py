@@ -0,0 +1,52 @@
+import pytest
+
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.continuation.session_store import SessionStore
+from app.visualize.continuation.visualize_continuation import VisualizeContinuation
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+@pytest.fixture
+def session_store(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_VIZ_STEPS", 5)
+    return SessionStore(max_sessions=4, ttl_seconds=60)
+
+
+def test_start_한_page_안에_끝나면_token_없음(session_store):
+    result = VisualizeContinuation.start(RequestCode("a = 1", ""), session_store)
+
+    assert "continuation_token" not in result
+    assert session_store.get_session_count() == 0
+
+
+def test_resume_token으로_다음_page_반환(session_store):
+    first = VisualizeContinuation.start(RequestCode("for i in range(5):\n    print(i)\n", ""), session_store)
+    second = VisualizeContinuation.resume(first["continuation_token"], session_store)
+
+    assert first["truncated"] is True
+    assert len(second["code"]) == 5
+    assert second["continuation_token"] != first["continuation_token"]
+    # 응답을 받지 못해 같은 token으로 다시 요청
+    assert VisualizeContinuation.resume(first["continuation_token"], session_store) == second
+
+
+@pytest.mark.parametrize("continuation_token", ["unknown.1", "unknown", ""])
+def test_resume_없는_session이면_예외(session_store, continuation_token):
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        VisualizeContinuation.resume(continuation_token, session_store)
+
+    assert exc_info.value.error_enum is ErrorEnum.CONTINUATION_EXPIRED
+
+
+def test_resume_학생_코드_예외시_session_제거(session_store):
+    first = VisualizeContinuation.start(
+        RequestCode("for i in range(5):\n    print(i)\nprint(1 / 0)\n", ""), session_store
+    )
+
+    with pytest.raises(Exception):
+        while "continuation_token" in first:
+            first = VisualizeContinuation.resume(first["continuation_token"], session_store)
+
+    assert session_store.get_session_count() == 0
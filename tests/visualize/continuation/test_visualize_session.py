@@ -0,0 +1,45 @@
+from fastapi.encoders import jsonable_encoder
+
+from app.models.request_code import RequestCode
+from app.visualize.code_visualizer import CodeVisualizer
+from app.visualize.continuation.visualize_session import VisualizeSession
+from app.web.exception.error_enum import ErrorEnum
+
+SOURCE_CODE = "a = 0\nfor i in range(3):\n    a = a + i\nprint(a)\n"
+
+
+def test_fetch_page를_이어_붙이면_전체_결과와_동일():
+    session = VisualizeSession(RequestCode(SOURCE_CODE, ""), page_size=4, max_pages=10)
+    code = []
+
+    while True:
+        result = session.fetch(session.get_page())
+        code.extend(result["code"])
+
+        if not session.has_next_page():
+            break
+        assert result == {"code": result["code"], "truncated": True}
+        assert len(result["code"]) == 4
+
+    assert jsonable_encoder(code) == jsonable_encoder(CodeVisualizer(RequestCode(SOURCE_CODE, "")).visualize_code())
+
+
+def test_fetch_같은_page_다시_요청시_마지막_결과_반환():
+    session = VisualizeSession(RequestCode(SOURCE_CODE, ""), page_size=4, max_pages=10)
+    first = session.fetch(0)
+
+    assert session.fetch(0) is first
+    assert session.fetch(2) is None
+    assert session.fetch(1) != first
+
+
+def test_fetch_모든_page의_합을_넘으면_멈춘_이유와_위치_반환():
+    session = VisualizeSession(RequestCode("for i in range(100):\n    print(i)\n", ""), page_size=4, max_pages=2)
+
+    session.fetch(0)
+    result = session.fetch(1)
+
+    assert not session.has_next_page()
+    assert len(result["code"]) == 4
+    assert result["reason"] == ErrorEnum.VISUALIZE_TIMEOUT.to_dict()
+    assert result["position"] == {"line": 1}
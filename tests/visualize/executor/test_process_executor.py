@@ -0,0 +1,92 @@
+import pytest
+
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.executor.inline_executor import InlineExecutor
+from app.visualize.executor.process_executor import ProcessExecutor, _unpack_result
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+@pytest.fixture(scope="module")
+def process_executor():
+    executor = ProcessExecutor(
+        worker_count=1, job_timeout_seconds=1, memory_limit_bytes=512 * 1024 * 1024, cpu_limit_seconds=5
+    )
+    yield executor
+    executor.shutdown()
+
+
+def test_run_inline_결과와_동일(process_executor):
+    request_code = RequestCode("a = 10\nfor i in range(3):\n    print(a + i)", "")
+
+    assert process_executor.run(request_code) == InlineExecutor().run(request_code)
+
+
+@pytest.mark.parametrize(
+    "source_code, error_enum",
+    [
+        pytest.param("a = sum(range(10 ** 9))", ErrorEnum.EXECUTION_TIMEOUT, id="제한 시간 초과"),
+        pytest.param(
+            "a = []\nb = [0]\nfor i in range(100):\n    a.append(b * 10 ** 6)",
+            ErrorEnum.MEMORY_LIMIT_EXCEEDED,
+            id="메모리 제한 초과",
+        ),
+        pytest.param("a = 3 ** 10 ** 8", ErrorEnum.OPERATION_TOO_LARGE, id="연산 결과 크기 초과"),
+        pytest.param("for i in range(2000):\n    print(i)", ErrorEnum.VISUALIZE_TIMEOUT, id="시각화 단계 초과"),
+    ],
+)
+def test_run_리소스_제한(process_executor, source_code, error_enum):
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        process_executor.run(RequestCode(source_code, ""))
+
+    assert exc_info.value.error_enum is error_enum
+    # 실패한 뒤에도 worker가 정상적으로 다음 작업을 처리
+    assert process_executor.run(RequestCode("a = 1", ""))
+
+
+@pytest.mark.parametrize(
+    "status, payload, expected_error",
+    [
+        pytest.param("visualize_error", ("VISUALIZE_TIMEOUT", {}), CodeVisualizeError, id="CodeVisualizeError"),
+        pytest.param("not_implemented", ("not supported",), NotImplementedError, id="NotImplementedError"),
+        pytest.param("error", "TypeError: wrong type", RuntimeError, id="그 외 예외"),
+    ],
+)
+def test__unpack_result_예외_변환(status, payload, expected_error):
+    with pytest.raises(expected_error):
+        _unpack_result(status, payload)
+
+
+def test_stream_inline_결과와_동일(process_executor):
+    request_code = RequestCode("a = [1, 2]\nfor i in a:\n    print(i)", "")
+
+    assert list(process_executor.stream(request_code)) == list(InlineExecutor().stream(request_code))
+
+
+def test_stream_중간에_닫아도_다음_작업_처리(process_executor):
+    steps = process_executor.stream(RequestCode("for i in range(100):\n    print(i)", ""))
+    next(steps)
+    steps.close()
+
+    assert process_executor.run(RequestCode("a = 1", "")) == InlineExecutor().run(RequestCode("a = 1", ""))
+
+
+def test_stream_리소스_제한(process_executor):
+    steps = process_executor.stream(RequestCode("a = 1\nb = sum(range(10 ** 9))", ""))
+
+    # native는 코드 전체를 실행한 뒤에 시각화 단계를 만들므로 첫 단계도 받을 수 없음
+    if settings.ANALYSIS_ENGINE != "native":
+        assert next(steps)
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        list(steps)
+
+    assert exc_info.value.error_enum is ErrorEnum.EXECUTION_TIMEOUT
+
+
+def test_resume_session을_보관한_worker가_없으면_예외(process_executor):
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        process_executor.resume("unknown.session.1")
+
+    assert exc_info.value.error_enum is ErrorEnum.CONTINUATION_EXPIRED
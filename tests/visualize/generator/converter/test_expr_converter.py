@@ -62,3 +62,20 @@ def test_print_convert(mocker, create_print, value, expressions, expected):
     result = ExprConverter._convert_to_print_viz(print_obj, VisualizationManager(), 1, 1)
 
     assert result == expected
+
+
+def test_convert_to_expr_viz_문자열을_평가하지_않고_value_type_사용(mocker):
+    expr_stmt_obj = ExprStmtObj(
+        id=1,
+        value="__import__('os')",
+        expressions=("a", "__import__('os')"),
+        expr_type=ExprType.VARIABLE,
+        call_stack_name="main",
+    )
+    mock_eval = mocker.patch("builtins.eval")
+    mocker.patch.object(VisualizationManager, "get_code_by_idx", return_value="a")
+
+    result = ExprConverter._convert_to_expr_viz(expr_stmt_obj, VisualizationManager(), 1, 1)
+
+    mock_eval.assert_not_called()
+    assert [viz.type for viz in result] == ["variable", "variable"]
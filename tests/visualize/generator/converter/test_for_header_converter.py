@@ -11,6 +11,8 @@ from app.visualize.generator.models.for_viz import ForConditionViz
     [
         pytest.param([0, 1, 2, 3], ForConditionViz(target="mock", cur="0", start="0", end="3", step="1")),
         pytest.param(["A", "BB", "CCC"], ForConditionViz(target="mock", cur="A", start="A", end="CCC", step="1")),
+        pytest.param({"a": 1, "b": 2}, ForConditionViz(target="mock", cur="a", start="a", end="b", step="1")),
+        pytest.param(range(2, 10, 3), ForConditionViz(target="mock", cur="2", start="2", end="8", step="1")),
     ],
 )
 def test__get_name_condition(iter_value, expected):
@@ -0,0 +1,28 @@
+import pytest
+
+from app.visualize.generator.models.for_viz import ForConditionViz
+
+
+@pytest.mark.parametrize(
+    "condition, expected",
+    [
+        pytest.param(
+            ForConditionViz(target="i", cur="0", start="0", end="3", step="1"),
+            ["target", "cur", "start", "end", "step"],
+            id="첫 반복: 모든 속성 변경",
+        ),
+        pytest.param(
+            ForConditionViz(target="i", cur="1", start="0", end="3", step="1"),
+            ["cur"],
+            id="이후 반복: cur만 변경",
+        ),
+    ],
+)
+def test_changed_attr(condition: ForConditionViz, expected):
+    assert condition.changed_attr() == expected
+
+
+def test_slots_사용으로_dict가_없음():
+    condition = ForConditionViz(target="i", cur="0", start="0", end="3", step="1")
+
+    assert not hasattr(condition, "__dict__")
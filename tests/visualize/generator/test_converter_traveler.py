@@ -2,14 +2,17 @@ from unittest.mock import patch
 
 import pytest
 
+from app import settings
 from app.visualize.analysis.stmt.models.expr_stmt_obj import ExprStmtObj
 from app.visualize.analysis.stmt.models.flow_control_obj import PassStmtObj
 from app.visualize.analysis.stmt.models.if_stmt_obj import IfConditionObj, IfStmtObj, ElifConditionObj
 from app.visualize.analysis.stmt.parser.expr.models.expr_type import ExprType
+from app.visualize.generator.converter.expr_converter import ExprConverter
 from app.visualize.generator.converter.flow_control_converter import FlowControlConverter
 from app.visualize.generator.converter.if_converter import IfConverter
 from app.visualize.generator.converter_traveler import ConverterTraveler
 from app.visualize.generator.visualization_manager import VisualizationManager
+from app.web.exception.code_visualize_error import CodeVisualizeError
 
 
 @pytest.fixture
@@ -38,7 +41,7 @@ def test__if_convert(mocker, get_if_stmt_obj, mock_viz_manager_with_custom_depth
     mock_get_if_body_viz_list = mocker.patch.object(ConverterTraveler, "_get_if_body_viz_list")
     mock_viz_manager = mock_viz_manager_with_custom_depth(1)
 
-    ConverterTraveler._if_convert(if_stmt_obj, mock_viz_manager)
+    list(ConverterTraveler._if_convert(if_stmt_obj, mock_viz_manager))
 
     # 함수들이 호출 되었는지 확인
     mock_get_header_define_viz.assert_called_once_with(if_stmt_obj.conditions, mock_viz_manager)
@@ -49,12 +52,12 @@ def test__if_convert(mocker, get_if_stmt_obj, mock_viz_manager_with_custom_depth
 def test__get_if_body_viz_list(mocker, get_if_stmt_obj):
     if_stmt_obj = get_if_stmt_obj()
 
-    mock_travel = mocker.patch.object(ConverterTraveler, "travel")
+    mock_travel = mocker.patch.object(ConverterTraveler, "iter_travel", return_value=iter(()))
     viz_manager = VisualizationManager()
 
-    ConverterTraveler._get_if_body_viz_list(if_stmt_obj.body_steps, viz_manager)
+    list(ConverterTraveler._get_if_body_viz_list(if_stmt_obj.body_steps, viz_manager))
 
-    # travel 함수가 호출 되었는지 확인
+    # iter_travel 함수가 호출 되었는지 확인
     mock_travel.assert_called_once_with(if_stmt_obj.body_steps, viz_manager)
 
 
@@ -66,3 +69,18 @@ def test__convert_to_flow_control_viz_pass_호출(mock_viz_manager_with_custom_d
         ConverterTraveler._convert_to_flow_control_viz(node, mock_viz_manager)
 
         mock_convert_to_pass.assert_called_once_with(node, mock_viz_manager)
+
+
+def test_travel_최대_단계_초과시_중단(mocker, monkeypatch, mock_viz_manager_with_custom_depth):
+    monkeypatch.setattr(settings, "MAX_VIZ_STEPS", 1)
+    mock_convert = mocker.patch.object(ExprConverter, "convert", return_value=["viz"])
+    expr_stmt_objs = [
+        ExprStmtObj(id=i, value="", expressions=("1",), expr_type=ExprType.PRINT, call_stack_name="main")
+        for i in range(5)
+    ]
+
+    with pytest.raises(CodeVisualizeError):
+        ConverterTraveler.travel(expr_stmt_objs, mock_viz_manager_with_custom_depth(1))
+
+    # 최대 개수를 넘은 뒤의 stmt는 변환하지 않음
+    assert mock_convert.call_count == 2
@@ -0,0 +1,152 @@
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app import settings
+from app.models.request_code import RequestCode
+from app.visualize.code_visualizer import CodeVisualizer
+from app.web.exception.code_visualize_error import CodeVisualizeError
+from app.web.exception.error_enum import ErrorEnum
+
+
+@pytest.fixture
+def truncate_mode(monkeypatch):
+    monkeypatch.setattr(settings, "TRUNCATE_AT_MAX_STEPS", True)
+
+
+@pytest.mark.parametrize("engine", ["interpreter", "compiled", "native"])
+@pytest.mark.parametrize(
+    "source_code, error_enum, line",
+    [
+        pytest.param("a = 0\nfor i in range(2000):\n    a = a + i\n", ErrorEnum.VISUALIZE_TIMEOUT, 2, id="for"),
+        pytest.param("a = 0\nwhile True:\n    a = a + 1\n", ErrorEnum.VISUALIZE_TIMEOUT, 2, id="while"),
+        pytest.param(
+            "def f(x):\n    for i in range(600):\n        x = x + i\n    return x\n\ny = f(1)\nprint(y)\n",
+            ErrorEnum.VISUALIZE_TIMEOUT,
+            2,
+            id="함수 호출",
+        ),
+    ],
+)
+def test_visualize_result_제한까지_자른_결과(monkeypatch, truncate_mode, engine, source_code, error_enum, line):
+    monkeypatch.setattr(settings, "ANALYSIS_ENGINE", engine)
+
+    result = jsonable_encoder(CodeVisualizer(RequestCode(source_code, "")).visualize_result())
+
+    assert len(result["code"]) == settings.MAX_VIZ_STEPS
+    assert result["truncated"] is True
+    assert result["reason"] == error_enum.to_dict()
+    assert result["position"] == {"line": line}
+
+
+def test_visualize_result_제한_안에_끝나면_자르지_않음(truncate_mode):
+    request_code = RequestCode("a = 1\nfor i in range(3):\n    print(a + i)\n", "")
+
+    result = CodeVisualizer(request_code).visualize_result()
+
+    assert result.keys() == {"code"}
+
+
+def test_visualize_result_자르지_않으면_예외(monkeypatch):
+    monkeypatch.setattr(settings, "TRUNCATE_AT_MAX_STEPS", False)
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        CodeVisualizer(RequestCode("for i in range(2000):\n    print(i)\n", "")).visualize_result()
+
+    assert exc_info.value.error_enum is ErrorEnum.VISUALIZE_TIMEOUT
+
+
+def test_iter_visualize_code_제한까지_반환_후_멈춘_위치_전달(truncate_mode):
+    viz_steps = []
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        for viz in CodeVisualizer(RequestCode("for i in range(2000):\n    print(i)\n", "")).iter_visualize_code():
+            viz_steps.append(viz)
+
+    assert len(viz_steps) == settings.MAX_VIZ_STEPS
+    assert exc_info.value.error_enum is ErrorEnum.VISUALIZE_TIMEOUT
+    assert exc_info.value.result["position"] == {"line": 1}
+
+
+@pytest.mark.parametrize("engine", ["interpreter", "compiled", "native"])
+def test_visualize_result_중첩된_subscript_할당(monkeypatch, engine):
+    monkeypatch.setattr(settings, "ANALYSIS_ENGINE", engine)
+    request_code = RequestCode("a = [[1, 2], [3, 4]]\nfor i in range(2):\n    a[i][0] = 9\nprint(a)\n", "")
+
+    result = jsonable_encoder(CodeVisualizer(request_code).visualize_result())
+
+    assign_variables = [step["variables"][0] for step in result["code"] if step["type"] == "assign"]
+    assert [(variable["expr"], variable["idx"]) for variable in assign_variables[1:]] == [
+        ("[9, 2]", {"start": 0, "end": 0}),
+        ("[9, 4]", {"start": 1, "end": 1}),
+    ]
+    assert result["code"][-1]["console"] == "[[9, 2], [9, 4]]\n"
+
+
+@pytest.mark.parametrize("engine", ["interpreter", "compiled", "native"])
+def test_visualize_result_이후에_바뀐_list가_이전_단계에_반영되지_않음(monkeypatch, engine):
+    monkeypatch.setattr(settings, "ANALYSIS_ENGINE", engine)
+    request_code = RequestCode("a = [1, 2]\nfor i in range(2):\n    b = a\n    a.append(i)\n", "")
+
+    result = jsonable_encoder(CodeVisualizer(request_code).visualize_result())
+
+    b_variables = [variable for step in result["code"] if step["type"] == "assign" for variable in step["variables"]][
+        1:
+    ]
+    assert [(variable["expr"], variable["idx"]) for variable in b_variables] == [
+        ("[1, 2]", {"start": 0, "end": 1}),
+        ("[1, 2, 0]", {"start": 0, "end": 2}),
+    ]
+
+
+@pytest.mark.parametrize("engine", ["interpreter", "compiled", "native"])
+def test_visualize_result_결과가_너무_큰_연산은_거절(monkeypatch, engine):
+    monkeypatch.setattr(settings, "ANALYSIS_ENGINE", engine)
+    monkeypatch.setattr(settings, "MAX_INT_RESULT_BITS", 64)
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        CodeVisualizer(RequestCode("a = 2\nb = a ** 100\nprint(b)\n", "")).visualize_result()
+
+    assert exc_info.value.error_enum is ErrorEnum.OPERATION_TOO_LARGE
+
+
+@pytest.mark.parametrize("engine", ["interpreter", "compiled", "native"])
+def test_visualize_result_dict를_반복(monkeypatch, engine):
+    monkeypatch.setattr(settings, "ANALYSIS_ENGINE", engine)
+    request_code = RequestCode("d = {'a': 1, 'b': 2}\nfor k in d:\n    print(k)\n", "")
+
+    result = jsonable_encoder(CodeVisualizer(request_code).visualize_result())
+
+    for_steps = [step for step in result["code"] if step["type"] == "for"]
+    assert (for_steps[0]["condition"]["start"], for_steps[0]["condition"]["end"]) == ("a", "b")
+    assert [step["console"] for step in result["code"] if step["type"] == "print" and step["console"]] == ["a\n", "b\n"]
+
+
+@pytest.mark.parametrize("engine", ["interpreter", "compiled", "native"])
+def test_visualize_result_range를_값으로_사용(monkeypatch, engine):
+    monkeypatch.setattr(settings, "ANALYSIS_ENGINE", engine)
+    request_code = RequestCode("a = list(range(3))\nprint(a)\nprint(range(1, 3))\n", "")
+
+    result = jsonable_encoder(CodeVisualizer(request_code).visualize_result())
+
+    consoles = [step["console"] for step in result["code"] if step["type"] == "print" and step["console"]]
+    assert consoles == ["[0, 1, 2]\n", "range(1, 3)\n"]
+
+
+@pytest.mark.parametrize("engine", ["interpreter", "compiled", "native"])
+def test_visualize_result_요소가_너무_많은_range는_list로_만들지_않음(monkeypatch, engine):
+    monkeypatch.setattr(settings, "ANALYSIS_ENGINE", engine)
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        CodeVisualizer(RequestCode("a = list(range(10 ** 8))\nprint(a)\n", "")).visualize_result()
+
+    assert exc_info.value.error_enum is ErrorEnum.OPERATION_TOO_LARGE
+
+
+@pytest.mark.parametrize("engine", ["interpreter", "compiled", "native"])
+def test_visualize_result_문자열로_바꿀_수_없는_정수는_만들지_않음(monkeypatch, engine):
+    monkeypatch.setattr(settings, "ANALYSIS_ENGINE", engine)
+
+    with pytest.raises(CodeVisualizeError) as exc_info:
+        CodeVisualizer(RequestCode("x = 2 ** 20000\nprint(x)\n", "")).visualize_result()
+
+    assert exc_info.value.error_enum is ErrorEnum.OPERATION_TOO_LARGE
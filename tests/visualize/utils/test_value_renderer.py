@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from app import settings
+from app.visualize.utils.value_renderer import ValueRenderer
+
+
+@pytest.fixture
+def small_budget(monkeypatch):
+    monkeypatch.setattr(settings, "RENDER_MAX_ELEMENTS", 3)
+    monkeypatch.setattr(settings, "RENDER_MAX_LENGTH", 10)
+    monkeypatch.setattr(settings, "RENDER_MAX_DEPTH", 2)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(10, id="int"),
+        pytest.param("abc", id="str"),
+        pytest.param([1, "a", [2, (3,)], {"k": None}], id="중첩된 list"),
+        pytest.param((1,), id="요소가 하나인 tuple"),
+        pytest.param({1, 2}, id="set"),
+        pytest.param(set(), id="빈 set"),
+        pytest.param({"a": [1, 2], "b": (1, 2)}, id="dict"),
+        pytest.param([True, None, 1.5, "안녕"], id="기타 값"),
+    ],
+)
+def test_제한_안의_값은_str_repr과_같음(value):
+    assert ValueRenderer.render(value) == str(value)
+    assert ValueRenderer.render_repr(value) == repr(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param({"a": [1, 2], "b": (1, 2)}, id="dict"),
+        pytest.param({1: "x", "y": None, "z": True}, id="문자열이 아닌 key"),
+        pytest.param({"k": "안녕"}, id="ascii가 아닌 문자열"),
+    ],
+)
+def test_render_json_제한_안의_값은_json_dumps와_같음(value):
+    assert ValueRenderer.render_json(value) == json.dumps(value)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        pytest.param([1, 2, 3, 4, 5], "[1, 2, 3, ...]", id="요소 개수"),
+        pytest.param("abcdefghijkl", "abcdefghij...", id="문자열 길이"),
+        pytest.param(["abcdefghijkl"], "['abcdefghij...']", id="list 안의 문자열 길이"),
+        pytest.param([[[1]]], "[[[...]]]", id="중첩 깊이"),
+        pytest.param(["abcdefghij", "k", "l"], "['abcdefghij', ...]", id="전체 길이"),
+        pytest.param(10**20, "...(21 digits)", id="큰 정수"),
+    ],
+)
+def test_render_제한을_넘으면_생략(small_budget, value, expected):
+    assert ValueRenderer.render(value) == expected
+
+
+def test_render_json_제한을_넘으면_생략(small_budget):
+    assert ValueRenderer.render_json({"a": 1, "b": 2, "c": 3, "d": 4}) == '{"a": 1, "b": 2, "c": 3, ...}'
+
+
+def test_join_제한을_넘으면_생략(small_budget):
+    assert ValueRenderer.join(("1", "2", "3", "4")) == "1, 2, 3, ..."
+    assert ValueRenderer.join(("a + 100", "b + 200")) == "a + 100, b..."
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.web.admission_controller import AdmissionController
+from app.web.exception.server_busy_error import ServerBusyError
+
+
+def create_admission_controller(max_concurrency=1, max_queue_size=1, queue_timeout_seconds=1):
+    return AdmissionController(
+        max_concurrency=max_concurrency,
+        max_queue_size=max_queue_size,
+        queue_timeout_seconds=queue_timeout_seconds,
+        retry_after_seconds=2,
+    )
+
+
+def test_run_결과_반환():
+    controller = create_admission_controller()
+
+    assert asyncio.run(controller.run(sum, [1, 2, 3])) == 6
+    assert controller.get_stats()["running"] == 0
+
+
+def test_run_대기열_가득_차면_즉시_거절():
+    controller = create_admission_controller(max_concurrency=1, max_queue_size=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.create_task(controller.run(release.wait))
+        queued = asyncio.create_task(controller.run(release.wait))
+        await asyncio.sleep(0.05)
+        stats = controller.get_stats()
+
+        with pytest.raises(ServerBusyError) as exc_info:
+            await controller.run(release.wait)
+
+        release.set()
+        await asyncio.gather(running, queued)
+        return stats, exc_info.value
+
+    stats, error = asyncio.run(scenario())
+
+    assert (stats["running"], stats["queue_depth"]) == (1, 1)
+    assert error.retry_after_seconds == 2
+    assert error.result == {"queue_depth": 1}
+    assert controller.get_stats()["rejected"] == 1
+
+
+def test_run_대기_시간_초과시_거절():
+    controller = create_admission_controller(max_concurrency=1, max_queue_size=1, queue_timeout_seconds=0.05)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.create_task(controller.run(release.wait))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ServerBusyError):
+            await controller.run(release.wait)
+
+        release.set()
+        await running
+
+    asyncio.run(scenario())
+
+    assert controller.get_stats()["queue_depth"] == 0
+
+
+def test_stream_결과를_순서대로_반환():
+    controller = create_admission_controller()
+
+    async def scenario():
+        return [item async for item in controller.stream(lambda items: (item for item in items), [1, 2, 3])]
+
+    assert asyncio.run(scenario()) == [1, 2, 3]
+    assert controller.get_stats()["running"] == 0
+
+
+def test_stream_중간에_닫으면_generator도_닫음():
+    controller = create_admission_controller()
+    closed = threading.Event()
+
+    def steps():
+        try:
+            yield from range(10)
+        finally:
+            closed.set()
+
+    async def scenario():
+        stream = controller.stream(steps)
+        await anext(stream)
+        await stream.aclose()
+
+    asyncio.run(scenario())
+
+    assert closed.wait(timeout=1)
+    assert controller.get_stats()["running"] == 0
@@ -0,0 +1,64 @@
+import pytest
+
+from app.models.request_code import RequestCode
+from app.web.result_cache import ResultCache
+
+
+@pytest.mark.parametrize(
+    "request_code1, request_code2, expected",
+    [
+        pytest.param(RequestCode("print(1)", ""), RequestCode("print(1)", ""), True, id="같은 코드와 입력"),
+        pytest.param(RequestCode("print(1)", "a"), RequestCode("print(1)", "b"), False, id="다른 입력"),
+        pytest.param(RequestCode("a\nb", ""), RequestCode("a", "b"), False, id="코드와 입력 경계"),
+    ],
+)
+def test_make_key(request_code1, request_code2, expected):
+    assert (ResultCache.make_key(request_code1) == ResultCache.make_key(request_code2)) is expected
+
+
+def test_get_put():
+    cache = ResultCache(max_bytes=100, ttl_seconds=60)
+
+    assert cache.get("a") is None
+    cache.put("a", b"result")
+
+    assert cache.get("a") == b"result"
+    assert cache.get_stats() == {
+        "entries": 1,
+        "used_bytes": 6,
+        "max_bytes": 100,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 0,
+    }
+
+
+def test_put_최대_크기_초과시_오래된_결과_제거():
+    cache = ResultCache(max_bytes=10, ttl_seconds=60)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    cache.get("a")
+    cache.put("c", b"1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_put_캐시보다_큰_결과는_저장하지_않음():
+    cache = ResultCache(max_bytes=4, ttl_seconds=60)
+    cache.put("a", b"12345")
+
+    assert cache.get("a") is None
+    assert cache.get_stats()["used_bytes"] == 0
+
+
+def test_get_유효_시간_지난_결과_제거():
+    cache = ResultCache(max_bytes=100, ttl_seconds=-1)
+    cache.put("a", b"result")
+
+    assert cache.get("a") is None
+    assert cache.get_stats()["expirations"] == 1
+    assert cache.get_stats()["used_bytes"] == 0
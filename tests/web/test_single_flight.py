@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from app.web.single_flight import SingleFlight
+
+
+def test_run_같은_key_요청은_한번만_실행():
+    single_flight = SingleFlight()
+    call_count = 0
+
+    async def visualize(value):
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.01)
+        return value
+
+    async def scenario():
+        return await asyncio.gather(*(single_flight.run("key", visualize, "result") for _ in range(5)))
+
+    assert asyncio.run(scenario()) == ["result"] * 5
+    assert call_count == 1
+    assert single_flight.get_stats() == {"in_flight": 0, "coalesced": 4}
+
+
+def test_run_예외도_함께_전달():
+    single_flight = SingleFlight()
+
+    async def visualize():
+        await asyncio.sleep(0.01)
+        raise ValueError("error")
+
+    async def scenario():
+        return await asyncio.gather(*(single_flight.run("key", visualize) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_run_다른_key_요청은_각각_실행():
+    single_flight = SingleFlight()
+
+    async def visualize(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    async def scenario():
+        return await asyncio.gather(single_flight.run("a", visualize, 1), single_flight.run("b", visualize, 2))
+
+    assert asyncio.run(scenario()) == [1, 2]
+    assert single_flight.get_stats()["coalesced"] == 0
+
+
+def test_run_먼저_온_요청이_취소되어도_나머지_요청은_결과를_받음():
+    single_flight = SingleFlight()
+
+    async def visualize():
+        await asyncio.sleep(0.02)
+        return "result"
+
+    async def scenario():
+        first = asyncio.create_task(single_flight.run("key", visualize))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(single_flight.run("key", visualize))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "result"